@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Markdown Parser Benchmark
+Measures lines per second of AIBackBookGenerator._parse_markdown on a
+synthetic markdown corpus, before and after the precompiled line classifier,
+and the throughput of the inline markdown converter over the AI guide.
+Published by ALAM-ACADEMY
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import book_nodes
+import inline_markdown
+from generate_pdf_reportlab import AIBackBookGenerator
+
+
+GUIDE_PATH = Path(__file__).parent / 'AI_Comprehensive_Guide.md'
+
+
+SAMPLE_BLOCKS = [
+    "# CHAPTER {n}: INTRODUCTION TO ARTIFICIAL INTELLIGENCE\n",
+    "## {n}.1 What is Artificial Intelligence?\n",
+    "### Key Characteristics\n",
+    "#### Learning Paradigms\n",
+    "**Definition {n}**\n",
+    "**Narrow AI:** Systems designed for specific tasks within a limited domain.\n",
+    "Artificial Intelligence is a branch of computer science that aims to create\n"
+    "intelligent machines capable of performing tasks that typically require\n"
+    "human intelligence, including learning, reasoning and perception.\n",
+    "Machine learning systems improve with experience. Supervised learning uses\n"
+    "labelled examples, unsupervised learning finds structure in unlabelled data\n"
+    "and reinforcement learning learns from rewards received while interacting\n"
+    "with an environment. Each paradigm suits different problems, and modern\n"
+    "systems frequently combine them, for example by pre-training on unlabelled\n"
+    "text before fine-tuning on a smaller labelled dataset.\n",
+    "- **Students** beginning their journey in AI\n"
+    "- **Professionals** looking to transition into AI careers\n"
+    "- **Researchers** seeking a comprehensive reference\n",
+    "```python\n"
+    "def train(model, data):\n"
+    "    # Fit the model on the training split\n"
+    "    return model.fit(data)\n"
+    "```\n",
+    "---\n",
+]
+
+
+def write_corpus(path: Path, size_mb: float) -> int:
+    """Write a synthetic markdown corpus of roughly ``size_mb`` megabytes."""
+    target = int(size_mb * 1024 * 1024)
+    written = 0
+    lines = 0
+    n = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        while written < target:
+            n += 1
+            for block in SAMPLE_BLOCKS:
+                chunk = block.format(n=n) + "\n"
+                f.write(chunk)
+                written += len(chunk)
+                lines += chunk.count('\n')
+    return lines
+
+
+def legacy_parse_markdown(source):
+    """The paragraph loop as it was before the line classifier.
+
+    It emits the same book_nodes as the current parser so that only the
+    line classification differs between the two timings.
+    """
+    lines = iter(source)
+    line = next(lines, None)
+
+    while line is not None:
+        stripped = line.strip()
+        if not stripped or stripped.startswith('## Title Page'):
+            line = next(lines, None)
+            continue
+        if stripped.startswith('# ') and not stripped.startswith('##'):
+            yield book_nodes.Heading(1, stripped[2:].strip())
+            line = next(lines, None)
+        elif stripped.startswith('## '):
+            yield book_nodes.Heading(2, stripped[3:].strip())
+            line = next(lines, None)
+        elif stripped.startswith('### '):
+            yield book_nodes.Heading(3, stripped[4:].strip())
+            line = next(lines, None)
+        elif stripped.startswith('#### '):
+            yield book_nodes.Heading(4, stripped[5:].strip())
+            line = next(lines, None)
+        elif stripped.startswith('**') and stripped.endswith('**'):
+            yield book_nodes.Paragraph(stripped[2:-2].strip(), book_nodes.BOLD)
+            line = next(lines, None)
+        elif stripped.startswith('- '):
+            list_items = []
+            while line is not None and line.strip().startswith('- '):
+                list_items.append(line.strip()[2:].strip())
+                line = next(lines, None)
+            yield book_nodes.ListBlock(list_items)
+        elif stripped.startswith('```'):
+            language = stripped[3:].strip()
+            code_lines = []
+            line = next(lines, None)
+            while line is not None and not line.strip().startswith('```'):
+                code_lines.append(line.rstrip('\r\n'))
+                line = next(lines, None)
+            yield book_nodes.CodeBlock('\n'.join(code_lines), language)
+            line = next(lines, None)
+        else:
+            para_lines = [stripped]
+            line = next(lines, None)
+            while line is not None and line.strip() and not any([
+                line.strip().startswith('#'),
+                line.strip().startswith('- '),
+                line.strip().startswith('**'),
+                line.strip().startswith('```'),
+            ]):
+                para_lines.append(line.strip())
+                line = next(lines, None)
+            yield book_nodes.Paragraph(' '.join(para_lines))
+
+
+def time_parser(parse, corpus_path: Path, line_count: int) -> dict:
+    """Stream the corpus through ``parse`` and return timing figures."""
+    start = time.perf_counter()
+    with open(corpus_path, 'r', encoding='utf-8') as f:
+        elements = sum(1 for _ in parse(f))
+    elapsed = time.perf_counter() - start
+    return {
+        'seconds': elapsed,
+        'elements': elements,
+        'lines_per_second': line_count / elapsed if elapsed else 0.0,
+    }
+
+
+def inline_fragments(generator, markdown_path: Path) -> list:
+    """Collect every text fragment the generator passes to the inline converter."""
+    fragments = []
+    with open(markdown_path, 'r', encoding='utf-8') as f:
+        for node in generator._parse_markdown(f):
+            if isinstance(node, book_nodes.ListBlock):
+                fragments.extend(node.items)
+            elif isinstance(node, (book_nodes.Heading, book_nodes.Paragraph)):
+                fragments.append(node.text)
+    return fragments
+
+
+def time_inline(fragments: list, passes: int) -> dict:
+    """Convert ``fragments`` ``passes`` times, uncached and with the memo."""
+    convert = inline_markdown.to_reportlab
+    total_chars = sum(len(fragment) for fragment in fragments) * passes
+    results = {}
+
+    start = time.perf_counter()
+    for _ in range(passes):
+        for fragment in fragments:
+            convert.__wrapped__(fragment)
+    results['uncached'] = time.perf_counter() - start
+
+    convert.cache_clear()
+    start = time.perf_counter()
+    for _ in range(passes):
+        for fragment in fragments:
+            convert(fragment)
+    results['memoized'] = time.perf_counter() - start
+    info = convert.cache_info()
+    results['hit_rate'] = info.hits / (info.hits + info.misses)
+
+    results['fragments'] = len(fragments) * passes
+    results['chars'] = total_chars
+    return results
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size-mb', type=float, default=50.0,
+                        help='size of the synthetic corpus in megabytes (default: 50)')
+    parser.add_argument('--inline-passes', type=int, default=200,
+                        help='passes over the AI guide for the inline benchmark (default: 200)')
+    args = parser.parse_args()
+
+    generator = AIBackBookGenerator(os.devnull)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_path = Path(tmp) / 'corpus.md'
+        print(f"Writing {args.size_mb:g} MB synthetic corpus...")
+        line_count = write_corpus(corpus_path, args.size_mb)
+
+        before = time_parser(legacy_parse_markdown, corpus_path, line_count)
+        after = time_parser(generator._parse_markdown, corpus_path, line_count)
+
+    print(f"\n{'='*60}")
+    print(f"Lines parsed: {line_count:,}")
+    print(f"{'='*60}")
+    for label, result in (('Before', before), ('After', after)):
+        print(f"{label:<8}{result['seconds']:>8.2f} s   "
+              f"{result['lines_per_second']:>14,.0f} lines/s   "
+              f"{result['elements']:,} elements")
+    print(f"Speedup: {before['seconds'] / after['seconds']:.2f}x")
+    print(f"{'='*60}")
+
+    fragments = inline_fragments(generator, GUIDE_PATH)
+    inline = time_inline(fragments, args.inline_passes)
+
+    print(f"\nInline conversion: {inline['fragments']:,} fragments "
+          f"({args.inline_passes} passes over {GUIDE_PATH.name})")
+    print(f"{'='*60}")
+    for label in ('uncached', 'memoized'):
+        seconds = inline[label]
+        print(f"{label.capitalize():<10}{seconds:>8.2f} s   "
+              f"{inline['fragments'] / seconds:>12,.0f} fragments/s   "
+              f"{inline['chars'] / seconds / 1e6:>7.1f} M chars/s")
+    print(f"Memo hit rate: {inline['hit_rate']:.1%}")
+    print(f"{'='*60}")
+
+
+if __name__ == '__main__':
+    main()
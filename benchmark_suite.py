@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Generator Benchmark Suite
+Times the markdown parser, the HTML conversion behind create_html_content
+and MicrowaveBook.create_chapter on synthetic corpora at 1x, 10x, 100x and
+1000x the size of AI_Comprehensive_Guide.md, recording wall time, lines
+per second and tracemalloc peak in a JSON file that can be compared
+across commits.
+Published by ALAM-ACADEMY
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import book_nodes
+import inline_markdown
+from benchmark_parser import write_corpus
+from book_parser import parse_markdown, read_lines
+from generate_pdf import create_html_content
+from generate_pdf_reportlab import AIBackBookGenerator
+from microwave_book_generator import MicrowaveBook
+
+
+BASE_PATH = Path(__file__).parent
+GUIDE_PATH = BASE_PATH / 'AI_Comprehensive_Guide.md'
+DEFAULT_SCALES = (1, 10, 100, 1000)
+DEFAULT_OUTPUT = BASE_PATH / 'benchmark_results.json'
+
+# Microwave chapter item for each node type; code listings become body text.
+_CHAPTER_ITEMS = {
+    book_nodes.Heading: lambda node: ('section' if node.level <= 2 else 'subsection', node.text),
+    book_nodes.Paragraph: lambda node: ('definition' if node.style is book_nodes.BOLD else 'body', node.text),
+    book_nodes.ListBlock: lambda node: ('list', node.items),
+    book_nodes.OrderedList: lambda node: ('list', node.items),
+    book_nodes.CodeBlock: lambda node: ('body', node.text),
+    book_nodes.Table: lambda node: ('body', ' | '.join(node.header)),
+    book_nodes.Rule: lambda node: ('spacer', 12),
+}
+
+
+def chapter_content(corpus_path: Path) -> list:
+    """Turn a markdown corpus into MicrowaveBook.create_chapter content tuples."""
+    nodes = parse_markdown(read_lines(corpus_path))
+    return [_CHAPTER_ITEMS[type(node)](node) for node in nodes]
+
+
+def measure(run) -> dict:
+    """Time ``run()`` untraced, then run it again under tracemalloc for its peak."""
+    gc.collect()
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'seconds': seconds, 'peak_bytes': peak}
+
+
+def bench_scale(scale: int, tmp: Path) -> list:
+    """Run every benchmark on a corpus ``scale`` times the size of the guide."""
+    size_mb = GUIDE_PATH.stat().st_size * scale / (1024 * 1024)
+    corpus_path = tmp / f"corpus_{scale}x.md"
+    line_count = write_corpus(corpus_path, size_mb)
+    corpus_bytes = corpus_path.stat().st_size
+
+    generator = AIBackBookGenerator(os.devnull, cache_dir=None)
+
+    def parse():
+        for _ in generator._parse_markdown(read_lines(corpus_path)):
+            pass
+
+    def html():
+        inline_markdown.to_html.cache_clear()
+        create_html_content(nodes=parse_markdown(corpus_path.read_text(encoding='utf-8')))
+
+    content = chapter_content(corpus_path)
+    book = MicrowaveBook(os.devnull)
+
+    def chapter():
+        book.story = []
+        book.create_chapter(f"Chapter {scale}", content)
+        book.story = []
+
+    results = []
+    for target, run in (('_parse_markdown', parse), ('create_html_content', html),
+                        ('MicrowaveBook.create_chapter', chapter)):
+        print(f"  {scale:>5}x  {target}...")
+        result = measure(run)
+        result.update({
+            'target': target,
+            'scale': scale,
+            'bytes': corpus_bytes,
+            'lines': line_count,
+            'lines_per_second': line_count / result['seconds'] if result['seconds'] else 0.0,
+        })
+        results.append(result)
+
+    corpus_path.unlink()
+    return results
+
+
+def git_revision() -> str:
+    """Return the current commit hash, or None outside a git checkout."""
+    try:
+        output = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=BASE_PATH,
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def compare(results: list, baseline_path: Path):
+    """Print time and peak memory ratios against an earlier results file."""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {(r['target'], r['scale']): r for r in baseline['results']}
+
+    print(f"\nCompared with {baseline.get('commit') or baseline_path}")
+    print(f"{'='*78}")
+    for result in results:
+        old = previous.get((result['target'], result['scale']))
+        if old is None:
+            continue
+        print(f"{result['target']:<30}{result['scale']:>6}x   "
+              f"time {result['seconds'] / old['seconds']:>6.2f}x   "
+              f"peak {result['peak_bytes'] / max(old['peak_bytes'], 1):>6.2f}x")
+    print(f"{'='*78}")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default=','.join(str(s) for s in DEFAULT_SCALES),
+                        help="comma-separated corpus sizes, in multiples of the guide (default: 1,10,100,1000)")
+    parser.add_argument('-o', '--output', default=str(DEFAULT_OUTPUT),
+                        help="JSON results file (default: benchmark_results.json)")
+    parser.add_argument('--compare', metavar='JSON',
+                        help="earlier results file to compare against")
+    args = parser.parse_args()
+
+    scales = [int(scale) for scale in args.scales.split(',') if scale.strip()]
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            print(f"Benchmarking {scale}x corpus...")
+            results.extend(bench_scale(scale, Path(tmp)))
+
+    report = {
+        'commit': git_revision(),
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'guide_bytes': GUIDE_PATH.stat().st_size,
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"\n{'='*78}")
+    print(f"{'Target':<30}{'Scale':>7}{'Seconds':>10}{'Lines/s':>15}{'Peak MB':>12}")
+    print(f"{'='*78}")
+    for result in results:
+        print(f"{result['target']:<30}{result['scale']:>6}x{result['seconds']:>10.2f}"
+              f"{result['lines_per_second']:>15,.0f}{result['peak_bytes'] / 1e6:>12.1f}")
+    print(f"{'='*78}")
+    print(f"Results written to: {args.output}")
+
+    if args.compare:
+        compare(results, Path(args.compare))
+
+
+if __name__ == '__main__':
+    main()
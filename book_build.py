@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Parallel Book Builder
+Lays out the parts of a ReportLab book (front matter, chapters, back
+matter) as separate PDFs in a process pool and joins them into one
+file, with page headers and footers drawn at their global page numbers.
+Rendered parts can be cached so a rebuild only lays out changed chapters.
+Published by ALAM-ACADEMY
+"""
+
+import inspect
+import io
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from reportlab import Version as REPORTLAB_VERSION
+from reportlab.pdfgen import canvas
+from reportlab.platypus import PageBreak
+
+from disk_cache import DiskLRUCache, content_key
+from pdf_output import is_stream
+from render_cache import local_modules
+
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:  # pypdf is only needed to join the parts
+    PdfReader = PdfWriter = None
+
+
+# Rendered parts are cached here for incremental rebuilds.
+PART_CACHE_DIR = Path(__file__).parent / '.chapter_cache'
+PART_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+class PageOffsetDoc:
+    """Stand-in for the doc template passed to page callbacks.
+
+    ``page`` is the global page number: the part's starting offset
+    plus the page's position within the part.
+    """
+
+    def __init__(self, doc, page: int):
+        self._doc = doc
+        self.page = page
+
+    def __getattr__(self, name):
+        return getattr(self._doc, name)
+
+
+def render_part(factory, calls) -> bytes:
+    """Lay out one part of a book and return its PDF without page decorations.
+
+    ``factory`` is called with an output stream and must return a
+    generator object with ``doc`` and ``story`` attributes; ``calls`` is
+    a list of ``(method_name, args)`` pairs that fill its story. Runs in
+    a worker process, so both must be picklable.
+    """
+    buffer = io.BytesIO()
+    book = factory(buffer)
+    for name, args in calls:
+        getattr(book, name)(*args)
+
+    # Each part starts on a fresh page already
+    story = book.story
+    while story and isinstance(story[0], PageBreak):
+        story.pop(0)
+    book.doc.build(story)
+    return buffer.getvalue()
+
+
+def render_parts(factory, parts: list, jobs: int = None) -> list:
+    """Render ``parts`` in a process pool and return their PDFs in order."""
+    if len(parts) == 1 or jobs == 1:
+        return [render_part(factory, calls) for calls in parts]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(render_part, [factory] * len(parts), parts))
+
+
+def open_part_cache(cache_dir=PART_CACHE_DIR):
+    """Return the rendered part cache stored in ``cache_dir``."""
+    return DiskLRUCache(cache_dir, PART_CACHE_MAX_BYTES, suffix='.pdf')
+
+
+def shared_code_key(factory, part_methods) -> str:
+    """Return a hash of the code every part of ``factory``'s book depends on.
+
+    That is the factory's module, less the ``part_methods`` that fill
+    individual parts, and the repository modules it imports: styles,
+    page geometry and the flowables that render the content.
+    """
+    module = inspect.getmodule(factory)
+    source = inspect.getsource(module)
+    for name in sorted(part_methods):
+        source = source.replace(inspect.getsource(getattr(factory, name)), '')
+    path = Path(module.__file__)
+    parts = [REPORTLAB_VERSION, source]
+    for name in local_modules(path.stem):
+        if name != path.stem:
+            parts += [name, (path.parent / f"{name}.py").read_bytes()]
+    return content_key(*parts)
+
+
+def part_key(factory, calls, shared_key: str) -> str:
+    """Return the cache key for one part of a book.
+
+    The key hashes the part's source, not the story built from it: the
+    calls with their arguments (the part's document nodes), the methods
+    they call and ``shared_key`` from shared_code_key. Anchors and page
+    offsets depend on the parts before this one, so they are left out
+    and inserting or growing a chapter does not invalidate the ones
+    after it.
+    """
+    methods = [inspect.getsource(getattr(factory, name)) for name, _ in calls]
+    return content_key(shared_key, *methods, repr(calls))
+
+
+def render_cached(factory, parts: list, cache, jobs: int = None) -> list:
+    """Return PDFs for ``parts``, laying out only those missing from ``cache``."""
+    shared_key = shared_code_key(factory, {name for calls in parts for name, _ in calls})
+    keys = [part_key(factory, calls, shared_key) for calls in parts]
+    pdfs = [cache.get(key) for key in keys]
+    missing = [index for index, pdf in enumerate(pdfs) if pdf is None]
+    print(f"Reusing {len(parts) - len(missing)} of {len(parts)} cached parts")
+    if missing:
+        rendered = render_parts(factory, [parts[index] for index in missing], jobs)
+        for index, pdf in zip(missing, rendered):
+            cache.put(keys[index], pdf)
+            pdfs[index] = pdf
+    return pdfs
+
+
+def draw_pages(doc, page_sizes: list, on_page) -> bytes:
+    """Return a PDF with one page per entry in ``page_sizes`` drawn by ``on_page``.
+
+    ``on_page(canvas, doc)`` is the usual SimpleDocTemplate page callback;
+    it receives a PageOffsetDoc so ``doc.page`` is the global page number.
+    """
+    buffer = io.BytesIO()
+    overlay = canvas.Canvas(buffer)
+    for number, size in enumerate(page_sizes, 1):
+        overlay.setPageSize(size)
+        on_page(overlay, PageOffsetDoc(doc, number))
+        overlay.showPage()
+    overlay.save()
+    return buffer.getvalue()
+
+
+def join_parts(pdfs: list, output, doc=None, on_page=None) -> int:
+    """Concatenate part PDFs into ``output`` and return the total page count.
+
+    ``output`` is a path or a writable binary stream. Part ``k`` starts
+    at page ``1 + sum(pages of parts before k)``. When ``on_page`` is
+    given, it is drawn at those global page numbers underneath every
+    page, as SimpleDocTemplate draws it before the page's flowables.
+    Each part's outline entries are kept, moved to the part's pages.
+    """
+    if PdfReader is None:
+        raise ImportError("joining parallel parts requires pypdf (pip install pypdf)")
+
+    readers = [PdfReader(io.BytesIO(pdf)) for pdf in pdfs]
+    pages = [page for reader in readers for page in reader.pages]
+
+    if on_page is not None:
+        sizes = [(float(page.mediabox.width), float(page.mediabox.height)) for page in pages]
+        decorations = PdfReader(io.BytesIO(draw_pages(doc, sizes, on_page))).pages
+        for page, decoration in zip(pages, decorations):
+            page.merge_page(decoration, over=False)
+
+    writer = PdfWriter()
+    for page in pages:
+        writer.add_page(page)
+    offset = 0
+    for reader in readers:
+        parents = []
+        for depth, title, page in outline_entries(reader):
+            del parents[depth:]
+            parent = parents[-1] if parents else None
+            parents.append(writer.add_outline_item(title, offset + page, parent=parent))
+        offset += len(reader.pages)
+    if is_stream(output) and not getattr(output, 'seekable', lambda: False)():
+        # pypdf records object offsets with tell(), which pipes and sockets lack
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        output.write(buffer.getvalue())
+    else:
+        writer.write(output)
+    return len(pages)
+
+
+def outline_entries(reader) -> list:
+    """Return ``(depth, title, page index)`` for each outline entry of a PdfReader, in order."""
+    entries = []
+
+    def walk(items, depth):
+        for item in items:
+            if isinstance(item, list):
+                walk(item, depth + 1)
+            else:
+                entries.append((depth, item.title, reader.get_destination_page_number(item)))
+
+    walk(reader.outline, 0)
+    return entries
+
+
+def part_pages(pdf: bytes):
+    """Return a part's page count and the page of each outline entry, in order.
+
+    The entries are the anchored headings recorded by
+    book_toc.PageRefDocTemplate, in the order they were laid out.
+    """
+    if PdfReader is None:
+        raise ImportError("reading parallel parts requires pypdf (pip install pypdf)")
+    reader = PdfReader(io.BytesIO(pdf))
+    return len(reader.pages), [page + 1 for _, _, page in outline_entries(reader)]
+
+
+def build_parallel(factory, parts: list, output, doc=None, on_page=None, jobs: int = None,
+                   cache=None) -> int:
+    """Render ``parts`` in parallel, join them into ``output`` and return the page count.
+
+    With a ``cache`` only parts whose content changed are laid out again.
+    """
+    if cache is not None:
+        pdfs = render_cached(factory, parts, cache, jobs)
+    else:
+        pdfs = render_parts(factory, parts, jobs)
+    return join_parts(pdfs, output, doc, on_page)
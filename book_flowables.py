@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Shared ReportLab Flowables
+Flowable builders shared by the ALAM-ACADEMY PDF generators.
+Published by ALAM-ACADEMY
+"""
+
+import builtins
+import io
+import keyword
+import tokenize
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+
+from reportlab.lib.colors import HexColor
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import Flowable, LongTable, TableStyle, XPreformatted
+
+from inline_markdown import escape, plain_text
+
+
+TABLE_FONT = 'Times-Roman'
+TABLE_HEADER_FONT = 'Helvetica-Bold'
+TABLE_FONT_SIZE = 9
+TABLE_LEADING = 11
+TABLE_PADDING = 4
+TABLE_ALIGNMENTS = {'left': 'LEFT', 'center': 'CENTER', 'right': 'RIGHT'}
+TABLE_STRIPES = [HexColor('#ffffff'), HexColor('#f7fafc')]
+
+# Code block languages that get Python highlighting; others are plain text.
+PYTHON_LANGUAGES = {'python', 'py', 'python3'}
+# Token kind -> font markup, for code on a light or a dark background.
+CODE_THEMES = {
+    'light': {
+        'keyword': '<font color="#1d4ed8"><b>{}</b></font>',
+        'builtin': '<font color="#7c3aed">{}</font>',
+        'string': '<font color="#15803d">{}</font>',
+        'number': '<font color="#b45309">{}</font>',
+        'comment': '<font color="#6b7280"><i>{}</i></font>',
+    },
+    'dark': {
+        'keyword': '<font color="#90cdf4"><b>{}</b></font>',
+        'builtin': '<font color="#d6bcfa">{}</font>',
+        'string': '<font color="#9ae6b4">{}</font>',
+        'number': '<font color="#fbd38d">{}</font>',
+        'comment': '<font color="#a0aec0"><i>{}</i></font>',
+    },
+}
+_BUILTINS = frozenset(dir(builtins))
+_STRING_TOKENS = {tokenize.STRING} | {getattr(tokenize, name) for name in
+                                      ('FSTRING_START', 'FSTRING_MIDDLE', 'FSTRING_END')
+                                      if hasattr(tokenize, name)}
+
+
+@lru_cache(maxsize=65536)
+def text_width(text: str, font: str, size: float) -> float:
+    """Return the width of ``text`` in points, measured once per string."""
+    return stringWidth(text, font, size)
+
+
+def _token_kind(token) -> str:
+    if token.type in _STRING_TOKENS:
+        return 'string'
+    if token.type == tokenize.COMMENT:
+        return 'comment'
+    if token.type == tokenize.NUMBER:
+        return 'number'
+    if token.type == tokenize.NAME:
+        if keyword.iskeyword(token.string):
+            return 'keyword'
+        if token.string in _BUILTINS:
+            return 'builtin'
+    return None
+
+
+@lru_cache(maxsize=1024)
+def code_fragments(code: str, language: str = 'python') -> tuple:
+    """Split ``code`` into lines of ``(kind, text)`` fragments, once per snippet.
+
+    ``kind`` is a CODE_THEMES key, or None for plain text. Code that is
+    not Python, or does not tokenize (an unterminated string, say), is
+    returned as plain lines. Blank lines before and after the code are
+    dropped, as XPreformatted draws none for them.
+    """
+    lines = code.expandtabs(4).split('\n')
+    while lines and not lines[0].strip():
+        del lines[0]
+    while lines and not lines[-1].strip():
+        del lines[-1]
+    plain = tuple(((None, line),) for line in lines)
+    if language.lower() not in PYTHON_LANGUAGES:
+        return plain
+    spans = [[] for _ in lines]
+    try:
+        for token in tokenize.generate_tokens(io.StringIO('\n'.join(lines)).readline):
+            kind = _token_kind(token)
+            if kind is None:
+                continue
+            (start_row, start_col), (end_row, end_col) = token.start, token.end
+            # Triple-quoted strings cover several lines
+            for row in range(start_row, end_row + 1):
+                start = start_col if row == start_row else 0
+                end = end_col if row == end_row else len(lines[row - 1])
+                spans[row - 1].append((start, end, kind))
+    except (tokenize.TokenError, SyntaxError):
+        return plain
+
+    fragments = []
+    for line, line_spans in zip(lines, spans):
+        parts = []
+        col = 0
+        for start, end, kind in sorted(line_spans):
+            if start < col:
+                continue
+            if start > col:
+                parts.append((None, line[col:start]))
+            parts.append((kind, line[start:end]))
+            col = end
+        if col < len(line) or not parts:
+            parts.append((None, line[col:]))
+        fragments.append(tuple(parts))
+    return tuple(fragments)
+
+
+@lru_cache(maxsize=1024)
+def code_markup(code: str, language: str, max_chars: int, theme: str = 'light') -> tuple:
+    """Return one XPreformatted markup string per output line of ``code``.
+
+    Lines longer than ``max_chars`` characters fold onto the next line;
+    the code is tokenized once however many widths it is laid out at.
+    """
+    formats = CODE_THEMES[theme]
+    lines = []
+    for fragments in code_fragments(code, language):
+        line = []
+        length = 0
+        for kind, text in fragments:
+            while text:
+                if length == max_chars:
+                    lines.append(''.join(line))
+                    line = []
+                    length = 0
+                piece, text = text[:max_chars - length], text[max_chars - length:]
+                line.append(formats[kind].format(escape(piece)) if kind else escape(piece))
+                length += len(piece)
+        lines.append(''.join(line))
+    return tuple(lines)
+
+
+def wrap_text(text: str, width: float, font: str, size: float) -> list:
+    """Greedily wrap ``text`` into lines no wider than ``width``."""
+    space = text_width(' ', font, size)
+    lines = []
+    line = []
+    line_width = 0.0
+    for word in text.split():
+        word_width = text_width(word, font, size)
+        if line and line_width + space + word_width > width:
+            lines.append(' '.join(line))
+            line = [word]
+            line_width = word_width
+        else:
+            line_width += (space if line else 0.0) + word_width
+            line.append(word)
+    if line:
+        lines.append(' '.join(line))
+    return lines or ['']
+
+
+def column_widths(rows: list, avail_width: float, fonts: list, size: float) -> list:
+    """Size columns from their measured text, shrinking wide ones to fit.
+
+    Each column gets at least its longest word; space left over is shared
+    in proportion to how much wider each column would like to be.
+    """
+    columns = max(len(row) for row in rows)
+    padding = 2 * TABLE_PADDING
+    natural = [padding] * columns
+    minimum = [padding] * columns
+    for row, font in zip(rows, fonts):
+        for col, cell in enumerate(row):
+            natural[col] = max(natural[col], text_width(cell, font, size) + padding)
+            for word in cell.split():
+                minimum[col] = max(minimum[col], text_width(word, font, size) + padding)
+
+    if sum(natural) <= avail_width:
+        return natural
+    if sum(minimum) >= avail_width:
+        scale = avail_width / sum(minimum)
+        return [width * scale for width in minimum]
+
+    spare = avail_width - sum(minimum)
+    wanted = [n - m for n, m in zip(natural, minimum)]
+    total_wanted = sum(wanted)
+    return [m + spare * w / total_wanted for m, w in zip(minimum, wanted)]
+
+
+class PagedTable(Flowable):
+    """A long table laid out page by page from precomputed row heights.
+
+    Splitting only bisects the cumulative row heights and hands the frame
+    a LongTable holding the rows that fit (plus the repeated header), so
+    each row is measured once and a table of any length lays out in
+    linear time. ReportLab's own Table.split rebuilds and restyles all of
+    the remaining rows at every page break.
+    """
+
+    def __init__(self, header, rows, widths, heights, commands, start=0, offsets=None):
+        Flowable.__init__(self)
+        self.header = header
+        self.rows = rows
+        self.widths = widths
+        self.heights = heights
+        self.commands = commands
+        self.start = start
+        if offsets is None:
+            offsets = list(accumulate(heights[1:], initial=0.0))
+        self.offsets = offsets
+
+    def _height(self, start, end):
+        return self.heights[0] + self.offsets[end] - self.offsets[start]
+
+    def wrap(self, availWidth, availHeight):
+        self.width = sum(self.widths)
+        self.height = self._height(self.start, len(self.rows))
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        body_space = availHeight - self.heights[0]
+        end = bisect_right(self.offsets, self.offsets[self.start] + body_space) - 1
+        if end <= self.start:
+            return []
+        return [
+            self.page_table(self.start, end),
+            PagedTable(self.header, self.rows, self.widths, self.heights,
+                       self.commands, end, self.offsets),
+        ]
+
+    def page_table(self, start, end) -> LongTable:
+        """Return a LongTable for body rows ``start:end`` under the header."""
+        data = [self.header] + self.rows[start:end]
+        heights = [self.heights[0]] + self.heights[start + 1:end + 1]
+        # Keep the stripe pattern continuous across pages
+        stripes = TABLE_STRIPES if start % 2 == 0 else TABLE_STRIPES[::-1]
+        table = LongTable(data, colWidths=self.widths, rowHeights=heights, repeatRows=1)
+        table.setStyle(TableStyle(self.commands + [('ROWBACKGROUNDS', (0, 1), (-1, -1), stripes)]))
+        return table
+
+    def draw(self):
+        table = self.page_table(self.start, len(self.rows))
+        table.wrapOn(self.canv, self.width, self.height)
+        table.drawOn(self.canv, 0, 0)
+
+
+class CodeListing(Flowable):
+    """A code listing drawn with XPreformatted, one source line per line.
+
+    Indentation and line breaks are kept, Python is highlighted from a
+    tokenization cached per snippet, and lines too long for the frame
+    fold rather than re-wrap like prose. Splitting only counts the lines
+    that fit, so a listing of any length breaks across pages in linear
+    time. ``style`` should use a monospaced font.
+    """
+
+    def __init__(self, code, style, language='python', theme='light', lines=None):
+        Flowable.__init__(self)
+        self.code = code
+        self.style = style
+        self.language = language
+        self.theme = theme
+        self.lines = lines
+
+    def _line_markup(self, availWidth):
+        if self.lines is None:
+            style = self.style
+            width = availWidth - style.leftIndent - style.rightIndent
+            max_chars = int(width // text_width(' ', style.fontName, style.fontSize))
+            self.lines = code_markup(self.code, self.language, max(max_chars, 1), self.theme)
+        return self.lines
+
+    def wrap(self, availWidth, availHeight):
+        self.width = availWidth
+        self.height = len(self._line_markup(availWidth)) * self.style.leading
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        lines = self._line_markup(availWidth)
+        # Leave at least two lines on each page rather than a lone one
+        fit = min(int(availHeight // self.style.leading), len(lines) - 2)
+        if fit < 2:
+            return []
+        return [
+            CodeListing(self.code, self.style, self.language, self.theme, lines[:fit]),
+            CodeListing(self.code, self.style, self.language, self.theme, lines[fit:]),
+        ]
+
+    def draw(self):
+        listing = XPreformatted('\n'.join(self.lines), self.style)
+        _, height = listing.wrapOn(self.canv, self.width, self.height)
+        # A blank line at a page break is not drawn; keep the text top-aligned
+        listing.drawOn(self.canv, 0, self.height - height)
+
+
+def build_long_table(header: list, rows: list, avail_width: float, align=None) -> PagedTable:
+    """Build a table whose column widths and row heights are fixed up front.
+
+    Cells are plain wrapped strings measured with cached stringWidth
+    calls; the header row repeats on each page.
+    """
+    columns = len(header)
+    rows = [header] + [row + [''] * (columns - len(row)) for row in rows]
+    rows = [[plain_text(cell) for cell in row[:columns]] for row in rows]
+    fonts = [TABLE_HEADER_FONT] + [TABLE_FONT] * (len(rows) - 1)
+
+    widths = column_widths(rows, avail_width, fonts, TABLE_FONT_SIZE)
+    data = []
+    heights = []
+    for row, font in zip(rows, fonts):
+        cells = [wrap_text(cell, width - 2 * TABLE_PADDING, font, TABLE_FONT_SIZE)
+                 for cell, width in zip(row, widths)]
+        data.append(['\n'.join(lines) for lines in cells])
+        heights.append(max(len(lines) for lines in cells) * TABLE_LEADING + 2 * TABLE_PADDING)
+
+    commands = [
+        ('FONTNAME', (0, 0), (-1, -1), TABLE_FONT),
+        ('FONTNAME', (0, 0), (-1, 0), TABLE_HEADER_FONT),
+        ('FONTSIZE', (0, 0), (-1, -1), TABLE_FONT_SIZE),
+        ('LEADING', (0, 0), (-1, -1), TABLE_LEADING),
+        ('TEXTCOLOR', (0, 0), (-1, 0), HexColor('#ffffff')),
+        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#2c5282')),
+        ('GRID', (0, 0), (-1, -1), 0.5, HexColor('#cbd5e0')),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), TABLE_PADDING),
+        ('RIGHTPADDING', (0, 0), (-1, -1), TABLE_PADDING),
+        ('TOPPADDING', (0, 0), (-1, -1), TABLE_PADDING),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), TABLE_PADDING),
+    ]
+    for col, alignment in enumerate(align or ()):
+        if alignment in TABLE_ALIGNMENTS:
+            commands.append(('ALIGN', (col, 0), (col, -1), TABLE_ALIGNMENTS[alignment]))
+
+    return PagedTable(data[0], data[1:], widths, heights, commands)
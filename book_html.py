@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Book HTML Renderer
+Renders parsed book_nodes as the HTML body used by the WeasyPrint
+generator.
+Published by ALAM-ACADEMY
+"""
+
+import re
+
+import book_nodes
+from inline_markdown import escape, plain_text, to_html
+
+
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_SPACE_RE = re.compile(r'[-\s]+')
+
+
+def slugify(text: str) -> str:
+    """Return a heading anchor id in the style of markdown's toc extension."""
+    slug = _SLUG_STRIP_RE.sub('', plain_text(text)).strip().lower()
+    return _SLUG_SPACE_RE.sub('-', slug)
+
+
+class HTMLRenderer:
+    """Collect HTML for each node; anchor ids are kept unique per document."""
+
+    def __init__(self):
+        self.parts = []
+        self._used_ids = {}
+        self._handlers = {
+            book_nodes.Heading: self._heading,
+            book_nodes.Paragraph: self._paragraph,
+            book_nodes.ListBlock: self._list,
+            book_nodes.OrderedList: self._list,
+            book_nodes.CodeBlock: self._code,
+            book_nodes.Table: self._table,
+            book_nodes.Rule: self._rule,
+        }
+        self._paragraph_formats = {
+            book_nodes.BODY: '<p>{}</p>',
+            book_nodes.BOLD: '<p><strong>{}</strong></p>',
+        }
+
+    def _anchor(self, text: str) -> str:
+        slug = slugify(text) or 'section'
+        count = self._used_ids.get(slug, 0)
+        self._used_ids[slug] = count + 1
+        return f"{slug}_{count}" if count else slug
+
+    def _heading(self, node):
+        tag = f"h{node.level}"
+        self.parts.append(f'<{tag} id="{self._anchor(node.text)}">{to_html(node.text)}</{tag}>')
+
+    def _paragraph(self, node):
+        self.parts.append(self._paragraph_formats[node.style].format(to_html(node.text)))
+
+    def _list(self, node):
+        self.parts.append(self._list_html(node))
+
+    def _list_html(self, node) -> str:
+        items = ''.join(f"<li>{to_html(item)}{self._list_html(child) if child else ''}</li>"
+                        for item, child in node.entries())
+        if isinstance(node, book_nodes.OrderedList):
+            start = f' start="{node.start}"' if node.start != 1 else ''
+            return f"<ol{start}>{items}</ol>"
+        return f"<ul>{items}</ul>"
+
+    def _code(self, node):
+        css_class = f' class="language-{escape(node.language)}"' if node.language else ''
+        self.parts.append(f"<pre><code{css_class}>{escape(node.text)}\n</code></pre>")
+
+    def _table(self, node):
+        align = node.align or []
+
+        def cells(row, tag):
+            out = []
+            for col, cell in enumerate(row):
+                style = f' style="text-align: {align[col]};"' if col < len(align) else ''
+                out.append(f"<{tag}{style}>{to_html(cell)}</{tag}>")
+            return ''.join(out)
+
+        body = ''.join(f"<tr>{cells(row, 'td')}</tr>" for row in node.rows)
+        self.parts.append(
+            f"<table><thead><tr>{cells(node.header, 'th')}</tr></thead><tbody>{body}</tbody></table>"
+        )
+
+    def _rule(self, node):
+        self.parts.append('<hr>')
+
+    def render(self, nodes) -> str:
+        """Render ``nodes`` and return all HTML produced so far."""
+        book_nodes.render(nodes, self._handlers)
+        return '\n'.join(self.parts)
+
+
+def render_html(nodes) -> str:
+    """Render a parsed document as an HTML fragment."""
+    return HTMLRenderer().render(nodes)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Book Document Model
+Compact node types for parsed book content, shared by the ALAM-ACADEMY
+PDF generators.
+Published by ALAM-ACADEMY
+"""
+
+import sys
+
+
+def style_key(name: str) -> str:
+    """Return the interned style key for ``name``."""
+    return sys.intern(name)
+
+
+# Paragraph style keys. Generators map these to their own ParagraphStyles.
+BODY = style_key('body')
+BOLD = style_key('bold')
+
+
+class Node:
+    """Base class for document nodes."""
+    __slots__ = ()
+    KIND = None
+    # Field names of the node, subclass slots included; set per class
+    FIELDS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.FIELDS = tuple(name for klass in reversed(cls.__mro__)
+                           for name in klass.__dict__.get('__slots__', ()))
+
+    def fields(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.FIELDS)
+
+    def to_json(self) -> list:
+        """Return a JSON-serialisable list: the node kind followed by its fields."""
+        return [self.KIND, *self.fields()]
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.fields() == other.fields()
+
+    def __repr__(self):
+        args = ', '.join(repr(value) for value in self.fields())
+        return f"{type(self).__name__}({args})"
+
+    def __getstate__(self):
+        return self.fields()
+
+    def __setstate__(self, state):
+        for name, value in zip(self.FIELDS, state):
+            setattr(self, name, value)
+
+
+class Heading(Node):
+    """A heading; ``level`` 1 is a chapter or part title."""
+    __slots__ = ('level', 'text')
+    KIND = 'heading'
+
+    def __init__(self, level: int, text: str):
+        self.level = level
+        self.text = text
+
+
+class Paragraph(Node):
+    """A paragraph of body text rendered with the style named by ``style``."""
+    __slots__ = ('text', 'style')
+    KIND = 'paragraph'
+
+    def __init__(self, text: str, style: str = BODY):
+        self.text = text
+        self.style = style_key(style)
+
+
+class ListBlock(Node):
+    """A bulleted list; ``items`` holds the text of each entry.
+
+    ``children`` is None for a flat list, or gives for each item the list
+    nested under it (None for an item without one).
+    """
+    __slots__ = ('items', 'children')
+    KIND = 'list'
+
+    def __init__(self, items: list, children: list = None):
+        self.items = items
+        # Nested lists arrive as JSON lists when loaded from the cache
+        self.children = [node_from_json(child) if isinstance(child, list) else child
+                         for child in children] if children else None
+
+    def entries(self) -> list:
+        """Return ``(text, nested list or None)`` for each item."""
+        return list(zip(self.items, self.children or [None] * len(self.items)))
+
+    def to_json(self) -> list:
+        data = Node.to_json(self)
+        if self.children:
+            data[2] = [child and child.to_json() for child in self.children]
+        return data
+
+
+class OrderedList(ListBlock):
+    """A numbered list whose first item is numbered ``start``."""
+    __slots__ = ('start',)
+    KIND = 'ordered_list'
+
+    def __init__(self, items: list, children: list = None, start: int = 1):
+        ListBlock.__init__(self, items, children)
+        self.start = start
+
+
+class CodeBlock(Node):
+    """A code listing with its original line breaks and indentation."""
+    __slots__ = ('text', 'language')
+    KIND = 'code'
+
+    def __init__(self, text: str, language: str = ''):
+        self.text = text
+        self.language = style_key(language)
+
+
+class Table(Node):
+    """A table with one header row and any number of body rows.
+
+    ``align`` optionally gives 'left', 'center' or 'right' per column.
+    """
+    __slots__ = ('header', 'rows', 'align')
+    KIND = 'table'
+
+    def __init__(self, header: list, rows: list, align: list = None):
+        self.header = header
+        self.rows = rows
+        self.align = align
+
+
+class Rule(Node):
+    """A thematic break (``---``) between sections."""
+    __slots__ = ()
+    KIND = 'rule'
+
+
+NODE_TYPES = {cls.KIND: cls for cls in (Heading, Paragraph, ListBlock, OrderedList, CodeBlock, Table, Rule)}
+
+
+def node_from_json(data: list) -> Node:
+    """Rebuild a node from the list produced by ``Node.to_json``."""
+    kind, *fields = data
+    return NODE_TYPES[kind](*fields)
+
+
+def render(nodes, handlers: dict):
+    """Call the handler registered for each node's type, in document order."""
+    for node in nodes:
+        handlers[type(node)](node)
@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+Book Markdown Parser
+Parses the book markdown into book_nodes once, for every ALAM-ACADEMY
+rendering backend (ReportLab flowables and WeasyPrint HTML).
+Published by ALAM-ACADEMY
+"""
+
+import glob
+import json
+import mmap
+import re
+import sys
+from pathlib import Path
+
+import book_nodes
+from disk_cache import DiskLRUCache, content_key
+from inline_markdown import plain_text
+
+
+# Parsed sections are cached here, keyed by section content and parser code.
+CACHE_DIR = Path(__file__).parent / '.markdown_cache'
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Large sources are read through mmap and decoded this many bytes at a time.
+MMAP_BLOCK_SIZE = 1024 * 1024
+
+# The H1 heading that opens the guide's body: "PART I: ...", "PART 2 ..."
+PART_RE = re.compile(r'PART\s+[IVXLC\d]+\b')
+
+
+# Line labels used by parse_markdown(). Headings and bold lines reuse the
+# element type names so the parser can yield them directly.
+H1, H2, H3, H4 = 'h1', 'h2', 'h3', 'h4'
+BOLD = 'bold'
+ITEM = 'item'
+ORDERED = 'ordered'  # a numbered list item: 1. text
+FENCE = 'fence'
+BREAK = 'break'    # starts with '#' or '**' but is not a block of its own
+ROW = 'row'        # a GFM table row
+RULE = 'rule'      # a thematic break: ---, *** or longer
+TEXT = 'text'
+MARKER = 'marker'  # needs _BLOCK_RE to tell which block it starts
+
+_HEADINGS = (None, H1, H2, H3, H4)
+_HEADING_LEVELS = {H1: 1, H2: 2, H3: 3, H4: 4}
+
+# First-character dispatch: most lines are labelled by one dict lookup.
+# Headings and bullet items are told apart by the word before the first
+# space; only the remaining marker lines reach the regex.
+_FIRST_CHAR = {'#': MARKER, '-': MARKER, '*': MARKER, '`': MARKER, '|': ROW}
+_FIRST_CHAR.update(dict.fromkeys('0123456789', MARKER))
+_MARKER_WORDS = {'#': H1, '##': H2, '###': H3, '####': H4, '-': ITEM}
+_BLOCK_RE = re.compile(
+    r'(?:(?P<rule>(?:-{3,}|\*{3,})$)|(?P<heading>#{1,4}) |(?P<hash>#)|(?P<item>- )|(?P<bold>\*\*)|(?P<fence>```)'
+    r'|(?P<ordered>\d{1,9}\. ))'
+)
+# Items indented this much more than the item above are nested under it
+_NEST_INDENT = 2
+_SECTION_RE = re.compile(r'##? ')
+_TABLE_DELIMITER_RE = re.compile(r'\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?$')
+_TABLE_CELL_RE = re.compile(r'(?<!\\)\|')
+
+
+def _classify_marker(text: str):
+    """Label a stripped line that starts with a markdown marker character."""
+    match = _BLOCK_RE.match(text)
+    if match is None:
+        return TEXT, text
+    group = match.lastgroup
+    if group == 'heading':
+        level = len(match.group('heading'))
+        return _HEADINGS[level], text[level + 1:].strip()
+    if group == 'item':
+        return ITEM, text[2:].strip()
+    if group == 'ordered':
+        return ORDERED, text[match.end():].strip()
+    if group == 'rule':
+        return RULE, text
+    if group == 'fence':
+        return FENCE, text
+    if group == 'bold' and text.endswith('**'):
+        return BOLD, text[2:-2].strip()
+    return BREAK, text
+
+
+def _split_table_row(line: str) -> list:
+    """Split a GFM table row into stripped cell texts."""
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    return [cell.strip().replace('\\|', '|') for cell in _TABLE_CELL_RE.split(line)]
+
+
+def _table_alignment(cell: str) -> str:
+    if cell.startswith(':') and cell.endswith(':'):
+        return 'center'
+    if cell.endswith(':'):
+        return 'right'
+    return 'left'
+
+
+def _table_node(lines: list):
+    """Build a Table from consecutive pipe rows, or a Paragraph if they are not one."""
+    if len(lines) < 2 or not _TABLE_DELIMITER_RE.match(lines[1]):
+        return book_nodes.Paragraph(' '.join(lines))
+    header = _split_table_row(lines[0])
+    align = [_table_alignment(cell) for cell in _split_table_row(lines[1])]
+    rows = [_split_table_row(line) for line in lines[2:]]
+    return book_nodes.Table(header, rows, align[:len(header)])
+
+
+def _item_number(line: str) -> int:
+    """Return the number of a numbered list item line (1 for a bullet)."""
+    number = line.strip().split('.', 1)[0]
+    return int(number) if number.isdigit() else 1
+
+
+def _new_list(kind, text: str, start: int):
+    if kind is ORDERED:
+        return book_nodes.OrderedList([text], None, start)
+    return book_nodes.ListBlock([text])
+
+
+def _add_item(node, text: str):
+    node.items.append(text)
+    if node.children is not None:
+        node.children.append(None)
+
+
+def _add_list_item(lists: list, indent: int, kind, text: str, start: int) -> bool:
+    """Add an item to the open lists, nesting it by its indentation.
+
+    ``lists`` holds ``[indent, list node]`` for each open level, the
+    outermost first. Returns False if the item cannot join them: a
+    numbered item after a bulleted one at the top level (or the other
+    way round) starts a new list.
+    """
+    while len(lists) > 1 and indent < lists[-1][0]:
+        lists.pop()
+    level_indent, node = lists[-1]
+    if indent >= level_indent + _NEST_INDENT:
+        if node.children is None:
+            node.children = [None] * len(node.items)
+        child = node.children[-1]
+        if child is None:
+            child = node.children[-1] = _new_list(kind, text, start)
+        else:
+            _add_item(child, text)
+        lists.append([indent, child])
+        return True
+    if len(lists) == 1 and (kind is ORDERED) != isinstance(node, book_nodes.OrderedList):
+        return False
+    _add_item(node, text)
+    return True
+
+
+def parse_markdown(source):
+    """Parse markdown into book_nodes, yielding them lazily.
+
+    ``source`` may be an open file handle or any other iterable of
+    lines (a plain string is split into lines first). Each line is
+    labelled exactly once and only the block currently being collected
+    is held in memory.
+    """
+    if isinstance(source, str):
+        source = source.splitlines()
+
+    para_lines = None
+    lists = None
+    table_rows = None
+    code_lines = None
+    language = ''
+
+    for line in source:
+        # Code blocks keep the raw line so indentation survives
+        if code_lines is not None:
+            if line.lstrip().startswith('```'):
+                yield book_nodes.CodeBlock('\n'.join(code_lines), language)
+                code_lines = None
+            else:
+                code_lines.append(line.rstrip('\r\n'))
+            continue
+
+        text = line.strip()
+        if not text:
+            # Blank lines end paragraphs and tables; lists stay open across them
+            if para_lines is not None:
+                yield book_nodes.Paragraph(' '.join(para_lines))
+                para_lines = None
+            elif table_rows is not None:
+                yield _table_node(table_rows)
+                table_rows = None
+            continue
+
+        kind = _FIRST_CHAR.get(text[0], TEXT)
+        if kind is TEXT:
+            # Continue the open paragraph
+            if para_lines is not None:
+                para_lines.append(text)
+                continue
+        elif kind is MARKER:
+            word, space, rest = text.partition(' ')
+            kind = _MARKER_WORDS.get(word) if space else None
+            if kind is not None:
+                text = rest.lstrip()
+            else:
+                kind, text = _classify_marker(text)
+            # "*italic*", "-5" or "`code`" continue the open paragraph too
+            if kind is TEXT and para_lines is not None:
+                para_lines.append(text)
+                continue
+        elif kind is ROW:
+            # Pipe rows inside a paragraph stay paragraph text
+            if para_lines is not None:
+                para_lines.append(text)
+                continue
+            if table_rows is not None:
+                table_rows.append(text)
+                continue
+
+        # Continue the open list
+        if lists is not None and (kind is ITEM or kind is ORDERED):
+            raw = line.expandtabs(4) if '\t' in line else line
+            indent = len(raw) - len(raw.lstrip())
+            level_indent, node = lists[-1]
+            if (level_indent <= indent < level_indent + _NEST_INDENT and node.children is None
+                    and (len(lists) > 1 or (kind is ORDERED) == (type(node) is book_nodes.OrderedList))):
+                # Another item at the level of the one above, the common case
+                node.items.append(text)
+                continue
+            if _add_list_item(lists, indent, kind, text, _item_number(line) if kind is ORDERED else 1):
+                continue
+
+        # Anything else closes it
+        if para_lines is not None:
+            yield book_nodes.Paragraph(' '.join(para_lines))
+            para_lines = None
+        elif lists is not None:
+            yield lists[0][1]
+            lists = None
+        elif table_rows is not None:
+            yield _table_node(table_rows)
+            table_rows = None
+
+        # Headings (H1-H4)
+        if kind in _HEADING_LEVELS:
+            yield book_nodes.Heading(_HEADING_LEVELS[kind], text)
+
+        # Bold text as paragraph
+        elif kind is BOLD:
+            yield book_nodes.Paragraph(text, book_nodes.BOLD)
+        elif kind is ITEM or kind is ORDERED:
+            raw = line.expandtabs(4) if '\t' in line else line
+            lists = [[len(raw) - len(raw.lstrip()), _new_list(kind, text, _item_number(line) if kind is ORDERED else 1)]]
+        elif kind is ROW:
+            table_rows = [text]
+        elif kind is RULE:
+            yield book_nodes.Rule()
+        elif kind is FENCE:
+            code_lines = []
+            language = text[3:].strip()
+
+        # Regular paragraph. The first line always belongs to it, so
+        # lines such as "**Owner:** ..." cannot stall the parser.
+        else:
+            para_lines = [text]
+
+    if para_lines is not None:
+        yield book_nodes.Paragraph(' '.join(para_lines))
+    elif lists is not None:
+        yield lists[0][1]
+    elif table_rows is not None:
+        yield _table_node(table_rows)
+    elif code_lines is not None:
+        yield book_nodes.CodeBlock('\n'.join(code_lines), language)
+
+
+def _iter_sections(lines):
+    """Split markdown lines into sections that start at H1/H2 headings.
+
+    Headings inside fenced code blocks do not start a section. No block
+    spans an H1/H2 line, so each section parses independently.
+    """
+    section = []
+    in_code = False
+    for line in lines:
+        stripped = line.lstrip()
+        if stripped.startswith('```'):
+            in_code = not in_code
+        elif not in_code and section and _SECTION_RE.match(stripped):
+            yield section
+            section = []
+        section.append(line.rstrip('\r\n'))
+    if section:
+        yield section
+
+
+_parser_version = None
+
+
+def parser_version() -> str:
+    """Return a hash of the parser source, used to expire cached sections."""
+    global _parser_version
+    if _parser_version is None:
+        import inspect
+
+        # Whole modules, so no helper, regex or label constant is missed;
+        # book_nodes decides how cached nodes are stored
+        _parser_version = content_key(inspect.getsource(sys.modules[__name__]),
+                                      inspect.getsource(book_nodes))
+    return _parser_version
+
+
+def parse_cached(source, cache):
+    """Parse markdown section by section, loading unchanged sections from ``cache``.
+
+    With ``cache`` set to None every section is parsed.
+    """
+    if cache is None:
+        yield from parse_markdown(source)
+        return
+    if isinstance(source, str):
+        source = source.splitlines()
+
+    version = parser_version()
+    for section in _iter_sections(source):
+        key = content_key(version, '\n'.join(section))
+        data = cache.get(key)
+        if data is not None:
+            nodes = [book_nodes.node_from_json(item) for item in json.loads(data)]
+        else:
+            nodes = list(parse_markdown(section))
+            payload = [node.to_json() for node in nodes]
+            cache.put(key, json.dumps(payload).encode('utf-8'))
+        yield from nodes
+
+
+def _natural_key(path: Path):
+    """Sort key that orders chapter_2.md before chapter_10.md."""
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', path.name)]
+
+
+def resolve_sources(source: str) -> list:
+    """Return the markdown files named by ``source``.
+
+    ``source`` may be a single file, a directory (all ``*.md`` files in
+    it) or a glob pattern. Chapter files are returned in natural order.
+    """
+    path = Path(source)
+    if path.is_dir():
+        paths = list(path.glob('*.md'))
+    elif glob.has_magic(source):
+        paths = [Path(match) for match in glob.glob(source)]
+    else:
+        return [path] if path.exists() else []
+    return sorted((p for p in paths if p.is_file()), key=_natural_key)
+
+
+def read_lines(path, block_size: int = MMAP_BLOCK_SIZE):
+    """Yield the lines of a UTF-8 file, decoding one block at a time.
+
+    The file is memory-mapped and each block is cut at the last newline
+    found with ``mmap.rfind`` (or extended to the next one with
+    ``mmap.find`` when a single line is longer than a block), so the
+    decoded text held in memory scales with ``block_size`` rather than
+    with the size of the file. Lines keep their trailing newline, as
+    when iterating over a file object.
+    """
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return
+    with mm:
+        size = len(mm)
+        start = 0
+        while start < size:
+            end = min(start + block_size, size)
+            if end < size:
+                cut = mm.rfind(b'\n', start, end)
+                if cut < 0:
+                    cut = mm.find(b'\n', end)
+                end = size if cut < 0 else cut + 1
+            lines = mm[start:end].decode('utf-8').split('\n')
+            last = lines.pop()
+            for line in lines:
+                yield line + '\n'
+            if last:
+                yield last
+            start = end
+
+
+def _parse_chapter_file(path: str, cache_dir) -> list:
+    """Parse one chapter file in a worker process."""
+    return list(parse_cached(read_lines(path), open_cache(cache_dir)))
+
+
+def open_cache(cache_dir):
+    """Return the section cache stored in ``cache_dir``, or None if it is unset."""
+    return DiskLRUCache(cache_dir, CACHE_MAX_BYTES, suffix='.json') if cache_dir else None
+
+
+def parse_files(paths: list, cache_dir=CACHE_DIR, jobs: int = None):
+    """Parse chapter files in a process pool, yielding nodes in chapter order.
+
+    Chapters are yielded as soon as they and every chapter before them
+    are parsed, so rendering can start while later ones are still in
+    the pool.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    paths = [str(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for nodes in pool.map(_parse_chapter_file, paths, [cache_dir] * len(paths)):
+            yield from nodes
+
+
+def body_nodes(nodes) -> list:
+    """Return ``nodes`` without the guide's front matter.
+
+    The guide opens with its own title page, dedication, preface and a
+    typed table of contents with made-up page numbers, all of which the
+    books replace, so everything before the first "PART I" style H1
+    heading is dropped. A document without one is kept whole.
+    """
+    nodes = list(nodes)
+    for index, node in enumerate(nodes):
+        if type(node) is book_nodes.Heading and node.level == 1 and PART_RE.match(plain_text(node.text)):
+            return nodes[index:]
+    return nodes
+
+
+def load_document(paths: list, cache_dir=CACHE_DIR, jobs: int = None) -> list:
+    """Parse one markdown file or a list of chapter files into a list of nodes.
+
+    The result can be handed to every backend, so a build that writes
+    several formats parses the source only once. A single file is the
+    guide and loses its front matter (see body_nodes); chapter files
+    are kept whole.
+    """
+    if len(paths) > 1:
+        return list(parse_files(paths, cache_dir, jobs))
+    return body_nodes(parse_cached(read_lines(paths[0]), open_cache(cache_dir)))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Computed Table of Contents
+Page references that are filled in when a ReportLab PDF is saved, so a
+table of contents gets real page numbers from a single layout pass.
+Published by ALAM-ACADEMY
+"""
+
+from functools import partial
+
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import SimpleDocTemplate
+
+
+# Name of the onDraw callback that TOC entries end with, and the room
+# kept free on the right of each entry for its page number.
+PAGE_REF_CALLBACK = 'page_ref'
+PAGE_REF_WIDTH = 30
+LEADER_DOT = ' .'
+
+
+def page_ref(key: str) -> str:
+    """Return the Paragraph markup that places the page number of ``key``."""
+    return f'<onDraw name="{PAGE_REF_CALLBACK}" label="{key}"/>'
+
+
+def anchor(flowable, key: str, title: str, level: int = 0):
+    """Mark ``flowable`` as the target of page reference ``key`` and return it."""
+    flowable.anchor = (key, title, level)
+    return flowable
+
+
+class PageRefCanvas(Canvas):
+    """Canvas that draws page references as forms defined when it is saved.
+
+    Each TOC entry gets its dot leader at once and a ``doForm`` call for
+    its page number. The forms are only written in ``save()``, after the
+    whole document is laid out, using ``resolve(key)`` for the number.
+    PDF allows such forward references, so the entries' height never
+    depends on their numbers and one layout pass is enough.
+    """
+
+    def __init__(self, *args, resolve=None, **kwargs):
+        Canvas.__init__(self, *args, **kwargs)
+        self._resolve = resolve
+        self._page_refs = {}
+        self.setNamedCB(PAGE_REF_CALLBACK, self._draw_page_ref)
+
+    def _draw_page_ref(self, canv, kind, key):
+        info = self._curr_tx_info
+        style = info['xs'].style
+        x, y, right = info['cur_x'], info['cur_y'], info['xs'].paraWidth
+        font, size = style.fontName, style.fontSize
+
+        # Dot leader up to the page number column
+        dot_width = stringWidth(LEADER_DOT, font, size)
+        dots = int((right - PAGE_REF_WIDTH - x) / dot_width)
+        self.saveState()
+        self.setFont(font, size)
+        self.setFillColor(style.textColor)
+        if dots > 0:
+            self.drawRightString(right - PAGE_REF_WIDTH, y, LEADER_DOT * dots)
+        self.translate(right, y)
+        self.doForm(f"pageref_{key}")
+        self.restoreState()
+        self._page_refs[key] = (font, size, style.textColor)
+
+    def save(self):
+        for key, (font, size, color) in self._page_refs.items():
+            page = self._resolve(key) if self._resolve else None
+            self.beginForm(f"pageref_{key}", lowerx=-PAGE_REF_WIDTH, lowery=-size, upperx=0, uppery=size)
+            self.setFont(font, size)
+            self.setFillColor(color)
+            self.drawRightString(0, 0, '?' if page is None else str(page))
+            self.endForm()
+        Canvas.save(self)
+
+
+class PageRefDocTemplate(SimpleDocTemplate):
+    """SimpleDocTemplate that records the page of every anchored flowable.
+
+    Anchored headings also get a PDF outline entry. When the document is
+    one part of a larger book, ``page_offsets`` maps keys found in later
+    parts to their page counted from the end of this part.
+    """
+
+    def __init__(self, filename, **kwargs):
+        SimpleDocTemplate.__init__(self, filename, **kwargs)
+        self.anchor_pages = {}
+        self.page_offsets = None
+        self._outline_top = False
+
+    def afterFlowable(self, flowable):
+        target = getattr(flowable, 'anchor', None)
+        if target is None:
+            return
+        key, title, level = target
+        self.anchor_pages[key] = self.page
+        self.canv.bookmarkPage(key)
+        # Outline levels must not skip, so a section before any chapter is top level
+        if level == 0:
+            self._outline_top = True
+        self.canv.addOutlineEntry(title, key, level if self._outline_top else 0)
+
+    def resolve_page_ref(self, key: str):
+        """Return the page number for ``key``, or None if it never appeared."""
+        if key in self.anchor_pages:
+            return self.anchor_pages[key]
+        if self.page_offsets and key in self.page_offsets:
+            return self.page + self.page_offsets[key]
+        return None
+
+    def build(self, flowables, **kwargs):
+        kwargs.setdefault('canvasmaker', partial(PageRefCanvas, resolve=self.resolve_page_ref))
+        SimpleDocTemplate.build(self, flowables, **kwargs)
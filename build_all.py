@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Build All Books
+Renders every book target concurrently in a process pool, after the
+targets it depends on, skipping targets whose inputs have not changed
+since their last build, and prints a per-target timing summary.
+Published by ALAM-ACADEMY
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+from disk_cache import content_key
+from render_cache import GUIDE_PATH, local_modules
+
+
+BASE_PATH = Path(__file__).parent
+DEFAULT_OUTPUT_DIR = BASE_PATH / 'build'
+
+# Input hashes of the last successful build of each target, in the output directory.
+STAMP_FILE = '.build_stamps.json'
+
+
+class Target:
+    """One build step: the module that implements it, its data files and prerequisites.
+
+    ``output`` is the PDF it writes inside the output directory, or None
+    for a step that only fills a cache other targets read.
+    """
+
+    def __init__(self, module: str, data=(), deps=(), output=None, requires=None):
+        self.module = module
+        self.data = tuple(data)
+        self.deps = tuple(deps)
+        self.output = output
+        self.requires = requires
+
+
+TARGETS = {
+    # Parses the guide into the markdown cache once for both of its renderers
+    'guide-parse': Target('book_parser', data=[GUIDE_PATH]),
+    'ai-book': Target('generate_pdf_reportlab', data=[GUIDE_PATH], deps=['guide-parse'],
+                      output='ai-book.pdf'),
+    'weasyprint': Target('generate_pdf', data=[GUIDE_PATH], deps=['guide-parse'],
+                         output='ai-book-weasyprint.pdf', requires='weasyprint'),
+    'microwave': Target('microwave_book_generator', output='microwave.pdf'),
+    'it-book': Target('generate_book', output='it-book.pdf'),
+    'simple': Target('simple_pdf_generator', output='simple.pdf'),
+}
+
+
+def input_key(target: Target, reproducible: bool) -> str:
+    """Return a hash of everything ``target`` is built from."""
+    paths = [BASE_PATH / f"{name}.py" for name in local_modules(target.module)] + list(target.data)
+    parts = [f"reproducible={reproducible}"]
+    for path in paths:
+        parts += [path.name, path.read_bytes()]
+    return content_key(*parts)
+
+
+def with_deps(names) -> list:
+    """Return ``names`` plus everything they depend on."""
+    selected = []
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.append(name)
+            pending.extend(TARGETS[name].deps)
+    return [name for name in TARGETS if name in selected]
+
+
+def build_target(name: str, output_dir: str, reproducible: bool) -> int:
+    """Build one target in a worker process and return the bytes written."""
+    if name == 'guide-parse':
+        from book_parser import load_document
+
+        load_document([GUIDE_PATH])
+        return 0
+
+    from render_jobs import render
+
+    pdf, _ = render(name, {'reproducible': reproducible})
+    output = Path(output_dir) / TARGETS[name].output
+    # Write next to the target and rename, so a failed build never leaves half a PDF
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(pdf)
+    os.replace(tmp_path, output)
+    return len(pdf)
+
+
+def _load_stamps(output_dir: Path) -> dict:
+    try:
+        with open(output_dir / STAMP_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_stamps(output_dir: Path, stamps: dict):
+    with open(output_dir / STAMP_FILE, 'w', encoding='utf-8') as f:
+        json.dump(stamps, f, indent=2, sort_keys=True)
+
+
+def build_all(names=None, output_dir=DEFAULT_OUTPUT_DIR, jobs: int = None, force: bool = False,
+              reproducible: bool = False) -> dict:
+    """Build ``names`` (default: every target) and return ``{name: (status, seconds, size)}``.
+
+    A target starts once all of its dependencies have finished; if one of
+    them fails the target is not built. Targets whose inputs hash the
+    same as at their last successful build, and whose output still
+    exists, are skipped unless ``force`` is set.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stamps = _load_stamps(output_dir)
+    order = with_deps(names or TARGETS)
+
+    results = {}
+    keys = {}
+    waiting = []
+    for name in order:
+        target = TARGETS[name]
+        if target.requires and importlib.util.find_spec(target.requires) is None:
+            results[name] = (f"skipped (no {target.requires})", 0.0, None)
+            continue
+        keys[name] = input_key(target, reproducible)
+        output_exists = target.output is None or (output_dir / target.output).exists()
+        if not force and output_exists and stamps.get(name) == keys[name]:
+            results[name] = ('unchanged', 0.0, None)
+            continue
+        waiting.append(name)
+
+    running = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while waiting or running:
+            for name in list(waiting):
+                deps = TARGETS[name].deps
+                if any(dep in waiting or dep in running.values() for dep in deps):
+                    continue
+                waiting.remove(name)
+                failed = [dep for dep in deps if results.get(dep, ('',))[0] in ('failed', 'blocked')]
+                if failed:
+                    results[name] = ('blocked', 0.0, None)
+                    continue
+                print(f"Building {name}...")
+                future = pool.submit(build_target, name, str(output_dir), reproducible)
+                future.start = time.perf_counter()
+                running[future] = name
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                seconds = time.perf_counter() - future.start
+                try:
+                    size = future.result()
+                except Exception as exc:  # one broken book must not stop the others
+                    print(f"{name} failed: {type(exc).__name__}: {exc}")
+                    results[name] = ('failed', seconds, None)
+                    stamps.pop(name, None)
+                    continue
+                results[name] = ('built', seconds, size)
+                stamps[name] = keys[name]
+                _save_stamps(output_dir, stamps)
+
+    return {name: results[name] for name in order}
+
+
+def print_summary(results: dict, seconds: float):
+    """Print each target's status, build time and size."""
+    print(f"\n{'='*64}")
+    print(f"{'Target':<14}{'Status':<28}{'Seconds':>10}{'Size':>12}")
+    print(f"{'='*64}")
+    for name, (status, target_seconds, size) in results.items():
+        size_text = f"{size / 1024:,.0f} KB" if size else ''
+        print(f"{name:<14}{status:<28}{target_seconds:>10.2f}{size_text:>12}")
+    print(f"{'='*64}")
+    print(f"Total wall time: {seconds:.2f}s")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build every academy book concurrently.")
+    parser.add_argument('targets', nargs='*', metavar='target',
+                        help=f"targets to build with their dependencies (default: all of "
+                             f"{', '.join(TARGETS)})")
+    parser.add_argument('-o', '--output-dir', default=str(DEFAULT_OUTPUT_DIR),
+                        help="directory for the PDFs (default: build)")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="rebuild targets even if unchanged")
+    parser.add_argument('--reproducible', action='store_true',
+                        help="byte-identical output for identical input, dated from SOURCE_DATE_EPOCH")
+    args = parser.parse_args()
+    unknown = [name for name in args.targets if name not in TARGETS]
+    if unknown:
+        parser.error(f"unknown target {unknown[0]!r} (choose from {', '.join(TARGETS)})")
+
+    start = time.perf_counter()
+    results = build_all(args.targets, args.output_dir, args.jobs, args.force, args.reproducible)
+    print_summary(results, time.perf_counter() - start)
+    if any(status in ('failed', 'blocked') for status, _, _ in results.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Disk-backed LRU Cache
+Content-addressed byte store shared by the ALAM-ACADEMY book generators.
+Published by ALAM-ACADEMY
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+
+def content_key(*parts) -> str:
+    """Return a SHA-256 hex digest over ``parts`` (str or bytes)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        digest.update(len(part).to_bytes(8, 'big'))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class DiskLRUCache:
+    """Store byte blobs on disk under content hashes, evicting least recently used.
+
+    Each entry is one file named after its key. Reads refresh the file's
+    modification time, so eviction removes the entries with the oldest
+    mtime until the directory fits in ``max_bytes``. Writes go to a
+    temporary file first and are moved into place atomically, so readers
+    never see a partial entry.
+    """
+
+    def __init__(self, directory, max_bytes: int = 64 * 1024 * 1024, suffix: str = '.bin'):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self._total = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.suffix}"
+
+    def get(self, key: str):
+        """Return the bytes stored under ``key``, or None on a miss."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, data: bytes):
+        """Store ``data`` under ``key`` and evict old entries if over budget."""
+        import tempfile  # kept off the import path of every script that reads a cache
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self._total is None:
+            self._total = self._scan()[1]
+        path = self._path(key)
+        try:
+            self._total -= path.stat().st_size
+        except OSError:
+            pass
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._total += len(data)
+        if self._total > self.max_bytes:
+            self._evict()
+
+    def _scan(self):
+        """Return ``(entries, total_bytes)`` for the files in the cache."""
+        entries = []
+        total = 0
+        for path in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        return entries, total
+
+    def _evict(self):
+        """Remove least recently used entries until the cache fits its budget."""
+        entries, total = self._scan()
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._total = total
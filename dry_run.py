@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Layout Dry Run
+Lays out a ReportLab story without drawing or writing it, to report the
+page count and the page each chapter starts on far faster than a build.
+Published by ALAM-ACADEMY
+"""
+
+import time
+from functools import partial
+
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Paragraph
+from reportlab.platypus.frames import Frame
+
+
+class NullCanvas(Canvas):
+    """Canvas that counts pages but keeps no page content and writes no file.
+
+    Fonts and content streams are never serialized, so nothing is
+    written to the document template's filename.
+    """
+
+    def showPage(self):
+        if self._onPage:
+            self._onPage(self._pageNumber)
+        self._startPage()
+
+    def save(self):
+        pass
+
+
+def _skip_draw(canv):
+    pass
+
+
+def _place(frame, flowable, canv, trySplit=0):
+    """``Frame.add`` that places ``flowable`` without drawing it.
+
+    The frame still wraps, splits and positions it, so pagination is
+    exactly that of a real build.
+    """
+    flowable._drawOn = _skip_draw
+    try:
+        return Frame._add(frame, flowable, canv, trySplit)
+    finally:
+        del flowable._drawOn
+
+
+def chapter_titles(story: list, chapter_styles) -> dict:
+    """Return ``{id(paragraph): title}`` for the story's chapter headings.
+
+    A chapter heading is a paragraph whose style name is in
+    ``chapter_styles``. One with no text of its own, such as an unnamed
+    back-matter chapter, takes the text of the next paragraph that has some.
+    """
+    titles = {}
+    untitled = []
+    for flowable in story:
+        if not isinstance(flowable, Paragraph):
+            continue
+        text = flowable.getPlainText().strip()
+        if flowable.style.name in chapter_styles:
+            if text:
+                titles[id(flowable)] = text
+            else:
+                untitled.append(id(flowable))
+        elif text and untitled:
+            titles.update((key, text) for key in untitled)
+            untitled = []
+    return titles
+
+
+def layout_story(doc, story: list, chapter_styles=(), **build_kwargs):
+    """Lay out ``story`` with ``doc`` and return ``(page count, chapter starts)``.
+
+    Chapter starts are ``(title, page)`` pairs for every paragraph whose
+    style name is in ``chapter_styles``. ``build_kwargs`` are passed on to
+    ``doc.build``, e.g. the ``onFirstPage`` and ``onLaterPages`` callbacks.
+
+    Only ``doc`` is hooked, for the length of the build: its frames place
+    flowables without drawing them, and its ``afterFlowable`` records the
+    page each chapter heading lands on.
+    """
+    titles = chapter_titles(story, set(chapter_styles))
+    chapters = []
+    before_page = doc.beforePage
+    after_flowable = doc.afterFlowable
+
+    def skip_drawing():
+        before_page()
+        for frame in doc.pageTemplate.frames:
+            frame.add = partial(_place, frame)
+
+    def record_chapter(flowable):
+        after_flowable(flowable)
+        if id(flowable) in titles:
+            chapters.append((titles[id(flowable)], doc.page))
+
+    doc.beforePage = skip_drawing
+    doc.afterFlowable = record_chapter
+    try:
+        doc.build(story, canvasmaker=NullCanvas, **build_kwargs)
+    finally:
+        del doc.beforePage, doc.afterFlowable
+    return doc.page, chapters
+
+
+def print_layout(pages: int, chapters: list, seconds: float):
+    """Print a dry-run report: each chapter's first page and the total."""
+    print(f"\n{'='*60}")
+    print("Dry Run (no PDF written)")
+    print(f"{'='*60}")
+    for title, page in chapters:
+        print(f"{page:>6}  {title or '(untitled)'}")
+    print(f"{'='*60}")
+    print(f"Total pages: {pages}")
+    print(f"Layout time: {seconds:.2f}s")
+    print(f"{'='*60}")
+
+
+def report_layout(doc, story: list, chapter_styles=(), **build_kwargs) -> int:
+    """Lay out ``story``, print the report and return the page count."""
+    start = time.perf_counter()
+    pages, chapters = layout_story(doc, story, chapter_styles, **build_kwargs)
+    print_layout(pages, chapters, time.perf_counter() - start)
+    return pages
@@ -3,14 +3,25 @@ ALAM-ACADEMY IT & Computer Science Book Generator
 Generates a comprehensive PDF book with definitions, descriptions, step-by-step examples
 """
 
-from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from datetime import datetime
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+import argparse
 import os
+import re
+
+import book_nodes
+from inline_markdown import escape
+from lazy_import import LazyModule
+from page_forms import place_form
+from pdf_output import STDOUT, open_output, output_name
+from reproducible import build_time, enable_reproducible
+
+# Imported on first use, so --help and argument errors return without loading ReportLab
+colors = LazyModule('reportlab.lib.colors')
+platypus = LazyModule('reportlab.platypus')
+rl_styles = LazyModule('reportlab.lib.styles')
+book_flowables = LazyModule('book_flowables')
 
 # Academy Information
 ACADEMY_NAME = "ALAM-ACADEMY"
@@ -23,6 +34,8 @@ ADDRESS = "Karachi, PAKISTAN"
 BOOK_TITLE = "IT & COMPUTER SCIENCE"
 SUBTITLE = "A Comprehensive Guide with Definitions, Descriptions & Step-by-Step Examples"
 
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), "ALAM_ACADEMY_IT_Book.pdf")
+
 def get_book_content():
     """Generate comprehensive book content with definitions, descriptions, and examples"""
     chapters = []
@@ -1556,11 +1569,103 @@ main()
     
     return chapters
 
-def build_pdf():
-    """Generate the complete PDF book"""
+# Paragraph style for numbered items and "Step N:" / "Phase N:" lines
+STEP = book_nodes.style_key('step')
+
+# Block patterns in the chapter text
+SECTION_RE = re.compile(r'^\d+\.\d+\s+\S')
+BULLET_RE = re.compile(r'^\s*[-*•]\s+(.*)$')
+STEP_RE = re.compile(r'^((?:Step|Phase)\s+\d+:|\d+\.)\s*(.*)$')
+CODE_RE = re.compile(
+    r'^(?:#|//|\}|(?:def|class|for|while|if|elif|return|import|function)\b|else:|try:|except\b'
+    r'|print\(|[\w.\[\]]+\s*[-+*/]?=\s|\w+\(.*\)$)'
+    r'|\S\s+#\s'      # command with a trailing comment
+    r'|\S {3,}\S'      # column-aligned text
+)
+OUTPUT_LABEL_RE = re.compile(r'\bOutput:$')
+# Lines ending in a colon up to this length are lead-ins, shown bold
+LABEL_MAX_LENGTH = 60
+
+def is_code_line(line):
+    """True if ``line`` belongs in a code listing rather than prose"""
+    return bool(line[:1].isspace() or CODE_RE.search(line))
+
+def chapter_nodes(chapter):
+    """Convert a chapter from get_book_content() into book_nodes
+
+    The chapter text has one paragraph per line. Section titles become
+    level 2 headings; runs of "-" lines become lists; numbered items
+    and steps, code (indented, or a line that looks like code) and the
+    lines after an "Output:" label each become their own block, so no
+    single flowable holds more than a listing or a paragraph.
+    """
+    yield book_nodes.Heading(1, chapter['title'])
+    lines = chapter['content'].strip().splitlines()
+    items = []
+    code = []
+    in_output = False
+    
+    def flush_list():
+        if items:
+            yield book_nodes.ListBlock(items[:])
+            items.clear()
     
-    output_path = os.path.join(os.path.dirname(__file__), "ALAM_ACADEMY_IT_Book.pdf")
-    doc = SimpleDocTemplate(
+    def flush_code():
+        if code:
+            # Printed program output is not highlighted
+            language = 'text' if in_output else 'python'
+            yield book_nodes.CodeBlock('\n'.join(code).rstrip(), language)
+            code.clear()
+    
+    for i, line in enumerate(lines):
+        text = line.strip()
+        if not text:
+            # A listing carries on over blank lines while code follows them
+            upcoming = next((later for later in lines[i + 1:] if later.strip()), '')
+            if code and not in_output and is_code_line(upcoming) and not BULLET_RE.match(upcoming):
+                code.append('')
+                continue
+            yield from flush_list()
+            yield from flush_code()
+            in_output = False
+            continue
+        if in_output:
+            code.append(line)
+            continue
+        bullet = BULLET_RE.match(line)
+        if bullet:
+            yield from flush_code()
+            items.append(bullet.group(1))
+            continue
+        yield from flush_list()
+        if not code and SECTION_RE.match(line):
+            yield book_nodes.Heading(2, text)
+        elif STEP_RE.match(line):
+            yield from flush_code()
+            yield book_nodes.Paragraph(text, STEP)
+        elif is_code_line(line):
+            code.append(line.rstrip())
+        else:
+            yield from flush_code()
+            if text.endswith(':') and len(text) <= LABEL_MAX_LENGTH:
+                yield book_nodes.Paragraph(text, book_nodes.BOLD)
+                in_output = bool(OUTPUT_LABEL_RE.search(text))
+            else:
+                yield book_nodes.Paragraph(text)
+    yield from flush_list()
+    yield from flush_code()
+
+def build_pdf(dry_run=False, output_path=None):
+    """Generate the complete PDF book
+
+    output_path is a file path or any writable binary stream (default:
+    ALAM_ACADEMY_IT_Book.pdf next to this script). With dry_run the book
+    is only laid out and its page count and chapter start pages are
+    printed; no PDF is written.
+    """
+    if output_path is None:
+        output_path = DEFAULT_OUTPUT
+    doc = platypus.SimpleDocTemplate(
         output_path,
         pagesize=A4,
         rightMargin=0.75*inch,
@@ -1569,11 +1674,14 @@ def build_pdf():
         bottomMargin=0.5*inch
     )
     
+    # Captured once so the title page and every footer show the same time
+    doc.generated_at = build_time()
+    
     story = []
-    styles = getSampleStyleSheet()
+    styles = rl_styles.getSampleStyleSheet()
     
     # Custom styles
-    title_style = ParagraphStyle(
+    title_style = rl_styles.ParagraphStyle(
         'CustomTitle',
         parent=styles['Heading1'],
         fontSize=24,
@@ -1583,7 +1691,7 @@ def build_pdf():
         fontName='Helvetica-Bold'
     )
     
-    subtitle_style = ParagraphStyle(
+    subtitle_style = rl_styles.ParagraphStyle(
         'Subtitle',
         parent=styles['Normal'],
         fontSize=14,
@@ -1593,7 +1701,7 @@ def build_pdf():
         fontName='Helvetica-Oblique'
     )
     
-    chapter_style = ParagraphStyle(
+    chapter_style = rl_styles.ParagraphStyle(
         'ChapterTitle',
         parent=styles['Heading1'],
         fontSize=18,
@@ -1603,7 +1711,7 @@ def build_pdf():
         fontName='Helvetica-Bold'
     )
     
-    body_style = ParagraphStyle(
+    body_style = rl_styles.ParagraphStyle(
         'BodyText',
         parent=styles['BodyText'],
         fontSize=10,
@@ -1612,67 +1720,124 @@ def build_pdf():
         spaceAfter=6
     )
     
+    section_style = rl_styles.ParagraphStyle(
+        'SectionTitle',
+        parent=styles['Heading2'],
+        fontSize=13,
+        textColor=colors.darkblue,
+        spaceBefore=10,
+        spaceAfter=6,
+        fontName='Helvetica-Bold'
+    )
+    
+    list_style = rl_styles.ParagraphStyle(
+        'ListItem',
+        parent=body_style,
+        leftIndent=18,
+        bulletIndent=6,
+        spaceAfter=2
+    )
+    
+    code_style = rl_styles.ParagraphStyle(
+        'CodeListing',
+        parent=styles['Code'],
+        fontSize=8.5,
+        leading=10.5,
+        leftIndent=12,
+        spaceBefore=4,
+        spaceAfter=8,
+        backColor=colors.whitesmoke,
+        borderPadding=4
+    )
+    
     # Title Page
-    story.append(Spacer(1, 1.5*inch))
-    story.append(Paragraph(ACADEMY_NAME, title_style))
-    story.append(Paragraph(BOOK_TITLE, subtitle_style))
-    story.append(Paragraph(SUBTITLE, subtitle_style))
-    story.append(Spacer(1, 0.5*inch))
+    story.append(platypus.Spacer(1, 1.5*inch))
+    story.append(platypus.Paragraph(ACADEMY_NAME, title_style))
+    story.append(platypus.Paragraph(BOOK_TITLE, subtitle_style))
+    story.append(platypus.Paragraph(SUBTITLE, subtitle_style))
+    story.append(platypus.Spacer(1, 0.5*inch))
     
     publisher_info = [
-        [Paragraph(f"<b>Publisher:</b> {ACADEMY_NAME}", body_style)],
-        [Paragraph(f"<b>Owner:</b> {OWNER_NAME}", body_style)],
-        [Paragraph(f"<b>Contact:</b> {CONTACT}", body_style)],
-        [Paragraph(f"<b>Email:</b> {EMAIL}", body_style)],
-        [Paragraph(f"<b>GitHub:</b> {GITHUB}", body_style)],
-        [Paragraph(f"<b>Address:</b> {ADDRESS}", body_style)]
+        [platypus.Paragraph(f"<b>Publisher:</b> {ACADEMY_NAME}", body_style)],
+        [platypus.Paragraph(f"<b>Owner:</b> {OWNER_NAME}", body_style)],
+        [platypus.Paragraph(f"<b>Contact:</b> {CONTACT}", body_style)],
+        [platypus.Paragraph(f"<b>Email:</b> {EMAIL}", body_style)],
+        [platypus.Paragraph(f"<b>GitHub:</b> {GITHUB}", body_style)],
+        [platypus.Paragraph(f"<b>Address:</b> {ADDRESS}", body_style)]
     ]
     
-    info_table = Table(publisher_info, colWidths=[5*inch])
-    info_table.setStyle(TableStyle([
+    info_table = platypus.Table(publisher_info, colWidths=[5*inch])
+    info_table.setStyle(platypus.TableStyle([
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
         ('SPACEAFTER', (0, 0), (-1, -1), 10),
     ]))
     story.append(info_table)
-    story.append(Spacer(1, 1*inch))
-    story.append(Paragraph(f"<i>Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</i>", body_style))
-    story.append(PageBreak())
+    story.append(platypus.Spacer(1, 1*inch))
+    story.append(platypus.Paragraph(f"<i>Generated on: {doc.generated_at.strftime('%Y-%m-%d %H:%M:%S')}</i>", body_style))
+    story.append(platypus.PageBreak())
     
     # Table of Contents
-    story.append(Paragraph("TABLE OF CONTENTS", chapter_style))
-    story.append(Spacer(1, 12))
+    story.append(platypus.Paragraph("TABLE OF CONTENTS", chapter_style))
+    story.append(platypus.Spacer(1, 12))
     
     chapters = get_book_content()
     for i, chapter in enumerate(chapters, 1):
-        story.append(Paragraph(f"{i}. {chapter['title']}", body_style))
-    story.append(PageBreak())
+        story.append(platypus.Paragraph(f"{i}. {chapter['title']}", body_style))
+    story.append(platypus.PageBreak())
     
     # Generate chapters
+    def add_heading(node):
+        if node.level > 1:
+            story.append(platypus.Paragraph(escape(node.text), section_style))
+            return
+        story.append(platypus.Paragraph(node.text, chapter_style))
+        story.append(platypus.Spacer(1, 6))
+    
+    def add_paragraph(node):
+        text = escape(node.text)
+        if node.style == STEP:
+            label, rest = STEP_RE.match(text).groups()
+            text = f"<b>{label}</b> {rest}"
+        elif node.style == book_nodes.BOLD:
+            text = f"<b>{text}</b>"
+        story.append(platypus.Paragraph(text, body_style))
+    
+    def add_list(node):
+        for item in node.items:
+            story.append(platypus.Paragraph(escape(item), list_style, bulletText='•'))
+        story.append(platypus.Spacer(1, 4))
+    
+    handlers = {
+        book_nodes.Heading: add_heading,
+        book_nodes.Paragraph: add_paragraph,
+        book_nodes.ListBlock: add_list,
+        book_nodes.CodeBlock: lambda node: story.append(
+            book_flowables.CodeListing(node.text, code_style, node.language)),
+    }
     for chapter in chapters:
-        story.append(Paragraph(chapter['title'], chapter_style))
-        story.append(Spacer(1, 6))
-        
-        paragraphs = chapter['content'].strip().split('\\n')
-        for para in paragraphs:
-            if para.strip():
-                story.append(Paragraph(para.strip(), body_style))
-        
-        story.append(Spacer(1, 12))
-        story.append(PageBreak())
+        book_nodes.render(chapter_nodes(chapter), handlers)
+        story.append(platypus.Spacer(1, 12))
+        story.append(platypus.PageBreak())
     
     # Back Cover
-    story.append(Spacer(1, 2*inch))
-    story.append(Paragraph(ACADEMY_NAME, title_style))
-    story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph("<b>Contact Information</b>", chapter_style))
-    story.append(Paragraph(f"Owner: {OWNER_NAME}", body_style))
-    story.append(Paragraph(f"Phone: {CONTACT}", body_style))
-    story.append(Paragraph(f"Email: {EMAIL}", body_style))
-    story.append(Paragraph(f"GitHub: {GITHUB}", body_style))
-    story.append(Paragraph(f"Address: {ADDRESS}", body_style))
-    story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph("<i>© 2026 ALAM-ACADEMY. All Rights Reserved.</i>", body_style))
+    story.append(platypus.Spacer(1, 2*inch))
+    story.append(platypus.Paragraph(ACADEMY_NAME, title_style))
+    story.append(platypus.Spacer(1, 0.5*inch))
+    story.append(platypus.Paragraph("<b>Contact Information</b>", chapter_style))
+    story.append(platypus.Paragraph(f"Owner: {OWNER_NAME}", body_style))
+    story.append(platypus.Paragraph(f"Phone: {CONTACT}", body_style))
+    story.append(platypus.Paragraph(f"Email: {EMAIL}", body_style))
+    story.append(platypus.Paragraph(f"GitHub: {GITHUB}", body_style))
+    story.append(platypus.Paragraph(f"Address: {ADDRESS}", body_style))
+    story.append(platypus.Spacer(1, 0.5*inch))
+    story.append(platypus.Paragraph("<i>© 2026 ALAM-ACADEMY. All Rights Reserved.</i>", body_style))
+    
+    if dry_run:
+        from dry_run import report_layout
+
+        report_layout(doc, story, [chapter_style.name])
+        return None
     
     doc.build(story, onFirstPage=add_header_footer, onLaterPages=add_header_footer)
     return output_path
@@ -1681,31 +1846,64 @@ def add_header_footer(canvas, doc):
     """Add header and footer to each page"""
     canvas.saveState()
     
-    canvas.setFont('Helvetica-Bold', 10)
-    canvas.setFillColor(colors.darkblue)
-    header_text = f"{ACADEMY_NAME} | {BOOK_TITLE}"
-    canvas.drawCentredString(A4[0]/2, A4[1] - 0.5*inch, header_text)
+    def draw_static(form):
+        form.setFont('Helvetica-Bold', 10)
+        form.setFillColor(colors.darkblue)
+        header_text = f"{ACADEMY_NAME} | {BOOK_TITLE}"
+        form.drawCentredString(A4[0]/2, A4[1] - 0.5*inch, header_text)
+        
+        form.setFont('Helvetica', 8)
+        form.setFillColor(colors.gray)
+        now = doc.generated_at
+        footer_left = f"Owner: {OWNER_NAME}"
+        footer_center = f"Date: {now.strftime('%Y-%m-%d')} | Time: {now.strftime('%H:%M:%S')}"
+        form.drawString(0.75*inch, 0.4*inch, footer_left)
+        form.drawCentredString(A4[0]/2, 0.4*inch, footer_center)
+    
+    # Header and the fixed footer text are one form; only the page number changes
+    place_form(canvas, 'page_decoration', draw_static)
     
     canvas.setFont('Helvetica', 8)
     canvas.setFillColor(colors.gray)
-    
-    now = datetime.now()
-    footer_left = f"Owner: {OWNER_NAME}"
-    footer_center = f"Date: {now.strftime('%Y-%m-%d')} | Time: {now.strftime('%H:%M:%S')}"
-    footer_right = f"Page {doc.page}"
-    
-    canvas.drawString(0.75*inch, 0.4*inch, footer_left)
-    canvas.drawCentredString(A4[0]/2, 0.4*inch, footer_center)
-    canvas.drawRightString(A4[0] - 0.75*inch, 0.4*inch, footer_right)
+    canvas.drawRightString(A4[0] - 0.75*inch, 0.4*inch, f"Page {doc.page}")
     
     canvas.restoreState()
 
 if __name__ == "__main__":
-    print("Generating ALAM-ACADEMY IT & Computer Science Book...")
-    print("With definitions, descriptions, and step-by-step examples...")
-    output_file = build_pdf()
-    print(f"Book generated successfully: {output_file}")
-    print(f"Owner: {OWNER_NAME}")
-    print(f"Contact: {CONTACT}")
-    print(f"Email: {EMAIL}")
-    print(f"GitHub: {GITHUB}")
+    parser = argparse.ArgumentParser(description="Generate the ALAM-ACADEMY IT & Computer Science book PDF.")
+    parser.add_argument('-o', '--output', default=None,
+                        help=f"output PDF path, or {STDOUT} to write the PDF to standard output "
+                             "(default: ALAM_ACADEMY_IT_Book.pdf)")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="lay out the book and report its page count without writing a PDF")
+    parser.add_argument('--reproducible', action='store_true',
+                        help="byte-identical output for identical input, dated from SOURCE_DATE_EPOCH")
+    parser.add_argument('--cache', action='store_true',
+                        help="copy the PDF from the render cache if nothing it depends on has changed")
+    args = parser.parse_args()
+    
+    if args.reproducible:
+        enable_reproducible()
+    
+    def build(output):
+        output_file = build_pdf(output_path=output)
+        print(f"Book generated successfully: {output_name(output_file)}")
+        print(f"Owner: {OWNER_NAME}")
+        print(f"Contact: {CONTACT}")
+        print(f"Email: {EMAIL}")
+        print(f"GitHub: {GITHUB}")
+    
+    with open_output(args.output) as output:
+        print("Generating ALAM-ACADEMY IT & Computer Science Book...")
+        print("With definitions, descriptions, and step-by-step examples...")
+        if args.dry_run:
+            build_pdf(dry_run=True, output_path=output)
+        elif args.cache:
+            from render_cache import cached_build, open_render_cache
+            
+            output = output or DEFAULT_OUTPUT
+            if cached_build(open_render_cache(), 'it-book', {'reproducible': args.reproducible},
+                            output, build):
+                print(f"Unchanged; copied from the render cache to {output_name(output)}")
+        else:
+            build(output)
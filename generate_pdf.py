@@ -5,18 +5,27 @@ Converts markdown content to a professionally formatted PDF book.
 Published by ALAM-ACADEMY
 """
 
-import markdown
-from weasyprint import HTML, CSS
 from pathlib import Path
+import argparse
+import time
 
-def create_html_content(md_content: str) -> str:
-    """Convert markdown to HTML with custom styling."""
+from book_html import render_html
+from book_parser import CACHE_DIR, body_nodes, load_document, open_cache, parse_cached
+from pdf_output import STDOUT, is_stream, open_output, output_name
+
+DEFAULT_OUTPUT = Path(__file__).parent / 'AI_Comprehensive_Guide.pdf'
+
+def create_html_content(md_content: str = None, nodes=None) -> str:
+    """Convert markdown to HTML with custom styling.
+
+    ``nodes`` may be a document already parsed by book_parser, so the
+    ReportLab and WeasyPrint outputs share one parse.
+    """
     
-    # Convert markdown to HTML
-    html_body = markdown.markdown(
-        md_content,
-        extensions=['tables', 'fenced_code', 'toc']
-    )
+    # Convert markdown to HTML through the shared document model
+    if nodes is None:
+        nodes = body_nodes(parse_cached(md_content, open_cache(CACHE_DIR)))
+    html_body = render_html(nodes)
     
     # Create full HTML document with professional styling
     html_document = f"""
@@ -235,43 +244,71 @@ def create_html_content(md_content: str) -> str:
     return html_document
 
 
-def generate_pdf():
-    """Generate PDF from markdown file."""
-    
-    # Read markdown content
-    md_path = Path(__file__).parent / 'AI_Comprehensive_Guide.md'
+def generate_pdf(nodes=None, pdf_path=None, dry_run=False):
+    """Generate PDF from markdown file.
+
+    ``nodes`` is an optional document already parsed by book_parser;
+    without it the guide is read and parsed here. ``pdf_path`` may also
+    be a writable binary stream, in which case the intermediate HTML is
+    not saved. With ``dry_run`` the
+    HTML is only laid out and the page count and the start page of each
+    top-level heading are printed; no HTML or PDF file is written.
+    """
     
-    if not md_path.exists():
-        print(f"Error: Markdown file not found at {md_path}")
-        return
+    base_path = Path(__file__).parent
+    if not pdf_path:
+        pdf_path = DEFAULT_OUTPUT
+    elif not is_stream(pdf_path):
+        pdf_path = Path(pdf_path)
     
-    with open(md_path, 'r', encoding='utf-8') as f:
-        md_content = f.read()
+    if nodes is None:
+        # Read markdown content
+        md_path = base_path / 'AI_Comprehensive_Guide.md'
+        
+        if not md_path.exists():
+            print(f"Error: Markdown file not found at {md_path}")
+            return
+        
+        print("Parsing markdown...")
+        nodes = load_document([md_path])
     
+    # WeasyPrint is slow to import; load it only once there is something to render
+    from weasyprint import HTML
+
     print("Converting markdown to HTML...")
-    html_content = create_html_content(md_content)
+    html_content = create_html_content(nodes=nodes)
     
-    # Save intermediate HTML (optional, for debugging)
-    html_path = Path(__file__).parent / 'AI_Comprehensive_Guide.html'
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    print(f"HTML saved to: {html_path}")
+    if dry_run:
+        from dry_run import print_layout
+
+        print("Laying out pages...")
+        start = time.perf_counter()
+        document = HTML(string=html_content).render()
+        chapters = [(label, target[0] + 1) for label, target, _, _ in document.make_bookmark_tree()]
+        print_layout(len(document.pages), chapters, time.perf_counter() - start)
+        return
+    
+    # Save intermediate HTML next to the PDF (optional, for debugging)
+    if not is_stream(pdf_path):
+        html_path = pdf_path.with_suffix('.html')
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        print(f"HTML saved to: {html_path}")
     
     print("Generating PDF...")
     
     # Generate PDF using WeasyPrint
     html_obj = HTML(string=html_content)
     
-    pdf_path = Path(__file__).parent / 'AI_Comprehensive_Guide.pdf'
     html_obj.write_pdf(
-        str(pdf_path),
+        pdf_path if is_stream(pdf_path) else str(pdf_path),
         optimize_size=('fonts', 'images', 'pdf'),
     )
     
     print(f"\n{'='*60}")
     print("PDF Generation Complete!")
     print(f"{'='*60}")
-    print(f"Output file: {pdf_path}")
+    print(f"Output file: {output_name(pdf_path)}")
     print(f"Publisher: ALAM-ACADEMY")
     print(f"Owner: M IFTIKHAR ALAM")
     print(f"Contact: alammiftikhar@gmail.com | 0333-9257987")
@@ -279,4 +316,22 @@ def generate_pdf():
 
 
 if __name__ == '__main__':
-    generate_pdf()
+    parser = argparse.ArgumentParser(description="Generate the AI book PDF with WeasyPrint.")
+    parser.add_argument('-o', '--output', default=None,
+                        help=f"output PDF path, or {STDOUT} to write the PDF to standard output "
+                             "(default: AI_Comprehensive_Guide.pdf)")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="lay out the book and report its page count without writing a PDF")
+    parser.add_argument('--cache', action='store_true',
+                        help="copy the PDF from the render cache if nothing it depends on has changed")
+    args = parser.parse_args()
+    with open_output(args.output) as output:
+        if args.cache and not args.dry_run:
+            from render_cache import cached_build, open_render_cache
+            
+            output = output or DEFAULT_OUTPUT
+            if cached_build(open_render_cache(), 'weasyprint', {}, output,
+                            lambda stream: generate_pdf(pdf_path=stream)):
+                print(f"Unchanged; copied from the render cache to {output_name(output)}")
+        else:
+            generate_pdf(pdf_path=output, dry_run=args.dry_run)
@@ -5,28 +5,41 @@ Converts markdown content to a professionally formatted PDF book.
 Published by ALAM-ACADEMY
 """
 
-from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, cm
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, PageBreak, 
-    Table, TableStyle, KeepTogether, Image
-)
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.lib.colors import HexColor
-import re
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+import argparse
 from pathlib import Path
 
+import book_nodes
+from book_parser import (
+    CACHE_DIR, load_document, open_cache, parse_cached, parse_markdown, resolve_sources,
+)
+from pdf_output import STDOUT, open_output, output_name
+from reproducible import enable_reproducible
+from inline_markdown import plain_text, to_reportlab
+from lazy_import import LazyModule
+
+# Imported on first use, so --help and a missing markdown file return without loading ReportLab
+colors = LazyModule('reportlab.lib.colors')
+platypus = LazyModule('reportlab.platypus')
+rl_styles = LazyModule('reportlab.lib.styles')
+book_flowables = LazyModule('book_flowables')
+book_toc = LazyModule('book_toc')
+
 
 class AIBackBookGenerator:
-    """Generate a professional PDF book from markdown content."""
+    """Generate a professional PDF book from markdown content.
+
+    ``output_path`` is a file path or any writable binary stream, such as
+    ``sys.stdout.buffer``, a BytesIO or a socket's ``makefile('wb')``.
+    """
     
-    def __init__(self, output_path: str):
+    def __init__(self, output_path, cache_dir=CACHE_DIR):
         self.output_path = output_path
-        self.doc = SimpleDocTemplate(
+        self.cache_dir = cache_dir
+        self.cache = open_cache(cache_dir)
+        self.doc = book_toc.PageRefDocTemplate(
             output_path,
             pagesize=A4,
             rightMargin=2.5*cm,
@@ -34,19 +47,40 @@ class AIBackBookGenerator:
             topMargin=2.5*cm,
             bottomMargin=2.5*cm
         )
-        self.styles = getSampleStyleSheet()
+        self.styles = rl_styles.getSampleStyleSheet()
         self.story = []
         self._setup_styles()
+        
+        # Node type -> handler, and per-level / per-style formatting
+        self._handlers = {
+            book_nodes.Heading: self._add_heading,
+            book_nodes.Paragraph: self._add_paragraph,
+            book_nodes.ListBlock: self._add_list,
+            book_nodes.OrderedList: self._add_list,
+            book_nodes.CodeBlock: self._add_code,
+            book_nodes.Table: self._add_table,
+            book_nodes.Rule: self._add_rule,
+        }
+        self._heading_formats = {
+            2: (20, 'AISection', '{}'),
+            3: (15, 'AISubsection', '{}'),
+            4: (10, 'AIBodyText', '<b>{}</b>'),
+        }
+        self._paragraph_formats = {
+            book_nodes.BODY: '{}',
+            book_nodes.BOLD: '<b>{}</b>',
+        }
+        self._toc_count = 0
     
     def _setup_styles(self):
         """Configure custom paragraph styles."""
         
         # Title style
-        self.styles.add(ParagraphStyle(
+        self.styles.add(rl_styles.ParagraphStyle(
             name='AICustomTitle',
             parent=self.styles['Heading1'],
             fontSize=28,
-            textColor=HexColor('#1e3a5f'),
+            textColor=colors.HexColor('#1e3a5f'),
             spaceAfter=30,
             alignment=TA_CENTER,
             fontName='Helvetica-Bold',
@@ -54,11 +88,11 @@ class AIBackBookGenerator:
         ))
         
         # Subtitle style
-        self.styles.add(ParagraphStyle(
+        self.styles.add(rl_styles.ParagraphStyle(
             name='AISubtitle',
             parent=self.styles['Normal'],
             fontSize=14,
-            textColor=HexColor('#4a5568'),
+            textColor=colors.HexColor('#4a5568'),
             spaceAfter=20,
             alignment=TA_CENTER,
             fontName='Helvetica',
@@ -66,11 +100,11 @@ class AIBackBookGenerator:
         ))
         
         # Chapter title style
-        self.styles.add(ParagraphStyle(
+        self.styles.add(rl_styles.ParagraphStyle(
             name='AIChapterTitle',
             parent=self.styles['Heading1'],
             fontSize=20,
-            textColor=HexColor('#1e3a5f'),
+            textColor=colors.HexColor('#1e3a5f'),
             spaceAfter=20,
             spaceBefore=30,
             fontName='Helvetica-Bold',
@@ -79,11 +113,11 @@ class AIBackBookGenerator:
         ))
         
         # Section style
-        self.styles.add(ParagraphStyle(
+        self.styles.add(rl_styles.ParagraphStyle(
             name='AISection',
             parent=self.styles['Heading2'],
             fontSize=16,
-            textColor=HexColor('#2c5282'),
+            textColor=colors.HexColor('#2c5282'),
             spaceAfter=15,
             spaceBefore=25,
             fontName='Helvetica-Bold',
@@ -91,11 +125,11 @@ class AIBackBookGenerator:
         ))
         
         # Subsection style
-        self.styles.add(ParagraphStyle(
+        self.styles.add(rl_styles.ParagraphStyle(
             name='AISubsection',
             parent=self.styles['Heading3'],
             fontSize=13,
-            textColor=HexColor('#2d3748'),
+            textColor=colors.HexColor('#2d3748'),
             spaceAfter=12,
             spaceBefore=18,
             fontName='Helvetica-Bold',
@@ -103,11 +137,11 @@ class AIBackBookGenerator:
         ))
         
         # Body text style
-        self.styles.add(ParagraphStyle(
+        self.styles.add(rl_styles.ParagraphStyle(
             name='AIBodyText',
             parent=self.styles['Normal'],
             fontSize=11,
-            textColor=HexColor('#1a1a1a'),
+            textColor=colors.HexColor('#1a1a1a'),
             spaceAfter=12,
             alignment=TA_JUSTIFY,
             fontName='Times-Roman',
@@ -115,12 +149,12 @@ class AIBackBookGenerator:
         ))
         
         # Code style
-        self.styles.add(ParagraphStyle(
+        self.styles.add(rl_styles.ParagraphStyle(
             name='AICode',
             parent=self.styles['Normal'],
             fontSize=9,
-            textColor=HexColor('#e2e8f0'),
-            backColor=HexColor('#1a202c'),
+            textColor=colors.HexColor('#e2e8f0'),
+            backColor=colors.HexColor('#1a202c'),
             spaceAfter=15,
             spaceBefore=15,
             fontName='Courier',
@@ -128,25 +162,25 @@ class AIBackBookGenerator:
         ))
         
         # Quote style
-        self.styles.add(ParagraphStyle(
+        self.styles.add(rl_styles.ParagraphStyle(
             name='AIQuote',
             parent=self.styles['Normal'],
             fontSize=11,
-            textColor=HexColor('#4a5568'),
+            textColor=colors.HexColor('#4a5568'),
             leftIndent=20,
             rightIndent=20,
-            backColor=HexColor('#ebf8ff'),
+            backColor=colors.HexColor('#ebf8ff'),
             borderPadding=10,
             fontName='Times-Italic',
             leading=16
         ))
         
         # Publisher info style
-        self.styles.add(ParagraphStyle(
+        self.styles.add(rl_styles.ParagraphStyle(
             name='AIPublisherInfo',
             parent=self.styles['Normal'],
             fontSize=12,
-            textColor=HexColor('#1a202c'),
+            textColor=colors.HexColor('#1a202c'),
             spaceAfter=10,
             alignment=TA_CENTER,
             fontName='Helvetica',
@@ -154,11 +188,11 @@ class AIBackBookGenerator:
         ))
         
         # Copyright style
-        self.styles.add(ParagraphStyle(
+        self.styles.add(rl_styles.ParagraphStyle(
             name='AICopyright',
             parent=self.styles['Normal'],
             fontSize=9,
-            textColor=HexColor('#666666'),
+            textColor=colors.HexColor('#666666'),
             spaceAfter=8,
             alignment=TA_CENTER,
             fontName='Times-Roman',
@@ -166,168 +200,99 @@ class AIBackBookGenerator:
         ))
         
         # TOC entry style
-        self.styles.add(ParagraphStyle(
+        self.styles.add(rl_styles.ParagraphStyle(
             name='AITOCEntry',
             parent=self.styles['Normal'],
             fontSize=10,
-            textColor=HexColor('#1a1a1a'),
+            textColor=colors.HexColor('#1a1a1a'),
             spaceAfter=6,
             fontName='Times-Roman',
-            leading=14
+            leading=14,
+            rightIndent=book_toc.PAGE_REF_WIDTH
+        ))
+        
+        self.styles.add(rl_styles.ParagraphStyle(
+            name='AITOCSection',
+            parent=self.styles['AITOCEntry'],
+            leftIndent=15
         ))
         
         # List item style
-        self.styles.add(ParagraphStyle(
+        self.styles.add(rl_styles.ParagraphStyle(
             name='AIListItem',
             parent=self.styles['Normal'],
             fontSize=11,
-            textColor=HexColor('#1a1a1a'),
+            textColor=colors.HexColor('#1a1a1a'),
             spaceAfter=8,
             leftIndent=20,
             fontName='Times-Roman',
             leading=16
         ))
 
-    def _parse_markdown(self, content: str) -> list:
-        """Parse markdown content into structured elements."""
-        elements = []
-        lines = content.split('\n')
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Skip empty lines
-            if not line:
-                i += 1
-                continue
-            
-            # Title page markers
-            if line.startswith('## Title Page'):
-                i += 1
-                continue
-            
-            # Main title (H1)
-            if line.startswith('# ') and not line.startswith('##'):
-                text = line[2:].strip()
-                elements.append(('h1', text))
-                i += 1
-            
-            # Section (H2)
-            elif line.startswith('## '):
-                text = line[3:].strip()
-                elements.append(('h2', text))
-                i += 1
-            
-            # Subsection (H3)
-            elif line.startswith('### '):
-                text = line[4:].strip()
-                elements.append(('h3', text))
-                i += 1
-            
-            # Sub-subsection (H4)
-            elif line.startswith('#### '):
-                text = line[5:].strip()
-                elements.append(('h4', text))
-                i += 1
-            
-            # Bold text as paragraph
-            elif line.startswith('**') and line.endswith('**'):
-                text = line[2:-2].strip()
-                elements.append(('bold', text))
-                i += 1
-            
-            # List items
-            elif line.startswith('- '):
-                list_items = []
-                while i < len(lines) and lines[i].strip().startswith('- '):
-                    text = lines[i].strip()[2:].strip()
-                    list_items.append(text)
-                    i += 1
-                elements.append(('list', list_items))
-            
-            # Code blocks
-            elif line.startswith('```'):
-                code_lines = []
-                i += 1
-                while i < len(lines) and not lines[i].strip().startswith('```'):
-                    code_lines.append(lines[i])
-                    i += 1
-                elements.append(('code', '\n'.join(code_lines)))
-                i += 1
-            
-            # Regular paragraph
-            else:
-                # Collect paragraph lines
-                para_lines = []
-                while i < len(lines) and lines[i].strip() and not any([
-                    lines[i].strip().startswith('#'),
-                    lines[i].strip().startswith('- '),
-                    lines[i].strip().startswith('**'),
-                    lines[i].strip().startswith('```'),
-                ]):
-                    para_lines.append(lines[i].strip())
-                    i += 1
-                if para_lines:
-                    elements.append(('p', ' '.join(para_lines)))
-        
-        return elements
+    def _parse_markdown(self, source):
+        """Parse markdown into book_nodes, yielding them lazily."""
+        return parse_markdown(source)
+
+    def _parse_cached(self, source):
+        """Parse markdown, loading unchanged sections from the cache."""
+        return parse_cached(source, self.cache)
 
     def _add_title_page(self):
         """Add the book title page."""
         
         # Title
-        self.story.append(Spacer(1, 1.5*inch))
-        self.story.append(Paragraph("COMPREHENSIVE GUIDE TO", self.styles['AISubtitle']))
-        self.story.append(Paragraph("ARTIFICIAL INTELLIGENCE", self.styles['AICustomTitle']))
-        self.story.append(Spacer(1, 0.5*inch))
+        self.story.append(platypus.Spacer(1, 1.5*inch))
+        self.story.append(platypus.Paragraph("COMPREHENSIVE GUIDE TO", self.styles['AISubtitle']))
+        self.story.append(platypus.Paragraph("ARTIFICIAL INTELLIGENCE", self.styles['AICustomTitle']))
+        self.story.append(platypus.Spacer(1, 0.5*inch))
         
         # Subtitle
-        self.story.append(Paragraph(
+        self.story.append(platypus.Paragraph(
             "Theory, Applications, Software & Hardware",
             self.styles['AISubtitle']
         ))
-        self.story.append(Paragraph(
+        self.story.append(platypus.Paragraph(
             "A Complete Guide for Students, Professionals, and Enthusiasts",
             self.styles['AISubtitle']
         ))
         
         # Publisher info
-        self.story.append(Spacer(1, 1*inch))
-        self.story.append(Paragraph("Published by:", self.styles['AIPublisherInfo']))
-        self.story.append(Paragraph("ALAM-ACADEMY", self.styles['AIChapterTitle']))
+        self.story.append(platypus.Spacer(1, 1*inch))
+        self.story.append(platypus.Paragraph("Published by:", self.styles['AIPublisherInfo']))
+        self.story.append(platypus.Paragraph("ALAM-ACADEMY", self.styles['AIChapterTitle']))
         
-        self.story.append(Spacer(1, 0.5*inch))
-        self.story.append(Paragraph("Owner: M IFTIKHAR ALAM", self.styles['AIPublisherInfo']))
-        self.story.append(Paragraph("Email: alammiftikhar@gmail.com", self.styles['AIPublisherInfo']))
-        self.story.append(Paragraph("Contact: 0333-9257987", self.styles['AIPublisherInfo']))
-        self.story.append(Paragraph("Address: Karachi, PAKISTAN", self.styles['AIPublisherInfo']))
+        self.story.append(platypus.Spacer(1, 0.5*inch))
+        self.story.append(platypus.Paragraph("Owner: M IFTIKHAR ALAM", self.styles['AIPublisherInfo']))
+        self.story.append(platypus.Paragraph("Email: alammiftikhar@gmail.com",
+                                             self.styles['AIPublisherInfo']))
+        self.story.append(platypus.Paragraph("Contact: 0333-9257987", self.styles['AIPublisherInfo']))
+        self.story.append(platypus.Paragraph("Address: Karachi, PAKISTAN", self.styles['AIPublisherInfo']))
         
         # Copyright
-        self.story.append(Spacer(1, 0.8*inch))
-        self.story.append(Paragraph("Copyright © 2026 ALAM-ACADEMY", self.styles['AICopyright']))
-        self.story.append(Paragraph("All Rights Reserved", self.styles['AICopyright']))
-        self.story.append(Paragraph("First Edition: 2026", self.styles['AICopyright']))
+        self.story.append(platypus.Spacer(1, 0.8*inch))
+        self.story.append(platypus.Paragraph("Copyright © 2026 ALAM-ACADEMY", self.styles['AICopyright']))
+        self.story.append(platypus.Paragraph("All Rights Reserved", self.styles['AICopyright']))
+        self.story.append(platypus.Paragraph("First Edition: 2026", self.styles['AICopyright']))
         
-        self.story.append(PageBreak())
+        self.story.append(platypus.PageBreak())
 
     def _add_dedication(self):
         """Add dedication page."""
-        self.story.append(Spacer(1, 2*inch))
-        self.story.append(Paragraph("DEDICATION", self.styles['AISection']))
-        self.story.append(Spacer(1, 0.5*inch))
-        self.story.append(Paragraph(
+        self.story.append(platypus.Spacer(1, 2*inch))
+        self.story.append(platypus.Paragraph("DEDICATION", self.styles['AISection']))
+        self.story.append(platypus.Spacer(1, 0.5*inch))
+        self.story.append(platypus.Paragraph(
             "This book is dedicated to all the students, researchers, and professionals "
             "who are passionate about Artificial Intelligence and want to contribute to "
             "the advancement of this transformative technology for the benefit of humanity.",
             self.styles['AIBodyText']
         ))
-        self.story.append(PageBreak())
+        self.story.append(platypus.PageBreak())
 
     def _add_preface(self):
         """Add preface page."""
-        self.story.append(Paragraph("PREFACE", self.styles['AIChapterTitle']))
-        self.story.append(Paragraph(
+        self.story.append(platypus.Paragraph("PREFACE", self.styles['AIChapterTitle']))
+        self.story.append(platypus.Paragraph(
             "Artificial Intelligence (AI) has emerged as one of the most transformative "
             "technologies of the 21st century. From healthcare to finance, from transportation "
             "to entertainment, AI is reshaping every aspect of our lives. This comprehensive "
@@ -335,172 +300,249 @@ class AIBackBookGenerator:
             "practical applications, software tools, and hardware requirements.",
             self.styles['AIBodyText']
         ))
-        self.story.append(Paragraph(
+        self.story.append(platypus.Paragraph(
             "The book is structured to serve multiple audiences: students beginning their "
             "journey in AI, professionals looking to transition into AI careers, researchers "
             "seeking a comprehensive reference, business leaders wanting to understand AI "
             "implementation, and enthusiasts curious about this fascinating field.",
             self.styles['AIBodyText']
         ))
-        self.story.append(Paragraph(
+        self.story.append(platypus.Paragraph(
             "Each chapter builds upon previous knowledge, ensuring a smooth learning curve "
             "from fundamental concepts to advanced topics.",
             self.styles['AIBodyText']
         ))
-        self.story.append(PageBreak())
-
-    def _add_table_of_contents(self):
-        """Add table of contents."""
-        self.story.append(Paragraph("TABLE OF CONTENTS", self.styles['AIChapterTitle']))
-        
-        toc_data = [
-            ("PART I: FOUNDATIONS OF ARTIFICIAL INTELLIGENCE", ""),
-            ("Chapter 1: Introduction to Artificial Intelligence", "1"),
-            ("Chapter 2: Mathematical Foundations for AI", "15"),
-            ("Chapter 3: Programming for AI", "28"),
-            ("PART II: MACHINE LEARNING FUNDAMENTALS", ""),
-            ("Chapter 4: Introduction to Machine Learning", "42"),
-            ("Chapter 5: Supervised Learning Algorithms", "55"),
-            ("Chapter 6: Unsupervised Learning Algorithms", "70"),
-            ("Chapter 7: Ensemble Methods and Advanced ML", "85"),
-            ("PART III: DEEP LEARNING AND NEURAL NETWORKS", ""),
-            ("Chapter 8: Neural Networks Fundamentals", "98"),
-            ("Chapter 9: Deep Learning Architectures", "115"),
-            ("Chapter 10: Training Deep Neural Networks", "132"),
-            ("PART IV: SPECIALIZED AI DOMAINS", ""),
-            ("Chapter 11: Natural Language Processing", "148"),
-            ("Chapter 12: Computer Vision", "168"),
-            ("Chapter 13: Speech and Audio Processing", "185"),
-            ("Chapter 14: Robotics and Autonomous Systems", "198"),
-            ("Chapter 15: Reinforcement Learning", "212"),
-            ("PART V: AI SOFTWARE AND TOOLS", ""),
-            ("Chapter 16: AI Development Frameworks", "228"),
-            ("Chapter 17: Data Science Tools for AI", "245"),
-            ("Chapter 18: NLP Libraries and Tools", "258"),
-            ("Chapter 19: Computer Vision Libraries", "270"),
-            ("Chapter 20: MLOps and Deployment", "282"),
-            ("PART VI: AI HARDWARE", ""),
-            ("Chapter 21: Computing Hardware for AI", "298"),
-            ("Chapter 22: Building AI Workstations", "312"),
-            ("Chapter 23: Edge AI and IoT Hardware", "325"),
-            ("Chapter 24: Cloud Infrastructure for AI", "338"),
-            ("PART VII: ADVANCED TOPICS", ""),
-            ("Chapter 25: Generative AI", "352"),
-            ("Chapter 26: Explainable AI (XAI)", "368"),
-            ("Chapter 27: AI Ethics and Responsible AI", "380"),
-            ("Chapter 28: AI Safety and Alignment", "395"),
-            ("PART VIII: INDUSTRY APPLICATIONS", ""),
-            ("Chapter 29: AI in Healthcare", "408"),
-            ("Chapter 30: AI in Finance", "422"),
-            ("Chapter 31: AI in Manufacturing", "435"),
-            ("Chapter 32: AI in Retail and E-commerce", "448"),
-            ("Chapter 33: AI in Transportation", "460"),
-            ("Chapter 34: AI in Education", "472"),
-            ("PART IX: CAREER AND BUSINESS", ""),
-            ("Chapter 35: AI Career Paths", "485"),
-            ("Chapter 36: Building AI Products", "498"),
-            ("Chapter 37: AI Startup Guide", "510"),
-            ("PART X: FUTURE OF AI", ""),
-            ("Chapter 38: Emerging Trends in AI", "525"),
-            ("Chapter 39: Artificial General Intelligence (AGI)", "538"),
-            ("Chapter 40: AI and the Future of Work", "550"),
-            ("APPENDICES", ""),
-            ("Appendix A: Python Quick Reference", "565"),
-            ("Appendix B: Mathematics Reference", "575"),
-            ("Appendix C: AI Glossary", "585"),
-            ("Appendix D: Resources and Further Reading", "595"),
-            ("Appendix E: Practice Exercises and Solutions", "605"),
-            ("INDEX", "620"),
-        ]
-        
-        for title, page in toc_data:
-            if page:
-                text = f"{title}  .................................................................... {page}"
+        self.story.append(platypus.PageBreak())
+
+    def _load_nodes(self, markdown_path, jobs: int = None) -> list:
+        """Parse one markdown file or a list of chapter files into nodes."""
+        print("Parsing markdown...")
+        paths = markdown_path if isinstance(markdown_path, (list, tuple)) else [markdown_path]
+        return load_document(paths, self.cache_dir, jobs)
+
+    def _toc_entries(self, nodes) -> list:
+        """Return ``(level, text)`` for each H1 and H2 heading in ``nodes``."""
+        return [(node.level, node.text) for node in nodes
+                if type(node) is book_nodes.Heading and node.level <= 2]
+
+    def _add_table_of_contents(self, entries):
+        """Add the table of contents for ``entries`` from _toc_entries().
+
+        Page numbers are page references resolved when the PDF is saved.
+        """
+        self.story.append(platypus.Paragraph("TABLE OF CONTENTS", self.styles['AIChapterTitle']))
+        
+        for index, (level, title) in enumerate(entries):
+            text = to_reportlab(title) + book_toc.page_ref(f"toc{index}")
+            if level == 1:
+                self.story.append(platypus.Spacer(1, 8))
+                self.story.append(platypus.Paragraph(f"<b>{text}</b>", self.styles['AITOCEntry']))
             else:
-                text = f"\n<b>{title}</b>"
-            self.story.append(Paragraph(text, self.styles['AITOCEntry']))
-        
-        self.story.append(PageBreak())
-
-    def _add_content(self, markdown_path: str):
-        """Add main content from markdown file."""
-        
-        with open(markdown_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        elements = self._parse_markdown(content)
-        
-        skip_until_next_h1 = False
-        
-        for elem_type, elem_data in elements:
-            if elem_type == 'h1':
-                # Skip title page and TOC headers
-                if 'Title Page' in elem_data or 'TABLE OF CONTENTS' in elem_data:
-                    skip_until_next_h1 = True
-                    continue
-                elif 'DEDICATION' in elem_data or 'PREFACE' in elem_data:
-                    continue
-                elif 'PART' in elem_data:
-                    self.story.append(PageBreak())
-                    self.story.append(Paragraph(elem_data, self.styles['AIChapterTitle']))
-                    skip_until_next_h1 = False
-                elif not skip_until_next_h1:
-                    self.story.append(PageBreak())
-                    self.story.append(Paragraph(elem_data, self.styles['AIChapterTitle']))
-            
-            elif elem_type == 'h2' and not skip_until_next_h1:
-                self.story.append(Spacer(1, 20))
-                self.story.append(Paragraph(elem_data, self.styles['AISection']))
-            
-            elif elem_type == 'h3' and not skip_until_next_h1:
-                self.story.append(Spacer(1, 15))
-                self.story.append(Paragraph(elem_data, self.styles['AISubsection']))
-            
-            elif elem_type == 'h4' and not skip_until_next_h1:
-                self.story.append(Spacer(1, 10))
-                self.story.append(Paragraph(f"<b>{elem_data}</b>", self.styles['AIBodyText']))
-            
-            elif elem_type == 'bold' and not skip_until_next_h1:
-                self.story.append(Spacer(1, 8))
-                self.story.append(Paragraph(f"<b>{elem_data}</b>", self.styles['AIBodyText']))
-            
-            elif elem_type == 'list' and not skip_until_next_h1:
-                for item in elem_data:
-                    # Handle bullet points
-                    text = f"• {item}"
-                    self.story.append(Paragraph(text, self.styles['AIListItem']))
-            
-            elif elem_type == 'code' and not skip_until_next_h1:
-                # Format code for PDF
-                code_text = elem_data.replace('<', '&lt;').replace('>', '&gt;')
-                self.story.append(Spacer(1, 10))
-                self.story.append(Paragraph(f"<font name='Courier'>{code_text}</font>", self.styles['AICode']))
-            
-            elif elem_type == 'p' and not skip_until_next_h1:
-                self.story.append(Spacer(1, 8))
-                self.story.append(Paragraph(elem_data, self.styles['AIBodyText']))
+                self.story.append(platypus.Paragraph(text, self.styles['AITOCSection']))
+        
+        self.story.append(platypus.PageBreak())
+
+    def _set_page_offsets(self, page_offsets: dict):
+        """Resolve TOC keys laid out in later parts, counted from the end of this one."""
+        self.doc.page_offsets = page_offsets
+
+    def _anchor_heading(self, paragraph, node):
+        """Make ``paragraph`` the target of the next TOC entry."""
+        key = f"toc{self._toc_count}"
+        self._toc_count += 1
+        return book_toc.anchor(paragraph, key, plain_text(node.text), node.level - 1)
+
+    def _add_elements(self, nodes):
+        """Append flowables for parsed nodes as they are produced."""
+        
+        handlers = self._handlers
+        
+        for node in nodes:
+            handlers[type(node)](node)
+
+    def _add_heading(self, node):
+        """Add a heading; H1 starts a new page."""
+        text = to_reportlab(node.text)
+        if node.level == 1:
+            if not (self.story and isinstance(self.story[-1], platypus.PageBreak)):
+                self.story.append(platypus.PageBreak())
+            title = platypus.Paragraph(text, self.styles['AIChapterTitle'])
+            self.story.append(self._anchor_heading(title, node))
+            return
+        
+        space, style, markup = self._heading_formats[node.level]
+        self.story.append(platypus.Spacer(1, space))
+        heading = platypus.Paragraph(markup.format(text), self.styles[style])
+        if node.level == 2:
+            heading = self._anchor_heading(heading, node)
+        self.story.append(heading)
+
+    def _add_paragraph(self, node):
+        """Add a body paragraph (bold paragraphs are wrapped in <b>)."""
+        self.story.append(platypus.Spacer(1, 8))
+        markup = self._paragraph_formats[node.style]
+        self.story.append(platypus.Paragraph(markup.format(to_reportlab(node.text)),
+                                             self.styles['AIBodyText']))
+
+    def _add_list(self, node, depth: int = 0):
+        """Add one bulleted or numbered paragraph per list item, indenting nested lists."""
+        style = self._list_style(depth)
+        ordered = isinstance(node, book_nodes.OrderedList)
+        for number, (item, child) in enumerate(node.entries(), node.start if ordered else 1):
+            marker = f"{number}." if ordered else "•"
+            self.story.append(platypus.Paragraph(f"{marker} {to_reportlab(item)}", style))
+            if child:
+                self._add_list(child, depth + 1)
+
+    def _list_style(self, depth: int):
+        """Return the list item style for lists nested ``depth`` levels deep."""
+        if not depth:
+            return self.styles['AIListItem']
+        name = f'AIListItem{depth}'
+        if name not in self.styles:
+            self.styles.add(rl_styles.ParagraphStyle(name=name, parent=self.styles['AIListItem'],
+                                                     leftIndent=20 * (depth + 1)))
+        return self.styles[name]
+
+    def _add_code(self, node):
+        """Add a code listing, highlighted if it is Python."""
+        self.story.append(platypus.Spacer(1, 10))
+        self.story.append(book_flowables.CodeListing(node.text, self.styles['AICode'], node.language,
+                                                     theme='dark'))
+
+    def _add_table(self, node):
+        """Add a GFM table as a LongTable with precomputed column widths."""
+        self.story.append(platypus.Spacer(1, 10))
+        self.story.append(book_flowables.build_long_table(node.header, node.rows, self.doc.width, node.align))
+        self.story.append(platypus.Spacer(1, 10))
+
+    def _add_rule(self, node):
+        """Add a thin horizontal rule for a thematic break."""
+        self.story.append(platypus.HRFlowable(width='100%', thickness=1, color=colors.HexColor('#e2e8f0'),
+                                              spaceBefore=10, spaceAfter=10))
+
+    def _book_parts(self, nodes, entries: list):
+        """Split the book into parts that each start on a new page.
+
+        Returns the parts as lists of ``(method_name, args)`` calls for
+        book_build (the front matter, one part per chapter cut at the H1
+        headings, and the publisher page) and the index of the first TOC
+        entry in each part after the front matter. A chapter part numbers
+        its own anchors from zero, so its calls, and its cache key, do not
+        depend on the chapters before it.
+        """
+        parts = [[('_add_title_page', ()), ('_add_dedication', ()),
+                  ('_add_preface', ()), ('_add_table_of_contents', (entries,))]]
+        toc_starts = []
+        chapter = []
+        toc_count = chapter_start = 0
+        for node in nodes:
+            if type(node) is book_nodes.Heading and node.level <= 2:
+                if node.level == 1 and chapter:
+                    parts.append([('_add_elements', (chapter,))])
+                    toc_starts.append(chapter_start)
+                    chapter = []
+                    chapter_start = toc_count
+                toc_count += 1
+            chapter.append(node)
+        if chapter:
+            parts.append([('_add_elements', (chapter,))])
+            toc_starts.append(chapter_start)
+        parts.append([('_add_publisher_page', ())])
+        toc_starts.append(toc_count)
+        return parts, toc_starts
+
+    def _generate_parallel(self, markdown_path, jobs: int = None, nodes=None, incremental: bool = False):
+        """Lay out each chapter in its own process and join the parts.
+
+        The front matter is laid out last, in this process, once the
+        chapters' page counts and heading pages are known for its table
+        of contents. With ``incremental`` only chapters that changed
+        since the last build are laid out again.
+        """
+        from book_build import (
+            join_parts, open_part_cache, part_pages, render_cached, render_part, render_parts,
+        )
+        
+        if nodes is None:
+            nodes = self._load_nodes(markdown_path, jobs)
+        
+        entries = self._toc_entries(nodes)
+        parts, toc_starts = self._book_parts(nodes, entries)
+        front, chapters = parts[0], parts[1:]
+        
+        print(f"Rendering {len(chapters)} parts in parallel...")
+        if incremental:
+            pdfs = render_cached(AIBackBookGenerator, chapters, open_part_cache(), jobs)
+        else:
+            pdfs = render_parts(AIBackBookGenerator, chapters, jobs)
+        
+        # TOC keys in each chapter part, in the order their headings were laid out
+        page_offsets = {}
+        pages_before = 0
+        for pdf, start in zip(pdfs, toc_starts):
+            page_count, heading_pages = part_pages(pdf)
+            for index, page in enumerate(heading_pages, start):
+                page_offsets[f"toc{index}"] = pages_before + page
+            pages_before += page_count
+        
+        print("Rendering front matter...")
+        front_pdf = render_part(AIBackBookGenerator, front + [('_set_page_offsets', (page_offsets,))])
+        join_parts([front_pdf] + pdfs, self.output_path)
 
     def _add_publisher_page(self):
         """Add publisher information page."""
-        self.story.append(PageBreak())
-        self.story.append(Paragraph("ABOUT THE PUBLISHER", self.styles['AIChapterTitle']))
-        self.story.append(Spacer(1, 20))
-        self.story.append(Paragraph(
+        self.story.append(platypus.PageBreak())
+        self.story.append(platypus.Paragraph("ABOUT THE PUBLISHER", self.styles['AIChapterTitle']))
+        self.story.append(platypus.Spacer(1, 20))
+        self.story.append(platypus.Paragraph(
             "<b>ALAM-ACADEMY</b> is a leading educational publisher based in Karachi, Pakistan, "
             "dedicated to providing high-quality educational materials in emerging technologies. "
             "Founded by M Iftikhar Alam, the academy focuses on making complex technical subjects "
             "accessible to students and professionals across South Asia and beyond.",
             self.styles['AIBodyText']
         ))
-        self.story.append(Spacer(1, 30))
-        self.story.append(Paragraph("Contact Information:", self.styles['AISection']))
-        self.story.append(Paragraph("Owner: M IFTIKHAR ALAM", self.styles['AIPublisherInfo']))
-        self.story.append(Paragraph("Email: alammiftikhar@gmail.com", self.styles['AIPublisherInfo']))
-        self.story.append(Paragraph("Phone: 0333-9257987", self.styles['AIPublisherInfo']))
-        self.story.append(Paragraph("Address: Karachi, PAKISTAN", self.styles['AIPublisherInfo']))
+        self.story.append(platypus.Spacer(1, 30))
+        self.story.append(platypus.Paragraph("Contact Information:", self.styles['AISection']))
+        self.story.append(platypus.Paragraph("Owner: M IFTIKHAR ALAM", self.styles['AIPublisherInfo']))
+        self.story.append(platypus.Paragraph("Email: alammiftikhar@gmail.com",
+                                             self.styles['AIPublisherInfo']))
+        self.story.append(platypus.Paragraph("Phone: 0333-9257987", self.styles['AIPublisherInfo']))
+        self.story.append(platypus.Paragraph("Address: Karachi, PAKISTAN", self.styles['AIPublisherInfo']))
 
-    def generate(self, markdown_path: str):
-        """Generate the complete PDF book."""
+    def generate(self, markdown_path=None, jobs: int = None, nodes=None, parallel: bool = False,
+                 incremental: bool = False, dry_run: bool = False):
+        """Generate the complete PDF book.
+
+        ``markdown_path`` is one markdown file, or a list of chapter files
+        that are parsed in parallel by ``jobs`` processes. Alternatively
+        ``nodes`` passes a document already parsed by book_parser. With
+        ``parallel`` each chapter is also laid out in its own process, and
+        with ``incremental`` unchanged chapters are reused from the cache.
+        With ``dry_run`` the book is only laid out and its page count and
+        chapter start pages are printed; no PDF is written.
+        """
+        
+        if dry_run:
+            self._generate_serial(markdown_path, jobs, nodes, dry_run=True)
+            return
+        
+        if parallel or incremental:
+            self._generate_parallel(markdown_path, jobs, nodes, incremental)
+        else:
+            self._generate_serial(markdown_path, jobs, nodes)
+        
+        print(f"\n{'='*60}")
+        print("PDF Generation Complete!")
+        print(f"{'='*60}")
+        print(f"Output file: {output_name(self.output_path)}")
+        print(f"Publisher: ALAM-ACADEMY")
+        print(f"Owner: M IFTIKHAR ALAM")
+        print(f"Contact: alammiftikhar@gmail.com | 0333-9257987")
+        print(f"{'='*60}")
+
+    def _generate_serial(self, markdown_path, jobs: int = None, nodes=None, dry_run: bool = False):
+        """Build the whole story and lay it out in one pass."""
         
         print("Building title page...")
         self._add_title_page()
@@ -511,41 +553,93 @@ class AIBackBookGenerator:
         print("Building preface...")
         self._add_preface()
         
+        if nodes is None:
+            nodes = self._load_nodes(markdown_path, jobs)
+        
         print("Building table of contents...")
-        self._add_table_of_contents()
+        self._add_table_of_contents(self._toc_entries(nodes))
         
         print("Building main content...")
-        self._add_content(markdown_path)
+        self._add_elements(nodes)
         
         print("Building publisher page...")
         self._add_publisher_page()
         
+        if dry_run:
+            from dry_run import report_layout
+
+            print("Laying out pages...")
+            report_layout(self.doc, self.story, ['AIChapterTitle'])
+            return
+        
         print("Writing PDF file...")
         self.doc.build(self.story)
-        
-        print(f"\n{'='*60}")
-        print("PDF Generation Complete!")
-        print(f"{'='*60}")
-        print(f"Output file: {self.output_path}")
-        print(f"Publisher: ALAM-ACADEMY")
-        print(f"Owner: M IFTIKHAR ALAM")
-        print(f"Contact: alammiftikhar@gmail.com | 0333-9257987")
-        print(f"{'='*60}")
 
 
 def main():
     """Main entry point."""
     base_path = Path(__file__).parent
-    markdown_path = base_path / 'AI_Comprehensive_Guide.md'
-    output_path = base_path / 'AI_Comprehensive_Guide.pdf'
     
-    if not markdown_path.exists():
-        print(f"Error: Markdown file not found at {markdown_path}")
+    parser = argparse.ArgumentParser(description="Generate the AI book PDF from markdown.")
+    parser.add_argument('source', nargs='?', default=str(base_path / 'AI_Comprehensive_Guide.md'),
+                        help="markdown file, directory of chapter files, or glob pattern "
+                             "(default: AI_Comprehensive_Guide.md)")
+    parser.add_argument('-o', '--output', default=str(base_path / 'AI_Comprehensive_Guide.pdf'),
+                        help=f"output PDF path, or {STDOUT} to write the PDF to standard output")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="worker processes for chapter directories and --parallel "
+                             "(default: CPU count)")
+    parser.add_argument('--parallel', action='store_true',
+                        help="lay out each chapter in its own process and join the parts")
+    parser.add_argument('--incremental', action='store_true',
+                        help="reuse cached chapter layouts and re-render only changed chapters")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="lay out the book and report its page count without writing a PDF")
+    parser.add_argument('--reproducible', action='store_true',
+                        help="byte-identical output for identical input, dated from SOURCE_DATE_EPOCH")
+    parser.add_argument('--weasyprint-output', metavar='PDF',
+                        help="also render PDF with the WeasyPrint generator from the same parse")
+    parser.add_argument('--cache', action='store_true',
+                        help="copy the PDF from the render cache if nothing it depends on has changed")
+    args = parser.parse_args()
+    
+    if args.reproducible:
+        enable_reproducible()
+    
+    markdown_paths = resolve_sources(args.source)
+    if not markdown_paths:
+        print(f"Error: Markdown file not found at {args.source}")
         return
     
-    generator = AIBackBookGenerator(str(output_path))
-    generator.generate(str(markdown_path))
-
+    def build(output):
+        generator = AIBackBookGenerator(output)
+        if args.weasyprint_output:
+            # Dual-format build: parse once and render both backends from it
+            from generate_pdf import generate_pdf
+        
+            print("Parsing markdown...")
+            nodes = load_document(markdown_paths, generator.cache_dir, args.jobs)
+            generator.generate(nodes=nodes, jobs=args.jobs, parallel=args.parallel,
+                               incremental=args.incremental, dry_run=args.dry_run)
+            generate_pdf(nodes=nodes, pdf_path=args.weasyprint_output, dry_run=args.dry_run)
+        elif len(markdown_paths) == 1 and not Path(args.source).is_dir():
+            generator.generate(str(markdown_paths[0]), jobs=args.jobs, parallel=args.parallel,
+                               incremental=args.incremental, dry_run=args.dry_run)
+        else:
+            print(f"Corpus mode: {len(markdown_paths)} chapter files")
+            generator.generate(markdown_paths, jobs=args.jobs, parallel=args.parallel,
+                               incremental=args.incremental, dry_run=args.dry_run)
+    
+    with open_output(args.output) as output:
+        if args.cache and not (args.dry_run or args.weasyprint_output):
+            from render_cache import cached_build, open_render_cache
+            
+            options = {'source': args.source, 'parallel': args.parallel,
+                       'incremental': args.incremental, 'reproducible': args.reproducible}
+            if cached_build(open_render_cache(), 'ai-book', options, output, build):
+                print(f"Unchanged; copied from the render cache to {output_name(output)}")
+        else:
+            build(output)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Inline Markdown Converter
+Turns inline markdown (bold, italic, code spans and links) into the
+mini-markup understood by ReportLab's Paragraph, or into HTML.
+Published by ALAM-ACADEMY
+"""
+
+import re
+from functools import lru_cache
+
+
+# Code spans are replaced by placeholders first so their contents are
+# never treated as emphasis or links.
+_CODE_RE = re.compile(r'`([^`]+)`')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)\s]+)\)')
+# "***text***" is bold italic; it is matched first so the tags nest
+_BOLD_ITALIC_RE = re.compile(r'\*\*\*(?=\S)(.+?)(?<=\S)\*\*\*')
+_BOLD_RE = re.compile(r'\*\*(?=\S)(.+?)(?<=\S)\*\*')
+_ITALIC_RE = re.compile(r'(?<![\*\w])\*(?=[^\s*])(.+?)(?<=[^\s*])\*(?![\*\w])')
+_PLACEHOLDER_RE = re.compile('\x00(\\d+)\x00')
+
+# Fragments such as glossary terms and list labels repeat across a book;
+# the memo keeps the most recent ones.
+INLINE_CACHE_SIZE = 8192
+
+
+def escape(text: str) -> str:
+    """Escape the characters that are special in Paragraph markup."""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def _emphasis(text: str, bold: str, italic: str) -> str:
+    """Rewrite bold and italic, converting italic inside and between bold spans separately.
+
+    Italic never spans a bold boundary, so the tags always nest.
+    """
+    def italics(segment):
+        return _ITALIC_RE.sub(lambda match: italic.format(match.group(1)), segment)
+
+    parts = []
+    end = 0
+    for match in _BOLD_RE.finditer(text):
+        parts.append(italics(text[end:match.start()]))
+        parts.append(bold.format(italics(match.group(1))))
+        end = match.end()
+    parts.append(italics(text[end:]))
+    return ''.join(parts)
+
+
+def _convert(text: str, code: str, link: str, bold: str, italic: str) -> str:
+    """Escape ``text`` and rewrite its inline markdown with the given templates."""
+    code_spans = []
+
+    def stash_code(match):
+        code_spans.append(code.format(match.group(1)))
+        return f"\x00{len(code_spans) - 1}\x00"
+
+    def make_link(match):
+        href = match.group(2).replace('"', '&quot;')
+        return link.format(match.group(1), href)
+
+    text = escape(text)
+    text = _CODE_RE.sub(stash_code, text)
+    text = _LINK_RE.sub(make_link, text)
+    text = _BOLD_ITALIC_RE.sub(lambda match: bold.format(italic.format(match.group(1))), text)
+    text = _emphasis(text, bold, italic)
+    if code_spans:
+        text = _PLACEHOLDER_RE.sub(lambda match: code_spans[int(match.group(1))], text)
+    return text
+
+
+@lru_cache(maxsize=INLINE_CACHE_SIZE)
+def to_reportlab(text: str) -> str:
+    """Convert inline markdown in ``text`` to ReportLab Paragraph markup."""
+    if not any(marker in text for marker in '*`[&<>'):
+        return text
+    return _convert(text, "<font name='Courier'>{}</font>", '<link href="{1}" color="blue">{0}</link>',
+                    '<b>{}</b>', '<i>{}</i>')
+
+
+@lru_cache(maxsize=INLINE_CACHE_SIZE)
+def to_html(text: str) -> str:
+    """Convert inline markdown in ``text`` to HTML."""
+    if not any(marker in text for marker in '*`[&<>'):
+        return text
+    return _convert(text, '<code>{}</code>', '<a href="{1}">{0}</a>', '<strong>{}</strong>', '<em>{}</em>')
+
+
+@lru_cache(maxsize=INLINE_CACHE_SIZE)
+def plain_text(text: str) -> str:
+    """Strip inline markdown from ``text``, keeping link and emphasis text."""
+    if not any(marker in text for marker in '*`['):
+        return text
+    text = _CODE_RE.sub(r'\1', text)
+    text = _LINK_RE.sub(r'\1', text)
+    text = _BOLD_ITALIC_RE.sub(r'\1', text)
+    text = _BOLD_RE.sub(r'\1', text)
+    return _ITALIC_RE.sub(r'\1', text)
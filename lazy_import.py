@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Lazy Imports
+Module-level names for heavy modules that are imported only when one of
+their attributes is first used, so the generators' --help and error
+paths return without loading ReportLab.
+Published by ALAM-ACADEMY
+"""
+
+import importlib
+
+
+class LazyModule:
+    """Stand-in for the module ``name``, imported when an attribute is first read.
+
+    Attributes are kept once read, so later lookups cost the same as on
+    the module itself. Importing goes through the interpreter's import
+    lock, so threads can share a stand-in.
+    """
+
+    def __init__(self, name: str):
+        self._module_name = name
+
+    def __getattr__(self, attr):
+        value = getattr(importlib.import_module(self._module_name), attr)
+        self.__dict__[attr] = value
+        return value
+
+    def __repr__(self):
+        return f"<lazy module {self._module_name!r}>"
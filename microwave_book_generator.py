@@ -5,13 +5,21 @@ Owner: M IFTIKHAR ALAM
 Company: Sony Ericsson
 """
 
-from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, cm
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from datetime import datetime
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+import argparse
+
+from lazy_import import LazyModule
+from page_forms import place_form
+from pdf_output import STDOUT, open_output, output_name
+from reproducible import build_time, enable_reproducible
+
+# Imported on first use, so --help returns without loading ReportLab
+colors = LazyModule('reportlab.lib.colors')
+pdfmetrics = LazyModule('reportlab.pdfbase.pdfmetrics')
+platypus = LazyModule('reportlab.platypus')
+rl_styles = LazyModule('reportlab.lib.styles')
 
 # Book Information
 ACADEMY_NAME = "ALAM-ACADEMY"
@@ -25,18 +33,21 @@ PUBLISHER_ADDRESS = "Karachi, PAKISTAN"
 
 class MicrowaveBook:
     def __init__(self, filename="Microwave_Systems_Complete_Book.pdf"):
+        # A path, or any writable binary stream such as sys.stdout.buffer
         self.filename = filename
-        self.doc = SimpleDocTemplate(filename, pagesize=A4,
-                                      rightMargin=2*cm, leftMargin=2*cm,
-                                      topMargin=2.5*cm, bottomMargin=2*cm)
+        self.doc = platypus.SimpleDocTemplate(filename, pagesize=A4,
+                                               rightMargin=2*cm, leftMargin=2*cm,
+                                               topMargin=2.5*cm, bottomMargin=2*cm)
         self.story = []
-        self.styles = getSampleStyleSheet()
+        self.styles = rl_styles.getSampleStyleSheet()
         self.setup_styles()
+        # Every page header shows the time the build started
+        self.build_time = build_time()
 
     def setup_styles(self):
         def add_style(name, **kwargs):
             try:
-                self.styles.add(ParagraphStyle(name=name, **kwargs))
+                self.styles.add(rl_styles.ParagraphStyle(name=name, **kwargs))
             except KeyError:
                 pass
         
@@ -67,26 +78,33 @@ class MicrowaveBook:
 
     def add_header(self, canvas_obj, doc):
         canvas_obj.saveState()
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        current_time = datetime.now().strftime("%H:%M:%S")
-        page_num = doc.page
-        header_text = f"{ACADEMY_NAME} | {current_date} | {current_time} | Page {page_num}"
+        header_text = f"{ACADEMY_NAME} | {self.build_time:%Y-%m-%d} | {self.build_time:%H:%M:%S} | "
+        page_text = f"Page {doc.page}"
+        # The header is centred with its page number, so it only moves when that gets wider
+        start = A4[0]/2 - pdfmetrics.stringWidth(header_text + page_text, "Helvetica", 9) / 2
+
+        def draw_static(form):
+            form.setFont("Helvetica", 9)
+            form.setFillColor(colors.grey)
+            form.drawString(start, A4[1] - 1.5*cm, header_text)
+            footer_text = f"Copyright {ACADEMY_NAME} - Microwave Systems Book"
+            form.drawCentredString(A4[0]/2, 1*cm, footer_text)
+
+        place_form(canvas_obj, f"header_{start:.2f}", draw_static)
         canvas_obj.setFont("Helvetica", 9)
         canvas_obj.setFillColor(colors.grey)
-        canvas_obj.drawCentredString(A4[0]/2, A4[1] - 1.5*cm, header_text)
-        footer_text = f"Copyright {ACADEMY_NAME} - Microwave Systems Book"
-        canvas_obj.drawCentredString(A4[0]/2, 1*cm, footer_text)
+        canvas_obj.drawString(start + pdfmetrics.stringWidth(header_text, "Helvetica", 9), A4[1] - 1.5*cm, page_text)
         canvas_obj.restoreState()
 
     def create_title_page(self):
-        self.story.append(Spacer(1, 1.5*inch))
-        self.story.append(Paragraph(f"<b><font size='28' color='darkblue'>{ACADEMY_NAME}</font></b>", self.styles['CustomTitle']))
-        self.story.append(Spacer(1, 0.5*inch))
-        self.story.append(Paragraph(f"<b><font size='24' color='darkgreen'>MICROWAVE SYSTEMS</font></b>", self.styles['CustomTitle']))
-        self.story.append(Paragraph(f"<b><font size='18' color='black'>Complete Guide with Software and Hardware</font></b>", self.styles['CustomTitle']))
-        self.story.append(Spacer(1, 0.8*inch))
-        self.story.append(Paragraph(f"<b><font size='16' color='navy'>Company: {COMPANY_NAME}</font></b>", self.styles['SectionTitle']))
-        self.story.append(Spacer(1, 0.5*inch))
+        self.story.append(platypus.Spacer(1, 1.5*inch))
+        self.story.append(platypus.Paragraph(f"<b><font size='28' color='darkblue'>{ACADEMY_NAME}</font></b>", self.styles['CustomTitle']))
+        self.story.append(platypus.Spacer(1, 0.5*inch))
+        self.story.append(platypus.Paragraph(f"<b><font size='24' color='darkgreen'>MICROWAVE SYSTEMS</font></b>", self.styles['CustomTitle']))
+        self.story.append(platypus.Paragraph(f"<b><font size='18' color='black'>Complete Guide with Software and Hardware</font></b>", self.styles['CustomTitle']))
+        self.story.append(platypus.Spacer(1, 0.8*inch))
+        self.story.append(platypus.Paragraph(f"<b><font size='16' color='navy'>Company: {COMPANY_NAME}</font></b>", self.styles['SectionTitle']))
+        self.story.append(platypus.Spacer(1, 0.5*inch))
         
         publisher_info = [
             ["Publisher:", ACADEMY_NAME],
@@ -96,8 +114,8 @@ class MicrowaveBook:
             ["Email ID:", EMAIL_ID],
             ["GitHub:", GITHUB_ACCOUNT]
         ]
-        pub_table = Table(publisher_info, colWidths=[2*cm, 5*cm])
-        pub_table.setStyle(TableStyle([
+        pub_table = platypus.Table(publisher_info, colWidths=[2*cm, 5*cm])
+        pub_table.setStyle(platypus.TableStyle([
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
             ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),
@@ -107,21 +125,21 @@ class MicrowaveBook:
             ('BACKGROUND', (0, 3), (-1, 3), colors.lightyellow),
         ]))
         self.story.append(pub_table)
-        self.story.append(Spacer(1, 0.8*inch))
+        self.story.append(platypus.Spacer(1, 0.8*inch))
         
         contact_box = f"<b><font size='16' color='darkred'>For Inquiries: Contact No: {CONTACT_NO}</font></b>"
-        self.story.append(Paragraph(contact_box, self.styles['SectionTitle']))
-        self.story.append(Spacer(1, 0.5*inch))
+        self.story.append(platypus.Paragraph(contact_box, self.styles['SectionTitle']))
+        self.story.append(platypus.Spacer(1, 0.5*inch))
         
-        current_date = datetime.now().strftime("%B %Y")
-        self.story.append(Paragraph(f"<b><font size='14' color='grey'>First Edition - {current_date}</font></b>", self.styles['SectionTitle']))
-        self.story.append(Spacer(1, 0.5*inch))
-        self.story.append(Paragraph(f"<font size='10' color='grey'>Copyright {datetime.now().year} {ACADEMY_NAME}. All rights reserved.</font>", self.styles['BodyText']))
-        self.story.append(PageBreak())
+        current_date = self.build_time.strftime("%B %Y")
+        self.story.append(platypus.Paragraph(f"<b><font size='14' color='grey'>First Edition - {current_date}</font></b>", self.styles['SectionTitle']))
+        self.story.append(platypus.Spacer(1, 0.5*inch))
+        self.story.append(platypus.Paragraph(f"<font size='10' color='grey'>Copyright {self.build_time.year} {ACADEMY_NAME}. All rights reserved.</font>", self.styles['BodyText']))
+        self.story.append(platypus.PageBreak())
 
     def create_table_of_contents(self):
-        self.story.append(Paragraph(f"<b><font size='20' color='darkblue'>TABLE OF CONTENTS</font></b>", self.styles['ChapterTitle']))
-        self.story.append(Spacer(1, 0.5*inch))
+        self.story.append(platypus.Paragraph(f"<b><font size='20' color='darkblue'>TABLE OF CONTENTS</font></b>", self.styles['ChapterTitle']))
+        self.story.append(platypus.Spacer(1, 0.5*inch))
         chapters = [
             "Chapter 1: Introduction to Microwave Systems",
             "Chapter 2: Microwave Fundamentals and Theory",
@@ -137,33 +155,33 @@ class MicrowaveBook:
             "References and Resources"
         ]
         for i, chapter in enumerate(chapters, 1):
-            self.story.append(Paragraph(f"{i:2d}. {chapter}", self.styles['BodyText']))
-            self.story.append(Spacer(1, 0.1*inch))
-        self.story.append(PageBreak())
+            self.story.append(platypus.Paragraph(f"{i:2d}. {chapter}", self.styles['BodyText']))
+            self.story.append(platypus.Spacer(1, 0.1*inch))
+        self.story.append(platypus.PageBreak())
 
     def create_chapter(self, title, content_list):
-        self.story.append(Paragraph(title, self.styles['ChapterTitle']))
+        self.story.append(platypus.Paragraph(title, self.styles['ChapterTitle']))
         for item in content_list:
             if isinstance(item, tuple):
                 if item[0] == 'section':
-                    self.story.append(Paragraph(item[1], self.styles['SectionTitle']))
+                    self.story.append(platypus.Paragraph(item[1], self.styles['SectionTitle']))
                 elif item[0] == 'subsection':
-                    self.story.append(Paragraph(item[1], self.styles['SubSectionTitle']))
+                    self.story.append(platypus.Paragraph(item[1], self.styles['SubSectionTitle']))
                 elif item[0] == 'body':
-                    self.story.append(Paragraph(item[1], self.styles['BodyText']))
+                    self.story.append(platypus.Paragraph(item[1], self.styles['BodyText']))
                 elif item[0] == 'definition':
-                    self.story.append(Paragraph(item[1], self.styles['Definition']))
+                    self.story.append(platypus.Paragraph(item[1], self.styles['Definition']))
                 elif item[0] == 'example':
-                    self.story.append(Paragraph(item[1], self.styles['Example']))
+                    self.story.append(platypus.Paragraph(item[1], self.styles['Example']))
                 elif item[0] == 'table':
                     self.story.append(item[1])
                 elif item[0] == 'spacer':
-                    self.story.append(Spacer(1, item[1]))
+                    self.story.append(platypus.Spacer(1, item[1]))
                 elif item[0] == 'pagebreak':
-                    self.story.append(PageBreak())
+                    self.story.append(platypus.PageBreak())
                 elif item[0] == 'list':
                     for li in item[1]:
-                        self.story.append(Paragraph(li, self.styles['BodyText']))
+                        self.story.append(platypus.Paragraph(li, self.styles['BodyText']))
 
     def create_frequency_table(self):
         data = [
@@ -178,8 +196,8 @@ class MicrowaveBook:
             ["V Band", "40-75 GHz", "7.5-4 mm", "Millimeter wave, 5G"],
             ["W Band", "75-110 GHz", "4-2.7 mm", "Advanced radar"]
         ]
-        table = Table(data, colWidths=[1.2*inch, 1.2*inch, 1.2*inch, 2.4*inch])
-        table.setStyle(TableStyle([
+        table = platypus.Table(data, colWidths=[1.2*inch, 1.2*inch, 1.2*inch, 2.4*inch])
+        table.setStyle(platypus.TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
@@ -832,11 +850,29 @@ class MicrowaveBook:
             ('spacer', 0.5*inch),
             ('body', f"<font size='11' color='darkgreen'><b>For any inquiries about this book, please contact: {CONTACT_NO}</b></font>"),
             ('spacer', 0.3*inch),
-            ('body', f"<font size='10'>Copyright {datetime.now().year} {ACADEMY_NAME}. All rights reserved.</font>")
+            ('body', f"<font size='10'>Copyright {self.build_time.year} {ACADEMY_NAME}. All rights reserved.</font>")
         ]
         self.create_chapter("", content)
 
-    def generate(self):
+    # Book parts in reading order, with the message printed once each is built
+    PARTS = [
+        ('create_title_page', "Title page created"),
+        ('create_table_of_contents', "Table of contents created"),
+        ('create_chapter_1', "Chapter 1: Introduction created"),
+        ('create_chapter_2', "Chapter 2: Fundamentals created"),
+        ('create_chapter_3', "Chapter 3: Hardware created"),
+        ('create_chapter_4', "Chapter 4: Software created"),
+        ('create_chapter_5', "Chapter 5: Accessories created"),
+        ('create_chapter_6', "Chapter 6: Tower Installation created"),
+        ('create_chapter_7', "Chapter 7: Applications created"),
+        ('create_chapter_8', "Chapter 8: Troubleshooting created"),
+        ('create_chapter_9', "Chapter 9: Safety created"),
+        ('create_chapter_10', "Chapter 10: Future Trends created"),
+        ('create_glossary', "Glossary created"),
+        ('create_references', "References created"),
+    ]
+
+    def generate(self, parallel=False, jobs=None, incremental=False, dry_run=False):
         print("=" * 60)
         print("Microwave Systems Book Generator")
         print("=" * 60)
@@ -846,59 +882,72 @@ class MicrowaveBook:
         print(f"Contact: {CONTACT_NO}")
         print(f"Email: {EMAIL_ID}")
         print("=" * 60)
-        print("\nGenerating book...")
-        
-        self.create_title_page()
-        print("Title page created")
-        
-        self.create_table_of_contents()
-        print("Table of contents created")
-        
-        self.create_chapter_1()
-        print("Chapter 1: Introduction created")
-        
-        self.create_chapter_2()
-        print("Chapter 2: Fundamentals created")
-        
-        self.create_chapter_3()
-        print("Chapter 3: Hardware created")
-        
-        self.create_chapter_4()
-        print("Chapter 4: Software created")
         
-        self.create_chapter_5()
-        print("Chapter 5: Accessories created")
-        
-        self.create_chapter_6()
-        print("Chapter 6: Tower Installation created")
-        
-        self.create_chapter_7()
-        print("Chapter 7: Applications created")
-        
-        self.create_chapter_8()
-        print("Chapter 8: Troubleshooting created")
-        
-        self.create_chapter_9()
-        print("Chapter 9: Safety created")
-        
-        self.create_chapter_10()
-        print("Chapter 10: Future Trends created")
-        
-        self.create_glossary()
-        print("Glossary created")
-        
-        self.create_references()
-        print("References created")
-        
-        print("\nBuilding PDF...")
-        self.doc.build(self.story, onFirstPage=self.add_header, onLaterPages=self.add_header)
+        if (parallel or incremental) and not dry_run:
+            # Each part is laid out in its own process; headers are drawn
+            # afterwards at the global page numbers
+            from book_build import build_parallel, open_part_cache
+
+            print(f"\nGenerating {len(self.PARTS)} parts in parallel...")
+            parts = [[(name, ())] for name, _ in self.PARTS]
+            cache = open_part_cache() if incremental else None
+            total_pages = build_parallel(MicrowaveBook, parts, self.filename,
+                                         self.doc, self.add_header, jobs, cache)
+        else:
+            print("\nGenerating book...")
+            for name, message in self.PARTS:
+                getattr(self, name)()
+                print(message)
+            
+            if dry_run:
+                from dry_run import report_layout
+
+                # Headers do not affect the layout, so they are left out
+                print("\nLaying out pages...")
+                report_layout(self.doc, self.story, ['ChapterTitle'])
+                return
+            
+            print("\nBuilding PDF...")
+            self.doc.build(self.story, onFirstPage=self.add_header, onLaterPages=self.add_header)
+            total_pages = self.doc.page
         
         print("=" * 60)
-        print(f"SUCCESS! Book generated: {self.filename}")
-        print(f"Total pages: {self.doc.page}")
+        print(f"SUCCESS! Book generated: {output_name(self.filename)}")
+        print(f"Total pages: {total_pages}")
         print("=" * 60)
 
-
 if __name__ == "__main__":
-    book = MicrowaveBook()
-    book.generate()
+    parser = argparse.ArgumentParser(description="Generate the Microwave Systems book PDF.")
+    parser.add_argument('-o', '--output', default="Microwave_Systems_Complete_Book.pdf",
+                        help=f"output PDF path, or {STDOUT} to write the PDF to standard output")
+    parser.add_argument('--parallel', action='store_true',
+                        help="lay out each chapter in its own process and join the parts")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="processes for --parallel (default: CPU count)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="reuse cached chapter layouts and re-render only changed chapters")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="lay out the book and report its page count without writing a PDF")
+    parser.add_argument('--reproducible', action='store_true',
+                        help="byte-identical output for identical input, dated from SOURCE_DATE_EPOCH")
+    parser.add_argument('--cache', action='store_true',
+                        help="copy the PDF from the render cache if nothing it depends on has changed")
+    args = parser.parse_args()
+    
+    if args.reproducible:
+        enable_reproducible()
+    def build(output):
+        book = MicrowaveBook(output)
+        book.generate(parallel=args.parallel, jobs=args.jobs, incremental=args.incremental,
+                      dry_run=args.dry_run)
+    
+    with open_output(args.output) as output:
+        if args.cache and not args.dry_run:
+            from render_cache import cached_build, open_render_cache
+            
+            options = {'parallel': args.parallel, 'incremental': args.incremental,
+                       'reproducible': args.reproducible}
+            if cached_build(open_render_cache(), 'microwave', options, output, build):
+                print(f"Unchanged; copied from the render cache to {output_name(output)}")
+        else:
+            build(output)
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Page Decoration Forms
+Draws the unchanging parts of page headers and footers once per PDF as
+Form XObjects, so each page only adds a reference plus its page number.
+Published by ALAM-ACADEMY
+"""
+
+
+def place_form(canvas, name: str, draw):
+    """Place the Form XObject ``name``, drawing it with ``draw(canvas)`` the first time.
+
+    Forms are defined per canvas, so the first page of every PDF written
+    (including each part of a parallel build) defines the form and the
+    remaining pages only reference it.
+    """
+    if not canvas.hasForm(name):
+        canvas.beginForm(name)
+        draw(canvas)
+        canvas.endForm()
+    canvas.doForm(name)
+
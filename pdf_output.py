@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+PDF Output Targets
+Lets the generators write a PDF to a path, to any writable binary stream
+(BytesIO, a socket's makefile('wb'), a pipe) or to standard output, so a
+book can go straight into a web response or a compressor.
+Published by ALAM-ACADEMY
+"""
+
+import sys
+from contextlib import contextmanager, redirect_stdout
+
+
+# Output argument meaning "write the PDF to standard output".
+STDOUT = '-'
+
+
+def is_stream(output) -> bool:
+    """Return True if ``output`` is a writable stream rather than a path."""
+    return callable(getattr(output, 'write', None))
+
+
+def output_name(output) -> str:
+    """Return a printable name for ``output`` for progress messages."""
+    if is_stream(output):
+        name = getattr(output, 'name', None)
+        return name if isinstance(name, str) else f"<{type(output).__name__}>"
+    return str(output)
+
+
+@contextmanager
+def open_output(output):
+    """Yield the path or stream a generator should write ``output`` to.
+
+    ``STDOUT`` becomes ``sys.stdout.buffer``; while it is in use the
+    generators' progress messages are sent to stderr so they do not mix
+    with the PDF bytes. Paths and streams are yielded unchanged.
+    """
+    if output != STDOUT:
+        yield output
+        return
+    stream = sys.stdout.buffer
+    with redirect_stdout(sys.stderr):
+        yield stream
+    stream.flush()
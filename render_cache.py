@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Render Cache
+Keeps finished PDFs on disk, keyed by a hash of everything that decides
+their bytes: the markdown input, the generator code with its styles and
+content, the renderer version and the build options. Requesting an
+unchanged book again costs one hash and a copy instead of a layout.
+Published by ALAM-ACADEMY
+"""
+
+import io
+import json
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from disk_cache import DiskLRUCache, content_key
+from pdf_output import is_stream, output_name
+from reproducible import DEFAULT_EPOCH
+
+
+BASE_PATH = Path(__file__).parent
+GUIDE_PATH = BASE_PATH / 'AI_Comprehensive_Guide.md'
+
+# Finished PDFs are cached here.
+RENDER_CACHE_DIR = BASE_PATH / '.render_cache'
+RENDER_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Target -> module that generates it and the package that renders its PDF.
+# Book content and styles that live in code are covered by the module's source.
+GENERATORS = {
+    'ai-book': ('generate_pdf_reportlab', 'reportlab'),
+    'weasyprint': ('generate_pdf', 'weasyprint'),
+    'microwave': ('microwave_book_generator', 'reportlab'),
+    'it-book': ('generate_book', 'reportlab'),
+    'simple': ('simple_pdf_generator', 'reportlab'),
+}
+
+# Import statements, matched textually: parsing every module with ast on
+# each cache lookup would cost more than the lookup itself.
+_IMPORT_RE = re.compile(r'^\s*(?:from\s+(\w+)\S*\s+import\b|import\s+([\w., ]+))', re.MULTILINE)
+
+# Options that change how a book is built but not which bytes it ends up as.
+_UNKEYED_OPTIONS = {'jobs', 'dry_run', 'source', 'epoch'}
+
+
+def markdown_source(source=None) -> list:
+    """Return the markdown files for ``source`` (default: the AI guide)."""
+    from book_parser import resolve_sources
+
+    paths = resolve_sources(str(source or GUIDE_PATH))
+    if not paths:
+        raise FileNotFoundError(f"markdown source not found: {source}")
+    return paths
+
+
+def local_modules(module: str) -> list:
+    """Return ``module`` and every repository module it imports, directly or not."""
+    found = []
+    pending = [module]
+    while pending:
+        name = pending.pop()
+        path = BASE_PATH / f"{name}.py"
+        if name in found or not path.exists():
+            continue
+        found.append(name)
+        for from_name, names in _IMPORT_RE.findall(path.read_text(encoding='utf-8')):
+            pending.extend([from_name] if from_name else re.split(r'[\s,]+', names.strip()))
+    return sorted(found)
+
+
+def _package_version(package: str) -> str:
+    if package == 'reportlab':
+        from reportlab import Version  # far quicker than importlib.metadata
+
+        return Version
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return 'not installed'
+
+
+@lru_cache(maxsize=None)
+def generator_version(target: str) -> str:
+    """Return a hash of the code that builds ``target`` and its renderer's version."""
+    module, package = GENERATORS[target]
+    parts = [package, _package_version(package)]
+    for name in local_modules(module):
+        parts += [name, (BASE_PATH / f"{name}.py").read_bytes()]
+    return content_key(*parts)
+
+
+def render_key(target: str, options: dict = None) -> str:
+    """Return the cache key for ``target`` built with render_jobs ``options``.
+
+    Markdown input is hashed by content, so a key never outlives an edit.
+    Options left at their default (false) do not change the key, and
+    neither does how the time printed in the book was chosen, only the
+    time itself: the build epoch, or SOURCE_DATE_EPOCH when set.
+    """
+    if target not in GENERATORS:
+        raise ValueError(f"unknown target {target!r} (choose from {', '.join(GENERATORS)})")
+    options = options or {}
+    epoch = os.environ.get('SOURCE_DATE_EPOCH', '')
+    if options.get('reproducible'):
+        epoch = str(options.get('epoch') or epoch or DEFAULT_EPOCH)
+    keyed = {name: value for name, value in options.items() if value and name not in _UNKEYED_OPTIONS}
+    parts = [target, generator_version(target), epoch, json.dumps(keyed, sort_keys=True)]
+    if target in ('ai-book', 'weasyprint'):
+        for path in markdown_source(options.get('source')):
+            parts += [path.name, path.read_bytes()]
+    return content_key(*parts)
+
+
+def open_render_cache(cache_dir=RENDER_CACHE_DIR, max_bytes: int = RENDER_CACHE_MAX_BYTES):
+    """Return the finished-PDF cache stored in ``cache_dir``."""
+    return DiskLRUCache(cache_dir, max_bytes, suffix='.pdf')
+
+
+def cached_build(cache, target: str, options: dict, output, build) -> bool:
+    """Write ``target``'s PDF to ``output``, from ``cache`` if it holds it.
+
+    On a miss ``build(stream)`` writes the PDF to a buffer, which is
+    stored before it is copied to ``output`` (a path or a binary
+    stream). A build that writes nothing is not cached. Returns True if
+    the PDF came from the cache.
+    """
+    key = render_key(target, options)
+    pdf = cache.get(key)
+    hit = pdf is not None
+    if not hit:
+        buffer = io.BytesIO()
+        # Progress messages name the real output, not the buffer
+        buffer.name = output_name(output)
+        build(buffer)
+        pdf = buffer.getvalue()
+        if not pdf:
+            return False
+        cache.put(key, pdf)
+    if is_stream(output):
+        output.write(pdf)
+    else:
+        Path(output).write_bytes(pdf)
+    return hit
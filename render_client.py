@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Render Client
+Thin command-line client for render_daemon.py: sends one build job over
+the daemon's Unix socket and writes the PDF it returns. It imports
+nothing heavier than the standard library, so it starts instantly.
+Published by ALAM-ACADEMY
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+
+
+# Where the daemon listens unless told otherwise.
+SOCKET_PATH = Path(tempfile.gettempdir()) / f"alam-render-{os.getuid()}.sock"
+
+# Target names served by the daemon (render_jobs.TARGETS).
+TARGET_NAMES = ('ai-book', 'weasyprint', 'microwave', 'it-book', 'simple')
+
+
+class RenderError(Exception):
+    """The daemon could not build the requested book."""
+
+
+def _read_exactly(stream, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise RenderError(f"connection closed after {len(data)} of {size} bytes")
+    return data
+
+
+def request(target: str, options: dict = None, socket_path=SOCKET_PATH):
+    """Ask the daemon to build ``target`` and return ``(pdf bytes, progress log)``.
+
+    The job is one JSON line. The reply is a JSON header line, followed
+    by ``size`` bytes of PDF when the build succeeded.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        with sock.makefile('rwb') as stream:
+            stream.write(json.dumps({'target': target, 'options': options or {}}).encode() + b'\n')
+            stream.flush()
+            reply = json.loads(stream.readline() or b'null')
+            if not reply:
+                raise RenderError("the daemon closed the connection without replying")
+            if not reply['ok']:
+                raise RenderError(reply['error'])
+            return _read_exactly(stream, reply['size']), reply['log']
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build a book with the running render daemon.")
+    parser.add_argument('target', choices=TARGET_NAMES, help="book to build")
+    parser.add_argument('-o', '--output', help="output PDF path, or - for standard output "
+                                                "(default: <target>.pdf)")
+    parser.add_argument('--source', help="markdown file, directory or glob (ai-book and weasyprint)")
+    parser.add_argument('--parallel', action='store_true', help="lay out chapters in parallel")
+    parser.add_argument('--incremental', action='store_true', help="reuse cached chapter layouts")
+    parser.add_argument('--dry-run', action='store_true', help="report the page count only")
+    parser.add_argument('--reproducible', action='store_true', help="byte-identical output")
+    parser.add_argument('--socket', default=str(SOCKET_PATH), help=f"daemon socket (default: {SOCKET_PATH})")
+    args = parser.parse_args()
+
+    options = {'dry_run': args.dry_run}
+    if args.source:
+        # The daemon may run in another directory
+        options['source'] = str(Path(args.source).absolute())
+    for name in ('parallel', 'incremental'):
+        if getattr(args, name):
+            options[name] = True
+    if args.reproducible:
+        options['reproducible'] = True
+        if os.environ.get('SOURCE_DATE_EPOCH'):
+            options['epoch'] = int(os.environ['SOURCE_DATE_EPOCH'])
+
+    try:
+        pdf, log = request(args.target, options, args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        sys.exit(f"Error: no render daemon at {args.socket} (start it with: python render_daemon.py)")
+    except RenderError as exc:
+        sys.exit(f"Error: {exc}")
+
+    if args.dry_run:
+        sys.stdout.write(log)
+        return
+    sys.stderr.write(log)
+    if args.output == '-':
+        sys.stdout.buffer.write(pdf)
+        sys.stdout.buffer.flush()
+        return
+    output = Path(args.output or f"{args.target}.pdf")
+    output.write_bytes(pdf)
+    print(f"Wrote {len(pdf):,} bytes to {output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Render Daemon
+Long-lived local process that keeps ReportLab, the generators and their
+fonts loaded and builds books for render_client.py over a Unix socket,
+so a small book takes a fraction of a second instead of a cold start.
+Published by ALAM-ACADEMY
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import time
+from pathlib import Path
+
+from render_cache import open_render_cache
+from render_client import SOCKET_PATH
+from render_jobs import render, warm_up
+
+
+class RenderHandler(socketserver.StreamRequestHandler):
+    """Serve one job: a JSON request line in, a JSON header line and the PDF out."""
+
+    def _reply(self, header: dict, pdf: bytes = b''):
+        try:
+            self.wfile.write(json.dumps(header).encode() + b'\n')
+            if pdf:
+                self.wfile.write(pdf)
+        except (BrokenPipeError, ConnectionResetError):
+            print("client disconnected before the reply was sent")
+
+    def handle(self):
+        start = time.perf_counter()
+        line = self.rfile.readline()
+        if not line:
+            return  # a connection check, see _is_listening
+        target = '?'
+        try:
+            job = json.loads(line)
+            target = job['target']
+            pdf, log = render(target, job.get('options'), self.server.cache)
+        except Exception as exc:  # report every failure to the client
+            self._reply({'ok': False, 'error': f"{type(exc).__name__}: {exc}"})
+            print(f"{target}: failed ({type(exc).__name__}: {exc})")
+            return
+        self._reply({'ok': True, 'size': len(pdf), 'log': log}, pdf)
+        print(f"{target}: {len(pdf):,} bytes in {time.perf_counter() - start:.2f}s")
+
+
+class RenderServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """Runs each job in a fork of the warm process.
+
+    The fork inherits the loaded modules, so it starts instantly, and
+    per-job settings such as reproducible mode never leak into later jobs.
+    """
+
+    cache = None
+
+
+def _is_listening(socket_path: Path) -> bool:
+    """Return True if a daemon accepts connections on ``socket_path``."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def serve(socket_path=SOCKET_PATH, warm: bool = True, cache=None):
+    """Listen on ``socket_path`` until interrupted, serving unchanged books from ``cache``."""
+    socket_path = Path(socket_path)
+    if socket_path.exists():
+        if _is_listening(socket_path):
+            sys.exit(f"Error: a render daemon is already listening on {socket_path}")
+        socket_path.unlink()
+    if warm:
+        print("Warming up generators...")
+        warm_up()
+    # Stop cleanly on kill too, so the socket file is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    with RenderServer(str(socket_path), RenderHandler) as server:
+        os.chmod(socket_path, 0o600)
+        server.cache = cache
+        print(f"Render daemon listening on {socket_path}")
+        try:
+            server.serve_forever()
+        except (KeyboardInterrupt, SystemExit):
+            print("\nStopping render daemon")
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Keep the book generators loaded and serve build jobs.")
+    parser.add_argument('--socket', default=str(SOCKET_PATH), help=f"socket path (default: {SOCKET_PATH})")
+    parser.add_argument('--no-warm-up', action='store_true',
+                        help="skip rendering the small books once at startup")
+    parser.add_argument('--cache', action='store_true',
+                        help="serve unchanged books from the render cache instead of rebuilding them")
+    args = parser.parse_args()
+    serve(args.socket, warm=not args.no_warm_up, cache=open_render_cache() if args.cache else None)
+
+
+if __name__ == '__main__':
+    main()
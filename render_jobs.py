@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Render Jobs
+The books every generator can build, by name, rendered to PDF bytes in
+memory. Used by long-running services that keep the generators loaded.
+Published by ALAM-ACADEMY
+"""
+
+import io
+from contextlib import nullcontext, redirect_stdout
+
+import generate_book
+import simple_pdf_generator
+from book_parser import load_document
+from generate_pdf import generate_pdf
+from generate_pdf_reportlab import AIBackBookGenerator
+from microwave_book_generator import MicrowaveBook
+from render_cache import markdown_source, render_key
+from reproducible import reproducible_build
+
+
+def _ai_book(output, source=None, parallel=False, incremental=False, dry_run=False):
+    paths = markdown_source(source)
+    AIBackBookGenerator(output).generate(paths if len(paths) > 1 else str(paths[0]), parallel=parallel,
+                                         incremental=incremental, dry_run=dry_run)
+
+
+def _weasyprint(output, source=None, dry_run=False):
+    generate_pdf(nodes=load_document(markdown_source(source)), pdf_path=output, dry_run=dry_run)
+
+
+def _microwave(output, parallel=False, incremental=False, dry_run=False):
+    MicrowaveBook(output).generate(parallel=parallel, incremental=incremental, dry_run=dry_run)
+
+
+def _it_book(output, dry_run=False):
+    generate_book.build_pdf(dry_run=dry_run, output_path=output)
+
+
+def _simple(output, dry_run=False):
+    simple_pdf_generator.create_pdf(dry_run=dry_run, output_path=output)
+
+
+# Target name -> function writing that book to a binary stream
+TARGETS = {
+    'ai-book': _ai_book,
+    'weasyprint': _weasyprint,
+    'microwave': _microwave,
+    'it-book': _it_book,
+    'simple': _simple,
+}
+
+
+def render(target: str, options: dict = None, cache=None):
+    """Build ``target`` and return ``(pdf bytes, progress log)``.
+
+    ``options`` are the target's keyword arguments, plus ``reproducible``
+    and ``epoch`` for a reproducible build. With a render ``cache`` an
+    unchanged book is returned from it without being built.
+    """
+    if target not in TARGETS:
+        raise ValueError(f"unknown target {target!r} (choose from {', '.join(TARGETS)})")
+    key = None
+    if cache is not None and not (options or {}).get('dry_run'):
+        key = render_key(target, options)
+        pdf = cache.get(key)
+        if pdf is not None:
+            return pdf, "Served from the render cache\n"
+    options = dict(options or {})
+    epoch = options.pop('epoch', None)
+    mode = reproducible_build(epoch) if options.pop('reproducible', False) else nullcontext()
+
+    buffer = io.BytesIO()
+    log = io.StringIO()
+    with mode, redirect_stdout(log):
+        TARGETS[target](buffer, **options)
+    pdf = buffer.getvalue()
+    if key is not None and pdf:
+        cache.put(key, pdf)
+    return pdf, log.getvalue()
+
+
+def warm_up(targets=('microwave', 'it-book', 'simple')):
+    """Render small books once so fonts, parsers and caches are loaded."""
+    for target in targets:
+        render(target, {'dry_run': True})
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Render Service
+Small local HTTP service that builds academy books on demand. Jobs run
+in a fixed pool of warm worker processes behind a bounded admission
+queue: when every worker is busy and the queue is full, requests are
+turned away with 503 instead of piling up, and a job that runs past its
+time limit is stopped and answered with 504.
+Published by ALAM-ACADEMY
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import signal
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from render_cache import open_render_cache
+from render_jobs import TARGETS, render, warm_up
+
+
+DEFAULT_PORT = 8080
+DEFAULT_TIMEOUT = 120
+
+# Query values that switch a boolean option on.
+_TRUE = {'1', 'true', 'yes', 'on'}
+
+# Seconds the HTTP side waits beyond the job's own time limit, so the
+# worker's own JobTimeout is normally what ends a slow job.
+_TIMEOUT_GRACE = 5
+
+
+class JobTimeout(Exception):
+    """A render job ran longer than the service allows."""
+
+
+def _expire(signum, frame):
+    raise JobTimeout("render job exceeded its time limit")
+
+
+def run_job(target: str, options: dict, timeout: float, cache=None):
+    """Render in a pool worker, interrupting the build after ``timeout`` seconds.
+
+    The alarm fires inside the worker, so a runaway job frees its
+    worker for the next one instead of holding it indefinitely.
+    """
+    signal.signal(signal.SIGALRM, _expire)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return render(target, options, cache)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+class RenderPool:
+    """A process pool that admits at most ``workers + queue_size`` jobs at once.
+
+    Admitted jobs wait for a free worker before they reach the process
+    pool, so every job handed to it starts at once and its time limit
+    counts only its run. With a render ``cache`` unchanged books are
+    served from it.
+    """
+
+    def __init__(self, workers: int, queue_size: int, timeout: float, cache=None):
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self.timeout = timeout
+        self.cache = cache
+        self._executor = ProcessPoolExecutor(max_workers=workers, initializer=warm_up)
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._free_workers = threading.BoundedSemaphore(workers)
+        self._lock = threading.Lock()
+        self._admitted = 0
+        self._running = 0
+
+    def submit(self, target: str, options: dict):
+        """Run a job and return its future once it has started, or None if the queue is full.
+
+        A full queue is reported at once; otherwise the calling (request)
+        thread waits here until a worker is free.
+        """
+        if not self._slots.acquire(blocking=False):
+            return None
+        with self._lock:
+            self._admitted += 1
+        self._free_workers.acquire()
+        with self._lock:
+            self._running += 1
+        try:
+            future = self._executor.submit(run_job, target, options, self.timeout, self.cache)
+        except Exception:
+            # A broken or shut down pool must not keep the slot
+            self._release()
+            raise
+        # The slot is freed when the worker is done, not when the client gives up
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future=None):
+        with self._lock:
+            self._admitted -= 1
+            self._running -= 1
+        self._free_workers.release()
+        self._slots.release()
+
+    def status(self) -> dict:
+        with self._lock:
+            admitted = self._admitted
+            running = self._running
+        return {
+            'workers': self.workers,
+            'capacity': self.capacity,
+            'running': running,
+            'queued': admitted - running,
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(cancel_futures=True)
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    """``GET /books/<target>.pdf`` builds a book; ``GET /status`` reports the pool."""
+
+    server_version = 'ALAMRender/1.0'
+
+    def _send(self, status: HTTPStatus, body: bytes, content_type: str, headers: dict = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: HTTPStatus, payload: dict, headers: dict = None):
+        self._send(status, json.dumps(payload).encode(), 'application/json', headers)
+
+    def _error(self, status: HTTPStatus, message: str, headers: dict = None):
+        self._send_json(status, {'error': message}, headers)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/status':
+            self._send_json(HTTPStatus.OK, self.server.pool.status())
+            return
+
+        target = url.path[len('/books/'):-len('.pdf')] if url.path.startswith('/books/') else ''
+        if not url.path.endswith('.pdf') or target not in TARGETS:
+            self._error(HTTPStatus.NOT_FOUND, f"unknown book; try /books/<target>.pdf with target "
+                                             f"one of {', '.join(TARGETS)}")
+            return
+
+        # Only options that keep one job inside one worker process are exposed
+        query = parse_qs(url.query)
+        options = {}
+        if query.get('reproducible', [''])[0].lower() in _TRUE:
+            options['reproducible'] = True
+
+        try:
+            future = self.server.pool.submit(target, options)
+        except Exception as exc:  # a broken worker pool
+            self._error(HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(exc).__name__}: {exc}")
+            return
+        if future is None:
+            self._error(HTTPStatus.SERVICE_UNAVAILABLE, "render queue is full, try again shortly",
+                        {'Retry-After': '5'})
+            return
+
+        # submit() returns once the job runs, so time spent queued does not count
+        try:
+            pdf, _ = future.result(timeout=self.server.pool.timeout + _TIMEOUT_GRACE)
+        except (JobTimeout, FutureTimeout):
+            future.cancel()
+            self._error(HTTPStatus.GATEWAY_TIMEOUT,
+                        f"rendering took longer than {self.server.pool.timeout:g}s")
+            return
+        except Exception as exc:  # report build failures to the client
+            self._error(HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(exc).__name__}: {exc}")
+            return
+
+        etag = '"' + hashlib.sha256(pdf).hexdigest()[:32] + '"'
+        self._send(HTTPStatus.OK, pdf, 'application/pdf', {
+            'ETag': etag,
+            'Content-Disposition': f'inline; filename="{target}.pdf"',
+        })
+
+
+class RenderHTTPServer(ThreadingHTTPServer):
+    """Threads only wait on the pool; all rendering happens in its workers."""
+
+    daemon_threads = True
+
+    def __init__(self, address, pool: RenderPool):
+        super().__init__(address, RenderHandler)
+        self.pool = pool
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Serve academy books over HTTP.")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"port (default: {DEFAULT_PORT})")
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1,
+                        help="render worker processes (default: CPU count)")
+    parser.add_argument('--queue', type=int, default=None,
+                        help="jobs that may wait for a worker before requests get 503 "
+                             "(default: twice the workers)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f"seconds a job may run before it is stopped (default: {DEFAULT_TIMEOUT})")
+    parser.add_argument('--cache', action='store_true',
+                        help="serve unchanged books from the render cache instead of rebuilding them")
+    args = parser.parse_args()
+
+    queue_size = args.queue if args.queue is not None else 2 * args.workers
+    pool = RenderPool(args.workers, queue_size, args.timeout, open_render_cache() if args.cache else None)
+    server = RenderHTTPServer((args.host, args.port), pool)
+    print(f"Render service on http://{args.host}:{args.port}/books/<target>.pdf "
+          f"({args.workers} workers, queue {queue_size}, timeout {args.timeout:g}s)")
+    print(f"Targets: {', '.join(TARGETS)}")
+    # Stop cleanly on kill too, shutting the worker pool down
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    except (KeyboardInterrupt, SystemExit):
+        print("\nStopping render service")
+    finally:
+        server.server_close()
+        pool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Reproducible Builds
+Takes build timestamps from SOURCE_DATE_EPOCH and switches ReportLab to
+invariant output, so identical inputs produce byte-identical PDFs that
+can be cached, deduplicated and served with strong ETags.
+Published by ALAM-ACADEMY
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+
+# ReportLab's own timestamp for invariant output: 2000-01-01 00:00 UTC.
+DEFAULT_EPOCH = 946684800
+
+
+def build_time() -> datetime:
+    """Return the time to print in a book: SOURCE_DATE_EPOCH if set, else now."""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH', '').strip()
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), timezone.utc)
+    return datetime.now()
+
+
+def enable_reproducible(epoch: int = None):
+    """Make this process, and the workers it starts, write reproducible PDFs.
+
+    The build time is ``epoch`` if given, else SOURCE_DATE_EPOCH from the
+    environment, else DEFAULT_EPOCH. ReportLab's invariant mode uses it
+    for the document dates, derives the document ID from the content
+    and leaves memory addresses out of the output.
+    """
+    if epoch is not None:
+        os.environ['SOURCE_DATE_EPOCH'] = str(int(epoch))
+    else:
+        os.environ.setdefault('SOURCE_DATE_EPOCH', str(DEFAULT_EPOCH))
+    # Read by rl_config when it is imported, here or in a spawned worker;
+    # a build served from the render cache never needs to import it
+    os.environ['RL_invariant'] = '1'
+    rl_config = sys.modules.get('reportlab.rl_config')
+    if rl_config is not None:
+        rl_config.invariant = 1
+
+
+@contextmanager
+def reproducible_build(epoch: int = None):
+    """Enable reproducible output for the duration of one build.
+
+    For long-lived worker processes: the previous SOURCE_DATE_EPOCH,
+    RL_invariant and ReportLab invariant setting are restored afterwards.
+    """
+    from reportlab import rl_config
+
+    saved_env = {name: os.environ.get(name) for name in ('SOURCE_DATE_EPOCH', 'RL_invariant')}
+    saved_invariant = rl_config.invariant
+    enable_reproducible(epoch)
+    try:
+        yield
+    finally:
+        rl_config.invariant = saved_invariant
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Startup Time Benchmark
+Runs the generators' quick paths (--help, a missing input file and
+--dry-run) under ``python -X importtime`` and checks the time spent
+importing modules against a budget, so a new module-level import of
+ReportLab, pypdf or WeasyPrint on those paths is caught before it ships.
+A dry run lays the book out and so needs ReportLab; ReportLab and the
+modules it imports are not counted, but everything else is.
+Published by ALAM-ACADEMY
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+BASE_PATH = Path(__file__).parent
+DEFAULT_BUDGET_MS = 50
+DEFAULT_REPEAT = 5
+
+MISSING_INPUT = str(BASE_PATH / 'missing-input.md')
+
+# Scenario name -> script and arguments; none of these should need ReportLab
+SCENARIOS = {
+    'ai-book --help': ['generate_pdf_reportlab.py', '--help'],
+    'ai-book missing input': ['generate_pdf_reportlab.py', MISSING_INPUT],
+    'weasyprint --help': ['generate_pdf.py', '--help'],
+    'microwave --help': ['microwave_book_generator.py', '--help'],
+    'it-book --help': ['generate_book.py', '--help'],
+    'simple --help': ['simple_pdf_generator.py', '--help'],
+}
+
+# Scenarios that lay the book out; these packages and their imports are not counted
+DRY_RUN_SCENARIOS = {
+    'ai-book --dry-run': ['generate_pdf_reportlab.py', '--dry-run'],
+    'microwave --dry-run': ['microwave_book_generator.py', '--dry-run'],
+    'it-book --dry-run': ['generate_book.py', '--dry-run'],
+    'simple --dry-run': ['simple_pdf_generator.py', '--dry-run'],
+}
+LAYOUT_PACKAGES = ('reportlab',)
+
+
+def import_times(args: list) -> tuple:
+    """Run ``python -X importtime`` with ``args``.
+
+    Returns the wall time in seconds and a ``(module, self µs, depth)``
+    entry per module imported, in the order ``-X importtime`` reports
+    them: a module's own imports, one level deeper, come before it.
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + args, cwd=BASE_PATH,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    seconds = time.perf_counter() - start
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules.append((name.strip(), int(self_us), depth))
+    return seconds, modules
+
+
+def counted_imports(modules: list, baseline: set, exempt: tuple) -> dict:
+    """Return ``{module: self µs}`` for the imports a scenario is charged for.
+
+    Modules in ``baseline`` are skipped, and so are modules in the
+    packages ``exempt`` together with everything imported while loading
+    them.
+    """
+    counted = {}
+    skip_below = None
+    # Walk parents before their imports, so an exempt module's subtree can be skipped
+    for name, self_us, depth in reversed(modules):
+        if skip_below is not None:
+            if depth > skip_below:
+                continue
+            skip_below = None
+        if name.split('.')[0] in exempt:
+            skip_below = depth
+        elif name not in baseline:
+            counted[name] = self_us
+    return counted
+
+
+def measure(args: list, baseline: set, repeat: int, exempt: tuple = ()) -> tuple:
+    """Return the best of ``repeat`` runs: wall seconds, import ms and heaviest imports.
+
+    Modules the bare interpreter imports at startup (``baseline``) are
+    not counted, nor are the packages ``exempt`` and what they import.
+    """
+    best = None
+    for _ in range(repeat):
+        seconds, modules = import_times(args)
+        extra = counted_imports(modules, baseline, exempt)
+        import_ms = sum(extra.values()) / 1000
+        if best is None or import_ms < best[1]:
+            heaviest = sorted(extra.items(), key=lambda item: item[1], reverse=True)[:5]
+            best = (seconds, import_ms, heaviest)
+    return best
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Check the generators' startup import time.")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"allowed import time per scenario in ms (default: {DEFAULT_BUDGET_MS})")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help=f"runs per scenario, the fastest is kept (default: {DEFAULT_REPEAT})")
+    args = parser.parse_args()
+
+    # Byte-compile first so the first scenario is not charged for it
+    import_times(['-c', 'pass'])
+    baseline_seconds, baseline = import_times(['-c', 'pass'])
+    baseline = {name for name, _, _ in baseline}
+
+    print(f"{'='*72}")
+    print(f"{'Scenario':<28}{'Imports (ms)':>14}{'Wall (ms)':>12}  Status")
+    print(f"{'='*72}")
+    over = []
+    scenarios = [(name, script_args, ()) for name, script_args in SCENARIOS.items()]
+    scenarios += [(name, script_args, LAYOUT_PACKAGES) for name, script_args in DRY_RUN_SCENARIOS.items()]
+    for name, script_args, exempt in scenarios:
+        seconds, import_ms, heaviest = measure(script_args, baseline, args.repeat, exempt)
+        status = 'ok' if import_ms <= args.budget else 'OVER BUDGET'
+        print(f"{name:<28}{import_ms:>14.1f}{seconds * 1000:>12.0f}  {status}")
+        if import_ms > args.budget:
+            over.append((name, heaviest))
+    print(f"{'='*72}")
+    print(f"Budget: {args.budget:g} ms of imports per scenario "
+          f"(interpreter startup: {baseline_seconds * 1000:.0f} ms wall, not counted; "
+          f"--dry-run scenarios exclude {', '.join(LAYOUT_PACKAGES)})")
+
+    for name, heaviest in over:
+        print(f"\n{name}: heaviest imports")
+        for module, us in heaviest:
+            print(f"  {module:<40}{us / 1000:>8.1f} ms")
+    if over:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
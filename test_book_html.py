@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+HTML Renderer Tests
+Compares the lists book_html renders for the AI guide with those of the
+markdown package, which generate_pdf used before the shared parser, and
+checks that inline emphasis comes out as well-nested tags.
+Run with ``python -m pytest``.
+Published by ALAM-ACADEMY
+"""
+
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+
+import pytest
+
+from book_html import render_html
+from book_parser import parse_markdown
+
+
+GUIDE_PATH = Path(__file__).parent / 'AI_Comprehensive_Guide.md'
+
+# Guide sections holding numbered and nested lists
+LIST_SECTIONS = ['Definition and Scope', 'Chapter 1 Exercises', 'Chapter 2 Exercises']
+
+
+class ListTree(HTMLParser):
+    """Collect the lists of an HTML fragment as ``(tag, start, [(text, [nested lists])])``."""
+
+    def __init__(self):
+        super().__init__()
+        self.lists = []
+        self._open = []    # (list, items) per open <ul>/<ol>
+        self._item = None  # [text parts, nested lists] of the innermost <li>
+        self._items = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('ul', 'ol'):
+            start = int(dict(attrs).get('start', 1)) if tag == 'ol' else None
+            node = (tag, start, [])
+            (self._item[1] if self._item else self.lists).append(node)
+            self._open.append(node)
+        elif tag == 'li':
+            self._item = [[], []]
+            self._items.append(self._item)
+            self._open[-1][2].append(self._item)
+
+    def handle_endtag(self, tag):
+        if tag in ('ul', 'ol'):
+            self._open.pop()
+        elif tag == 'li':
+            self._items.pop()
+            self._item = self._items[-1] if self._items else None
+
+    def handle_data(self, data):
+        if self._item is not None:
+            self._item[0].append(data)
+
+
+def list_tree(html: str) -> list:
+    parser = ListTree()
+    parser.feed(html)
+
+    def normalise(node):
+        tag, start, items = node
+        return tag, start, [(' '.join(''.join(text).split()), [normalise(child) for child in nested])
+                            for text, nested in items]
+
+    return [normalise(node) for node in parser.lists]
+
+
+def guide_section(title: str) -> str:
+    """Return the guide's markdown from the heading ``title`` to the next heading."""
+    text = GUIDE_PATH.read_text(encoding='utf-8')
+    match = re.search(rf'^#+ {re.escape(title)}\n(.*?)(?=^#+ |\Z)', text, re.MULTILINE | re.DOTALL)
+    assert match, title
+    return match.group(0)
+
+
+@pytest.mark.parametrize('title', LIST_SECTIONS)
+def test_lists_match_markdown_package(title):
+    markdown = pytest.importorskip('markdown')
+    source = guide_section(title)
+    # The markdown package only nests items indented by four spaces
+    reference = markdown.markdown(re.sub(r'^ {2,3}- ', '    - ', source, flags=re.MULTILINE))
+    rendered = render_html(parse_markdown(source))
+    assert list_tree(reference)
+    assert list_tree(rendered) == list_tree(reference)
+
+
+def test_nested_list_is_nested():
+    html = render_html(parse_markdown("- outer\n  - inner\n- next"))
+    assert html == "<ul><li>outer<ul><li>inner</li></ul></li><li>next</li></ul>"
+
+
+def test_title_page_heading_is_kept():
+    html = render_html(parse_markdown("## Title Page\n\ntext"))
+    assert html.startswith('<h2 id="title-page">Title Page</h2>')
+
+
+@pytest.mark.parametrize('source, html', [
+    ("***very***", "<p><strong><em>very</em></strong></p>"),
+    ("**a *b** c*", "<p><strong>a *b</strong> c*</p>"),
+])
+def test_emphasis_tags_nest(source, html):
+    assert render_html(parse_markdown(source)) == html
+
+
+def test_bold_italic_paragraph_builds():
+    pytest.importorskip('reportlab')
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph
+
+    from inline_markdown import to_reportlab
+
+    markup = to_reportlab("a ***very*** **bold *and* italic** word")
+    assert markup == "a <b><i>very</i></b> <b>bold <i>and</i> italic</b> word"
+    Paragraph(markup, getSampleStyleSheet()['Normal']).wrap(300, 300)
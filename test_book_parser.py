@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Markdown Parser Tests
+Checks book_parser.parse_markdown against the paragraph loop it replaced
+(benchmark_parser.legacy_parse_markdown), and that only the guide's
+front matter is dropped from a document. Run with ``python -m pytest``.
+Published by ALAM-ACADEMY
+"""
+
+import pytest
+
+import book_nodes
+from benchmark_parser import legacy_parse_markdown
+from book_parser import body_nodes, load_document, parse_markdown
+
+
+# Lines starting with a markdown marker character that are still prose
+CONTINUATION_CASES = [
+    "Para one\n*italic continuation*\nmore",
+    "Para\n-5 degrees",
+    "Para\n`code` here",
+]
+
+
+@pytest.mark.parametrize('source', CONTINUATION_CASES)
+def test_marker_text_continues_paragraph(source):
+    nodes = list(parse_markdown(source))
+    assert nodes == list(legacy_parse_markdown(source.splitlines()))
+    assert len(nodes) == 1
+    assert isinstance(nodes[0], book_nodes.Paragraph)
+
+
+def test_marker_blocks_close_paragraph():
+    nodes = list(parse_markdown("Para\n- item\n## Heading\n**Bold**"))
+    assert nodes == [
+        book_nodes.Paragraph('Para'),
+        book_nodes.ListBlock(['item']),
+        book_nodes.Heading(2, 'Heading'),
+        book_nodes.Paragraph('Bold', book_nodes.BOLD),
+    ]
+
+
+def test_front_matter_ends_at_part_marker():
+    nodes = body_nodes(parse_markdown("## PREFACE\ntext\n# PART I: FOUNDATIONS\n## CHAPTER 1"))
+    assert nodes[0] == book_nodes.Heading(1, 'PART I: FOUNDATIONS')
+    assert len(nodes) == 2
+
+
+def test_part_prefix_is_not_a_part_marker():
+    source = "# Intro\nIntro text\n# PARTICLE PHYSICS\nMore text"
+    assert body_nodes(parse_markdown(source)) == list(parse_markdown(source))
+
+
+def test_chapter_files_keep_their_opening(tmp_path):
+    first = tmp_path / 'chapter_1.md'
+    second = tmp_path / 'chapter_2.md'
+    first.write_text("# Intro\nIntro text\n", encoding='utf-8')
+    second.write_text("# PART II: METHODS\nBody text\n", encoding='utf-8')
+    nodes = load_document([first, second], cache_dir=None, jobs=1)
+    assert nodes[0] == book_nodes.Heading(1, 'Intro')
+    assert len(nodes) == 4
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Example Verifier
+Runs the Python examples printed in the IT book (generate_book.py), each
+in its own interpreter with a timeout, and checks what they print
+against the output the book shows for them. Results are cached by the
+hash of the program, so only new or edited examples run again.
+Published by ALAM-ACADEMY
+"""
+
+import argparse
+import ast
+import json
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from disk_cache import DiskLRUCache, content_key
+
+
+BASE_PATH = Path(__file__).parent
+
+# Captured example output is cached here.
+EXAMPLE_CACHE_DIR = BASE_PATH / '.example_cache'
+EXAMPLE_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+DEFAULT_TIMEOUT = 5.0
+
+# "print(x)  # Output: 8" states the expected output inline; so does a
+# bare comment after a print call, as in 'print(f"Sum: {a + b}")  # 25'
+INLINE_OUTPUT_RE = re.compile(r'#\s*Output:\s*(.*)$')
+PRINT_VALUE_RE = re.compile(r'^\s*print\(.*\)\s*#\s*(.+)$')
+
+
+class Example:
+    """One runnable code listing and the output the book prints for it.
+
+    ``setup`` holds the earlier listings of the same section that this
+    one builds on (a function defined in one listing and called in the
+    next); it runs first, and only what the listing itself prints is
+    checked. ``expected`` is None when the book shows no output. Output
+    stated in comments (``inline``) often gives only the value each
+    print shows, so each printed line need only end with it.
+    """
+
+    def __init__(self, chapter: str, section: str, code: str, setup: str = '', expected=None,
+                 inline: bool = False):
+        self.chapter = chapter
+        self.section = section
+        self.code = code
+        self.setup = setup
+        self.expected = expected
+        self.inline = inline
+
+    @property
+    def program(self) -> str:
+        return f"{self.setup}\n{self.code}" if self.setup else self.code
+
+    @property
+    def title(self) -> str:
+        first_line = self.code.strip().splitlines()[0]
+        return f"{self.section}: {first_line}"
+
+
+def runnable(code: str) -> bool:
+    """True if ``code`` is a non-interactive Python program worth running.
+
+    Listings that do not parse (wrong-syntax examples, JavaScript, shell)
+    are not programs; neither is one that only evaluates bare names,
+    like "df -h". Listings that read input() would wait for a user.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return False
+    calls = [node for node in ast.walk(tree) if isinstance(node, ast.Call)]
+    if any(isinstance(call.func, ast.Name) and call.func.id == 'input' for call in calls):
+        return False
+    return bool(calls) or any(isinstance(node, (ast.Assign, ast.FunctionDef, ast.ClassDef))
+                              for node in ast.walk(tree))
+
+
+def _root_name(node):
+    while isinstance(node, (ast.Attribute, ast.Subscript)):
+        node = node.value
+    return node.id if isinstance(node, ast.Name) else None
+
+
+def state_change(text: str, names: set) -> bool:
+    """True if list item ``text`` is one statement changing a variable in ``names``.
+
+    Steps such as "students.append("Zain")" or "students[1] = "Hassan""
+    are written as list items between two listings; the second listing's
+    output depends on them.
+    """
+    try:
+        body = ast.parse(text).body
+    except SyntaxError:
+        return False
+    if len(body) != 1:
+        return False
+    statement = body[0]
+    if isinstance(statement, ast.Assign):
+        targets = statement.targets
+        return all(isinstance(target, (ast.Attribute, ast.Subscript)) and _root_name(target) in names
+                   for target in targets)
+    return (isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Call)
+            and isinstance(statement.value.func, ast.Attribute)
+            and _root_name(statement.value.func) in names)
+
+
+def assigned_names(code: str) -> set:
+    """Return the variable names ``code`` assigns to."""
+    return {node.id for node in ast.walk(ast.parse(code))
+            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store)}
+
+
+def inline_output(code: str):
+    """Return the output stated in comments, one line per comment, or None if there are none.
+
+    Both "# Output: 8" and a bare comment closing a print call line count.
+    """
+    lines = []
+    for line in code.splitlines():
+        match = INLINE_OUTPUT_RE.search(line) or PRINT_VALUE_RE.match(line)
+        if match:
+            lines.append(match.group(1).strip())
+    return '\n'.join(lines) if lines else None
+
+
+def extract_examples(chapters=None) -> tuple:
+    """Return ``(examples, skipped)`` for the chapters of generate_book.
+
+    A listing's expected output is the printed output block that follows
+    it before the next listing, or else the output its comments state. List
+    items that change a variable of an earlier listing (see
+    state_change) are added to the setup of the listings after them.
+    ``skipped`` counts the listings that are not runnable Python.
+    """
+    import book_nodes
+    from generate_book import chapter_nodes, get_book_content
+
+    examples = []
+    skipped = 0
+    for chapter in chapters or get_book_content():
+        section = chapter['title']
+        setup = []
+        current = None
+        for node in chapter_nodes(chapter):
+            if isinstance(node, book_nodes.Heading):
+                section = node.text
+                setup = []
+                current = None
+            elif isinstance(node, book_nodes.CodeBlock) and node.language == 'text':
+                if current is not None and current.expected is None:
+                    current.expected = node.text
+                current = None
+            elif isinstance(node, book_nodes.CodeBlock):
+                if not runnable(node.text):
+                    skipped += 1
+                    current = None
+                    continue
+                current = Example(chapter['title'], section, node.text, '\n'.join(setup))
+                examples.append(current)
+                setup.append(node.text)
+            elif isinstance(node, book_nodes.ListBlock) and setup:
+                names = assigned_names('\n'.join(setup))
+                setup.extend(item for item in node.items if state_change(item, names))
+    for example in examples:
+        if example.expected is None:
+            example.expected = inline_output(example.code)
+            example.inline = example.expected is not None
+    return examples, skipped
+
+
+def run_program(program: str, timeout: float) -> dict:
+    """Run ``program`` in a fresh isolated interpreter and capture what it prints."""
+    try:
+        result = subprocess.run([sys.executable, '-I', '-S', '-c', program], stdin=subprocess.DEVNULL,
+                                capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {'returncode': None, 'stdout': '', 'stderr': f"timed out after {timeout:g}s"}
+    return {'returncode': result.returncode, 'stdout': result.stdout, 'stderr': result.stderr}
+
+
+def cached_run(cache, program: str, timeout: float) -> dict:
+    """Return ``run_program``'s result, from ``cache`` if the program ran before.
+
+    Timeouts are not cached, so a slow machine does not pin a failure.
+    """
+    if cache is None:
+        return run_program(program, timeout)
+    key = content_key(sys.version, program)
+    data = cache.get(key)
+    if data is not None:
+        return json.loads(data)
+    result = run_program(program, timeout)
+    if result['returncode'] is not None:
+        cache.put(key, json.dumps(result).encode('utf-8'))
+    return result
+
+
+def _normalise(text: str) -> str:
+    return '\n'.join(line.rstrip() for line in text.strip().splitlines())
+
+
+def output_matches(example: Example, output: str) -> bool:
+    """True if ``output`` is what the book shows for ``example``.
+
+    An output block must match exactly; a value stated in a comment must
+    end its printed line, so "# 25" matches "Addition: 25".
+    """
+    if not example.inline:
+        return _normalise(output) == _normalise(example.expected)
+    printed = _normalise(output).splitlines()
+    stated = example.expected.splitlines()
+    return len(printed) == len(stated) and all(line == value or line.endswith(' ' + value)
+                                               for line, value in zip(printed, stated))
+
+
+def verify_example(example: Example, timeout: float, cache) -> tuple:
+    """Run one example; return ``(status, output)``.
+
+    ``output`` is what the listing printed, or the error it stopped with.
+    A listing that prints something the book does not show is unverified.
+    """
+    result = cached_run(cache, example.program, timeout)
+    if result['returncode'] is None:
+        return 'timeout', result['stderr']
+    if result['returncode'] != 0:
+        error = result['stderr'].strip().splitlines()
+        return 'error', error[-1] if error else f"exit status {result['returncode']}"
+    output = result['stdout']
+    if example.setup:
+        setup_output = cached_run(cache, example.setup, timeout)['stdout']
+        if output.startswith(setup_output):
+            output = output[len(setup_output):]
+    if example.expected is None:
+        return ('unverified' if output.strip() else 'ok'), output
+    if output_matches(example, output):
+        return 'ok', output
+    return 'mismatch', output
+
+
+def verify_all(examples: list, jobs=None, timeout: float = DEFAULT_TIMEOUT, cache=None) -> list:
+    """Verify ``examples`` in a pool of ``jobs`` workers; results keep their order.
+
+    Each worker mostly waits on a child interpreter, so threads are
+    enough to keep the CPUs busy.
+    """
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(lambda example: verify_example(example, timeout, cache), examples))
+
+
+def print_report(examples: list, results: list, show: bool):
+    """Print every example that failed or could not be checked, or all of them with ``show``.
+
+    Examples that print output the book does not show are listed as
+    unverified; with ``show``, that output is printed too, ready to paste
+    into the book.
+    """
+    for example, (status, output) in zip(examples, results):
+        if status == 'ok' and not show:
+            continue
+        print(f"\n[{status}] {example.chapter}")
+        print(f"  {example.title}")
+        if status == 'unverified' and not show:
+            continue
+        if status == 'mismatch':
+            print("  Book shows:")
+            print('\n'.join(f"    {line}" for line in example.expected.strip().splitlines()))
+            print("  Program prints:")
+        if output.strip():
+            print('\n'.join(f"    {line}" for line in output.rstrip().splitlines()))
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Run the IT book's Python examples and check their output.")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="examples run at once (default: Python's thread pool default)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f"seconds each example may run (default: {DEFAULT_TIMEOUT:g})")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="run every example even if its output is cached")
+    parser.add_argument('--show', action='store_true',
+                        help="print the output of every example, including those the book shows none for")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    examples, skipped = extract_examples()
+    cache = None if args.no_cache else DiskLRUCache(EXAMPLE_CACHE_DIR, EXAMPLE_CACHE_MAX_BYTES, suffix='.json')
+    results = verify_all(examples, args.jobs, args.timeout, cache)
+    print_report(examples, results, args.show)
+
+    counts = {}
+    for status, _ in results:
+        counts[status] = counts.get(status, 0) + 1
+    print(f"\n{'='*64}")
+    print(f"Examples run: {len(examples)} ({skipped} listings are not runnable Python)")
+    for status, count in sorted(counts.items()):
+        print(f"  {status:<20}{count:>6}")
+    print(f"{'='*64}")
+    print(f"Total wall time: {time.perf_counter() - start:.2f}s")
+    if any(status in ('mismatch', 'error', 'timeout') for status, _ in results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()